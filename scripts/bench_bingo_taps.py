@@ -0,0 +1,98 @@
+"""Benchmark bingo taps per second through the real callback handler.
+
+Runs ``bingo_callback`` against a throwaway SQLite database with a fake bot
+that only counts edits, so the numbers cover the handler's own work (the
+combined read, the event insert and score upsert, keyboard rendering and
+edit debouncing), not Telegram round trips:
+
+    PYTHONPATH=src python scripts/bench_bingo_taps.py --players 200 --taps 5000
+
+Every other tap is a quick double tap on the same cell (tick + untick) to
+show rapid taps collapsing into one edit or none. Needs the bot's
+environment variables (the config is loaded on import); DB_URL is replaced.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+os.environ["DB_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='bingo_bench_')}/bench.db"
+
+from f1bot.storage.db import init_db  # noqa: E402
+from f1bot.storage.repositories import BingoRepo, RaceRepo  # noqa: E402
+from f1bot.bot.edit_queue import tap_edits  # noqa: E402
+from f1bot.bot.handlers.bingo import bingo_callback  # noqa: E402
+
+POOL = [{"id": f"event_{i}", "title": f"Event {i}", "type": "hard"} for i in range(18)]
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.edits = 0
+        self.messages = 0
+
+    async def edit_message_text(self, *args, **kwargs) -> None:
+        self.edits += 1
+
+    async def send_message(self, *args, **kwargs) -> None:
+        self.messages += 1
+
+
+def make_update(bot: FakeBot, user_id: int, cell_id: str) -> SimpleNamespace:
+    async def answer(*args, **kwargs) -> None:
+        pass
+
+    async def reply_text(*args, **kwargs) -> None:
+        bot.messages += 1
+
+    message = SimpleNamespace(chat_id=user_id, message_id=1, reply_text=reply_text)
+    query = SimpleNamespace(data=f"bingo:toggle:{cell_id}", answer=answer, message=message)
+    user = SimpleNamespace(id=user_id, first_name=f"Player {user_id}")
+    return SimpleNamespace(callback_query=query, effective_user=user)
+
+
+async def run(players: int, taps: int) -> None:
+    bot = FakeBot()
+    context = SimpleNamespace(bot=bot)
+    started = time.perf_counter()
+    for i in range(taps):
+        user_id = 1000 + i % players
+        cell_id = POOL[(i // players) % len(POOL)]["id"]
+        await bingo_callback(make_update(bot, user_id, cell_id), context)
+        if i % 2:
+            # Quick double tap: untick the same cell right away
+            await bingo_callback(make_update(bot, user_id, cell_id), context)
+        # Let scheduled edits run, as the real event loop would between updates
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    total = taps + taps // 2
+    print(f"{total} taps by {players} players in {elapsed:.2f} s: {total / elapsed:,.0f} taps/s, "
+          f"{elapsed / total * 1000:.2f} ms/tap")
+
+    # Let trailing edits go out
+    await asyncio.sleep(tap_edits.delay + 0.1)
+    stats = tap_edits.stats
+    print(f"edits sent {bot.edits} for {stats['submitted']} card updates "
+          f"(coalesced {stats['coalesced']}, skipped unchanged {stats['unchanged']}), "
+          f"celebrations {bot.messages}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--taps", type=int, default=5000)
+    args = parser.parse_args()
+
+    init_db()
+    race_id = "bench_gp"
+    RaceRepo().upsert(race_id, "Bench Grand Prix", datetime.now(timezone.utc) + timedelta(hours=1), "upcoming")
+    BingoRepo().save_template(race_id, "ru", POOL)
+    asyncio.run(run(args.players, args.taps))
+
+
+if __name__ == "__main__":
+    main()
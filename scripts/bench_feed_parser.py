@@ -0,0 +1,89 @@
+"""Benchmark the streaming feed parser against the old regex parser.
+
+Generates a large synthetic RSS feed and measures parse time and peak
+memory for the first ``--limit`` items and for the whole feed:
+
+    PYTHONPATH=src python scripts/bench_feed_parser.py --items 50000 --limit 50
+
+Needs the bot's environment variables (the config is loaded on import).
+"""
+
+import argparse
+import re
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from f1bot.services.feed_parser import parse_feed
+
+CHUNK_SIZE = 64 * 1024
+
+
+def make_feed(items: int) -> bytes:
+    """RSS document with a channel title/link (which the regex parser mispairs)."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>Bench Feed</title><link>https://example.com/</link>"
+    ]
+    for i in range(items):
+        parts.append(
+            f"<item><title>Verstappen leads practice session {i}</title>"
+            f"<link>https://example.com/news/{i}</link>"
+            f"<description>&lt;p&gt;Summary of story {i} with some &amp;amp; markup.&lt;/p&gt;</description>"
+            f"<pubDate>Sun, 19 Oct 2025 10:{i % 60:02d}:00 +0000</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode()
+
+
+def regex_parse(body: bytes, limit: int) -> List[Dict[str, str]]:
+    """The previous implementation: findall over the whole decoded text."""
+    xml_content = body.decode("utf-8")
+    titles = re.findall(r"<title>(.*?)</title>", xml_content, re.DOTALL)
+    links = re.findall(r"<link>(.*?)</link>", xml_content, re.DOTALL)
+    return [
+        {"title": re.sub(r"<[^>]+>", "", title).strip(), "url": links[i].strip()}
+        for i, title in enumerate(titles[:limit])
+        if i < len(links)
+    ]
+
+
+def stream_parse(body: bytes, limit: int) -> List[Dict[str, str]]:
+    chunks = (body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+    return parse_feed(chunks, limit)
+
+
+def measure(fn: Callable[[bytes, int], List], body: bytes, limit: int, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(body, limit)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn(body, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=50000, help="items in the generated feed")
+    parser.add_argument("--limit", type=int, default=50, help="items to collect in the limited run")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = make_feed(args.items)
+    print(f"Feed: {args.items} items, {len(body) / 1024 / 1024:.1f} MiB")
+
+    for limit in (args.limit, args.items):
+        for name, fn in (("regex", regex_parse), ("stream", stream_parse)):
+            result, best, peak = measure(fn, body, limit, args.repeat)
+            print(
+                f"limit={limit:>7} {name:>6}: {best * 1000:8.1f} ms, peak {peak / 1024 / 1024:6.1f} MiB, "
+                f"{len(result)} items, first url {result[0]['url'] if result else '-'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the single-pass ICS parser on multi-season calendars.
+
+Generates calendars with folded lines and TZID start times, then checks that
+parse time per event stays flat as the calendar grows (linear scaling) and
+compares against the previous regex-per-VEVENT path (which also returns
+wrong names and start times for folded and TZID events):
+
+    PYTHONPATH=src python scripts/bench_ics_parser.py --seasons 1 10 50
+
+Needs the bot's environment variables (the config is loaded on import).
+"""
+
+import argparse
+import io
+import re
+import time
+from typing import Callable, List
+
+from f1bot.services.calendar import _iter_ics_races, _normalize_race
+
+ZONES = ["Europe/Monaco", "Europe/London", "America/Sao_Paulo", "Asia/Tokyo", "Australia/Melbourne"]
+SESSIONS = ["Practice 1", "Practice 2", "Practice 3", "Qualifying", "Race"]
+
+
+def make_calendar(seasons: int) -> str:
+    """ICS text with 24 rounds x 5 sessions per season."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//bench//EN"]
+    for season in range(seasons):
+        year = 2000 + season
+        for rnd in range(24):
+            for s, session in enumerate(SESSIONS):
+                day = 1 + (rnd % 28)
+                lines += [
+                    "BEGIN:VEVENT",
+                    f"UID:{year}-{rnd}-{s}@bench",
+                    # Long summaries are folded at 75 octets as RFC 5545 requires
+                    f"SUMMARY:FORMULA 1 BENCHMARK GRAND PRIX ROUND {rnd + 1} OF THE {year} WORLD CHAMPI",
+                    f" ONSHIP - {session.upper()}",
+                    f"LOCATION:Circuit {rnd}\\, City {rnd}\\, Country {rnd}",
+                    f"DTSTART;TZID={ZONES[rnd % len(ZONES)]}:{year}{(rnd % 12) + 1:02d}{day:02d}T{10 + s:02d}0000",
+                    "BEGIN:VALARM",
+                    "TRIGGER:-PT30M",
+                    "END:VALARM",
+                    "END:VEVENT",
+                ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def regex_parse(ics_content: str) -> List[dict]:
+    """The previous path: regexes per VEVENT (no unfolding or TZID), then normalisation."""
+    races = []
+    for event in re.findall(r"BEGIN:VEVENT(.*?)END:VEVENT", ics_content, re.DOTALL):
+        race = {}
+        for key, pattern in (("start_time", r"DTSTART[^:]*:(.*)"), ("name", r"SUMMARY:(.*)"), ("location", r"LOCATION:(.*)")):
+            match = re.search(pattern, event)
+            if match:
+                race[key] = match.group(1).strip()
+        if race:
+            races.append(race)
+    return [race for race in map(_normalize_race, races) if race]
+
+
+def stream_parse(ics_content: str) -> List[dict]:
+    return list(_iter_ics_races(io.StringIO(ics_content)))
+
+
+def best_time(fn: Callable[[str], List], text: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for seasons in args.seasons:
+        text = make_calendar(seasons)
+        for name, fn in (("regex", regex_parse), ("single-pass", stream_parse)):
+            result, best = best_time(fn, text, args.repeat)
+            per_event = best / max(len(result), 1) * 1e6
+            print(
+                f"seasons={seasons:>3} {name:>11}: {len(result):>6} events, "
+                f"{best * 1000:8.1f} ms total, {per_event:6.2f} us/event"
+            )
+        sample = stream_parse(text)[-1]
+        print(f"  last event: {sample['race_id']} {sample['name']!r} {sample['start_time_utc'].isoformat()}")
+
+
+if __name__ == "__main__":
+    main()
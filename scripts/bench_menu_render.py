@@ -0,0 +1,82 @@
+"""Microbenchmark menu rendering: per-call keyboards vs the static registry.
+
+Compares the previous path (str.replace per placeholder, a chained
+``.format`` and a fresh ``InlineKeyboardMarkup`` on every call) with the
+compiled i18n catalog and the per-language keyboards from bot.keyboards:
+
+    PYTHONPATH=src python scripts/bench_menu_render.py --iterations 20000
+
+Needs the bot's environment variables (the config is loaded on import).
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from f1bot.bot.keyboards import keyboard
+from f1bot.services.i18n import LANGUAGES, TEMPLATES, t
+
+
+def old_t(key: str, lang: str = "ru", **kwargs) -> str:
+    """The previous lookup: raw strings, placeholders filled with str.replace."""
+    text = TEMPLATES.get(lang, TEMPLATES["ru"])[key].text
+    for k, v in kwargs.items():
+        text = text.replace(f"{{{k}}}", str(v))
+    return text
+
+
+def old_main_menu(lang: str):
+    text = old_t("menu.welcome", lang)
+    markup = InlineKeyboardMarkup([
+        [InlineKeyboardButton(old_t("menu.pre_race", lang), callback_data="menu:pre_race")],
+        [InlineKeyboardButton(old_t("menu.bingo", lang), callback_data="menu:bingo")],
+        [InlineKeyboardButton(old_t("menu.post_race", lang), callback_data="menu:post_race")],
+        [InlineKeyboardButton(old_t("menu.language", lang), callback_data="menu:language")],
+    ])
+    return text, markup
+
+
+def new_main_menu(lang: str):
+    return t("menu.welcome", lang), keyboard("main_menu", lang)
+
+
+def old_leaderboard(lang: str):
+    text = old_t("bingo.leaderboard_title", lang).format(race_name="Monaco Grand Prix")
+    markup = InlineKeyboardMarkup([
+        [InlineKeyboardButton(old_t("menu.bingo", lang), callback_data="bingo:show")],
+        [InlineKeyboardButton(old_t("menu.back", lang), callback_data="menu:main")],
+    ])
+    return text, markup
+
+
+def new_leaderboard(lang: str):
+    return t("bingo.leaderboard_title", lang, race_name="Monaco Grand Prix"), keyboard("leaderboard", lang)
+
+
+def per_call(fn: Callable[[str], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        fn(LANGUAGES[i % len(LANGUAGES)])
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    for lang in LANGUAGES:
+        assert old_main_menu(lang) == new_main_menu(lang), lang
+        assert old_leaderboard(lang) == new_leaderboard(lang), lang
+
+    print(f"languages: {', '.join(LANGUAGES)}")
+    for name, old, new in (("main menu", old_main_menu, new_main_menu), ("leaderboard", old_leaderboard, new_leaderboard)):
+        before = per_call(old, args.iterations)
+        after = per_call(new, args.iterations)
+        print(f"{name:>11}: per call {before:7.2f} us -> {after:5.2f} us ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Local OpenAI-compatible stub server with injectable delays and errors.
+
+Point the bot at it to exercise the LLM resilience layer:
+
+    python scripts/stub_openai_server.py --port 8089 --delay 0.2 --slow-rate 0.2 --slow-delay 10 --error-rate 0.3
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 python -m f1bot.main
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubConfig:
+    """Fault-injection knobs, adjustable at runtime via POST /_config."""
+
+    delay = 0.0
+    slow_rate = 0.0
+    slow_delay = 10.0
+    error_rate = 0.0
+    error_status = 500
+    hang_rate = 0.0
+    reply = "🏎️ Stub completion"
+
+
+stats = {"requests": 0, "errors": 0, "slow": 0, "hangs": 0}
+stats_lock = threading.Lock()
+
+
+def _count(key: str) -> None:
+    with stats_lock:
+        stats[key] += 1
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve /v1/chat/completions plus /_config and /_stats helpers."""
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from BaseHTTPRequestHandler
+        pass
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/_stats":
+            with stats_lock:
+                self._send_json(200, dict(stats))
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path == "/_config":
+            for key, value in payload.items():
+                if hasattr(StubConfig, key):
+                    setattr(StubConfig, key, value)
+            self._send_json(200, {"ok": True})
+            return
+
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        _count("requests")
+        roll = random.random()
+        if roll < StubConfig.hang_rate:
+            _count("hangs")
+            time.sleep(3600)
+            return
+        if roll < StubConfig.hang_rate + StubConfig.error_rate:
+            _count("errors")
+            self._send_json(StubConfig.error_status, {"error": {"message": "injected failure", "type": "server_error"}})
+            return
+
+        delay = StubConfig.delay
+        if random.random() < StubConfig.slow_rate:
+            _count("slow")
+            delay = StubConfig.slow_delay
+        time.sleep(delay)
+
+        prompt_tokens = sum(len(str(m.get("content", ""))) // 4 for m in payload.get("messages", []))
+        completion_tokens = len(StubConfig.reply) // 4 + 1
+        self._send_json(200, {
+            "id": f"chatcmpl-stub-{int(time.time() * 1000)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": StubConfig.reply},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--delay", type=float, default=0.0, help="base response delay, seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="share of requests delayed by --slow-delay")
+    parser.add_argument("--slow-delay", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="share of requests that never answer")
+    args = parser.parse_args()
+
+    StubConfig.delay = args.delay
+    StubConfig.slow_rate = args.slow_rate
+    StubConfig.slow_delay = args.slow_delay
+    StubConfig.error_rate = args.error_rate
+    StubConfig.error_status = args.error_status
+    StubConfig.hang_rate = args.hang_rate
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    server.daemon_threads = True
+    print(f"Stub OpenAI server on http://{args.host}:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,17 @@ async def error_handler(update: object, context: Exception) -> None:
 async def post_init(application: Application) -> None:
     """Called after application is initialized and event loop is running."""
     from f1bot.jobs.scheduler import start_scheduler
+    from f1bot.jobs.runner import monitor_loop_lag
+    from f1bot.bot.edit_queue import edit_queue
     await start_scheduler()
+    application.create_task(monitor_loop_lag())
+    application.create_task(edit_queue.run(application.bot))
+
+
+async def post_shutdown(application: Application) -> None:
+    """Called after the application has stopped; releases pooled connections."""
+    from f1bot.services.news import close_client
+    await close_client()
 
 
 def create_application() -> Application:
@@ -36,6 +46,7 @@ def create_application() -> Application:
         ApplicationBuilder()
         .token(settings.telegram_bot_token)
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .build()
     )
 
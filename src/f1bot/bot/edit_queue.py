@@ -0,0 +1,194 @@
+"""Message edit scheduling.
+
+Bulk updates (e.g. refreshed bingo cards after a verification) are submitted
+to ``EditQueue`` instead of being sent inline. A single worker drains the
+queue at a fixed rate below Telegram's global limit, honours ``RetryAfter``
+and coalesces repeated edits of the same message so only the latest is sent.
+
+Interactive edits (bingo taps) go through ``EditDebouncer``: the first edit
+of a message is sent at once, further taps within the debounce window
+collapse into one edit of the final state, and an edit that would leave the
+message as it is shown is skipped.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from telegram import Bot, InlineKeyboardMarkup
+from telegram.error import BadRequest, Forbidden, RetryAfter
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+MessageKey = Tuple[int, int]  # (chat_id, message_id)
+Payload = Tuple[str, Optional[InlineKeyboardMarkup]]
+
+# Messages whose last known content is remembered (for skipping unchanged edits)
+SHOWN_MAX = 10000
+
+
+class ShownMessages:
+    """Bounded LRU of the last content known to be shown in each message."""
+
+    def __init__(self, maxsize: int = SHOWN_MAX) -> None:
+        self.maxsize = maxsize
+        self._items: "OrderedDict[MessageKey, Payload]" = OrderedDict()
+
+    def get(self, key: MessageKey) -> Optional[Payload]:
+        return self._items.get(key)
+
+    def set(self, key: MessageKey, payload: Payload) -> None:
+        self._items[key] = payload
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+
+shown_messages = ShownMessages()
+
+
+class EditQueue:
+    """Coalescing, rate-limited edit_message_text queue."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self.interval = 1.0 / rate_per_second
+        self._order: Deque[MessageKey] = deque()
+        self._pending: Dict[MessageKey, Payload] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self.stats = {"submitted": 0, "coalesced": 0, "sent": 0, "failed": 0, "retry_after": 0}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, chat_id: int, message_id: int, text: str, reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+        """Queue an edit; a queued edit of the same message is replaced by this one."""
+        key = (chat_id, message_id)
+        self.stats["submitted"] += 1
+        if key in self._pending:
+            self.stats["coalesced"] += 1
+        else:
+            self._order.append(key)
+        self._pending[key] = (text, reply_markup)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self, bot: Bot) -> None:
+        """Worker loop; runs for the lifetime of the application."""
+        self._wakeup = asyncio.Event()
+        while True:
+            if not self._order:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            key = self._order.popleft()
+            payload = self._pending.pop(key, None)
+            if payload is None:
+                continue
+            await self._send(bot, key, *payload)
+            await asyncio.sleep(self.interval)
+
+    async def _send(self, bot: Bot, key: MessageKey, text: str, reply_markup: Optional[InlineKeyboardMarkup]) -> None:
+        chat_id, message_id = key
+        try:
+            await bot.edit_message_text(text, chat_id=chat_id, message_id=message_id, reply_markup=reply_markup)
+            shown_messages.set(key, (text, reply_markup))
+            self.stats["sent"] += 1
+        except RetryAfter as e:
+            self.stats["retry_after"] += 1
+            retry_after = e.retry_after.total_seconds() if hasattr(e.retry_after, "total_seconds") else float(e.retry_after)
+            logger.warning(f"Edit queue rate limited, pausing {retry_after:.0f}s ({len(self)} pending)")
+            # Put the edit back unless a newer one was queued meanwhile
+            if key not in self._pending:
+                self._pending[key] = (text, reply_markup)
+                self._order.appendleft(key)
+            await asyncio.sleep(retry_after)
+        except BadRequest as e:
+            if "not modified" not in str(e).lower():
+                self.stats["failed"] += 1
+                logger.debug(f"Edit of {chat_id}/{message_id} failed: {e}")
+        except Forbidden:
+            self.stats["failed"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"Edit of {chat_id}/{message_id} failed: {e}")
+
+
+class EditDebouncer:
+    """Leading-edge edit with a trailing edit of the final state per message."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._latest: Dict[MessageKey, Payload] = {}
+        self._active: Set[MessageKey] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {"submitted": 0, "coalesced": 0, "sent": 0, "unchanged": 0, "failed": 0, "retry_after": 0}
+
+    def remember(self, chat_id: int, message_id: int, text: str, reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+        """Record content sent outside the debouncer (e.g. the card as first shown)."""
+        shown_messages.set((chat_id, message_id), (text, reply_markup))
+
+    def submit(self, bot: Bot, chat_id: int, message_id: int, text: str, reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+        """Schedule an edit; sent now if the message is idle, else merged into the trailing edit."""
+        key = (chat_id, message_id)
+        self.stats["submitted"] += 1
+        self._latest[key] = (text, reply_markup)
+        if key in self._active:
+            self.stats["coalesced"] += 1
+            return
+        self._active.add(key)
+        task = asyncio.create_task(self._drain(bot, key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, bot: Bot, key: MessageKey) -> None:
+        try:
+            while key in self._latest:
+                payload = self._latest.pop(key)
+                if shown_messages.get(key) == payload:
+                    self.stats["unchanged"] += 1
+                    continue
+                await self._send(bot, key, payload)
+                await asyncio.sleep(self.delay)
+        finally:
+            self._active.discard(key)
+
+    async def _send(self, bot: Bot, key: MessageKey, payload: Payload) -> None:
+        chat_id, message_id = key
+        text, reply_markup = payload
+        try:
+            await bot.edit_message_text(text, chat_id=chat_id, message_id=message_id, reply_markup=reply_markup)
+            shown_messages.set(key, payload)
+            self.stats["sent"] += 1
+        except RetryAfter as e:
+            self.stats["retry_after"] += 1
+            retry_after = e.retry_after.total_seconds() if hasattr(e.retry_after, "total_seconds") else float(e.retry_after)
+            # Retry this state after the pause unless a newer tap replaced it
+            self._latest.setdefault(key, payload)
+            await asyncio.sleep(retry_after)
+        except BadRequest as e:
+            if "not modified" in str(e).lower():
+                shown_messages.set(key, payload)
+            else:
+                self.stats["failed"] += 1
+                logger.debug(f"Edit of {chat_id}/{message_id} failed: {e}")
+        except Forbidden:
+            self.stats["failed"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"Edit of {chat_id}/{message_id} failed: {e}")
+
+
+# Global instances
+edit_queue = EditQueue(settings.edit_queue_rate_per_second)
+tap_edits = EditDebouncer(settings.bingo_edit_debounce_seconds)
+
+
+def format_edit_stats() -> str:
+    """Render edit queue and tap debouncer counters for admins."""
+    queue_stats = ", ".join(f"{k} {v}" for k, v in edit_queue.stats.items())
+    tap_stats = ", ".join(f"{k} {v}" for k, v in tap_edits.stats.items())
+    return f"✏️ Message edits\n\nqueue ({len(edit_queue)} pending): {queue_stats}\ntaps: {tap_stats}"
@@ -0,0 +1,141 @@
+"""Per-user flood control.
+
+Runs before every handler (``TypeHandler`` in group -1) and gives each user a
+token bucket of ``FLOOD_BURST`` updates refilled at ``FLOOD_RATE_PER_SECOND``.
+An update that finds the bucket empty never reaches the handlers
+(``ApplicationHandlerStop``), so a user or script spamming buttons costs no
+database work. Throttled updates are counted as "repeated" (the same button
+as the user's last handled callback, e.g. a double tap) or "dropped"
+(anything else); either way they are discarded, not applied later. Every
+throttled callback is still answered so the client's spinner stops: the
+first of a burst with a short "slow down" toast, the rest silently.
+
+A bucket untouched for ``burst / rate`` seconds is full again, i.e. no
+different from a new one, so idle buckets are expired and the table stays
+bounded by the number of recently active users (hard cap
+``FLOOD_MAX_BUCKETS``).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from telegram import Update
+from telegram.ext import Application, ApplicationHandlerStop, ContextTypes, TypeHandler
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+from f1bot.services.i18n import t
+
+logger = get_logger(__name__)
+
+
+class Bucket:
+    """Tokens left for one user, as of ``stamp``."""
+
+    __slots__ = ("tokens", "stamp", "last_data", "notified")
+
+    def __init__(self, tokens: float, stamp: float) -> None:
+        self.tokens = tokens
+        self.stamp = stamp
+        self.last_data: Optional[str] = None
+        self.notified = False
+
+
+class FloodControl:
+    """Token buckets per user id, least recently active first."""
+
+    def __init__(self, rate: float, burst: int, max_buckets: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_buckets = max_buckets
+        # After this long without updates a bucket is full again
+        self.idle_seconds = burst / rate
+        self._buckets: "OrderedDict[int, Bucket]" = OrderedDict()
+        self.stats = {"allowed": 0, "repeated": 0, "dropped": 0, "expired": 0}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _expire(self, now: float) -> None:
+        """Drop buckets that have refilled completely (oldest first), then enforce the cap."""
+        buckets = self._buckets
+        while buckets:
+            bucket = next(iter(buckets.values()))
+            if now - bucket.stamp < self.idle_seconds and len(buckets) <= self.max_buckets:
+                break
+            buckets.popitem(last=False)
+            self.stats["expired"] += 1
+
+    def take(self, user_id: int, data: Optional[str] = None, now: Optional[float] = None) -> Optional[str]:
+        """Spend a token for the user's update.
+
+        Returns None if the update may proceed, otherwise "repeated" or "dropped".
+        """
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = Bucket(float(self.burst), now)
+            self._buckets[user_id] = bucket
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.stamp) * self.rate)
+            bucket.stamp = now
+            self._buckets.move_to_end(user_id)
+        self._expire(now)
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.last_data = data
+            bucket.notified = False
+            self.stats["allowed"] += 1
+            return None
+
+        verdict = "repeated" if data is not None and data == bucket.last_data else "dropped"
+        self.stats[verdict] += 1
+        return verdict
+
+    def should_notify(self, user_id: int) -> bool:
+        """True once per throttled burst (for the "slow down" toast)."""
+        bucket = self._buckets.get(user_id)
+        if bucket is None or bucket.notified:
+            return False
+        bucket.notified = True
+        return True
+
+
+async def flood_guard(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Stop updates from users who ran out of tokens before any handler sees them."""
+    user = update.effective_user
+    if user is None or user.id in settings.admin_ids:
+        return
+
+    query = update.callback_query
+    verdict = flood_control.take(user.id, query.data if query else None)
+    if verdict is None:
+        return
+
+    if query:
+        # Language from the Telegram client: no database lookup for throttled updates
+        notice = t("flood.slow_down", user.language_code or "ru") if flood_control.should_notify(user.id) else None
+        try:
+            await query.answer(notice)
+        except Exception as e:
+            logger.debug(f"Could not answer throttled callback: {e}")
+    logger.debug(f"Flood control: {verdict} update from {user.id}")
+    raise ApplicationHandlerStop
+
+
+# Global flood control instance
+flood_control = FloodControl(settings.flood_rate_per_second, settings.flood_burst, settings.flood_max_buckets)
+
+
+def format_flood_stats() -> str:
+    """Render flood control counters for admins."""
+    stats = ", ".join(f"{k} {v}" for k, v in flood_control.stats.items())
+    return f"🚦 Flood control ({len(flood_control)} active users): {stats}"
+
+
+def register_flood_control(application: Application) -> None:
+    """Register the flood guard ahead of all other handlers."""
+    application.add_handler(TypeHandler(Update, flood_guard), group=-1)
+
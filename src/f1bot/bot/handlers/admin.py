@@ -1,11 +1,13 @@
 """Admin handlers."""
 
+from typing import Dict
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
 
 from f1bot.config import settings
 from f1bot.logging import get_logger
-from f1bot.storage.repositories import ContentRepo, UserRepo
+from f1bot.storage.repositories import ContentRepo, UserRepo, LlmCallRepo
 from f1bot.storage.db import get_db
 from sqlalchemy import text
 
@@ -30,6 +32,12 @@ async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         [InlineKeyboardButton("📋 Pending Pre-Race", callback_data="admin:list:pre_race")],
         [InlineKeyboardButton("🏁 Pending Post-Race", callback_data="admin:list:post_race")],
         [InlineKeyboardButton("🔄 Generate Post-Race", callback_data="admin:generate:post_race")],
+        [InlineKeyboardButton("🏁 Finish Current Race", callback_data="admin:finish")],
+        [InlineKeyboardButton("🌟 Verify Bingo Cell", callback_data="admin:bingo_verify")],
+        [InlineKeyboardButton("📈 Bingo Analytics", callback_data="admin:bingo_stats")],
+        [InlineKeyboardButton("🗓 Sync Calendar", callback_data="admin:calendar_sync")],
+        [InlineKeyboardButton("📊 LLM Usage", callback_data="admin:llmstats")],
+        [InlineKeyboardButton("⚙️ Job Stats", callback_data="admin:jobstats")],
     ])
     
     await update.message.reply_text("Админ-панель:", reply_markup=keyboard)
@@ -53,6 +61,13 @@ async def admin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         race_id = parts[3]
         lang = parts[4]
         
+        if content_type == "pre_race":
+            # Pre-race content goes out at its scheduled moment (or now, if approval is late)
+            from f1bot.jobs.publish import approve_scheduled_content
+            status_text = await approve_scheduled_content(race_id, content_type, lang)
+            await query.edit_message_text(status_text)
+            return
+        
         content_repo = ContentRepo()
         content_repo.approve(race_id, content_type, lang)
         content_repo.publish(race_id, content_type, lang)
@@ -78,6 +93,8 @@ async def admin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             db.commit()
         finally:
             db.close()
+        from f1bot.services.response_cache import response_cache
+        response_cache.invalidate(race_id, content_type, lang)
         
         await query.edit_message_text("❌ Content cancelled")
         
@@ -92,6 +109,178 @@ async def admin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             await post_race_job()
             await query.edit_message_text("🔄 Post-race generation triggered")
 
+    elif action == "finish":
+        # Manual results source: the race is over, run the finish transition now
+        from f1bot.storage.repositories import RaceRepo
+        from f1bot.services.race_lifecycle import finish_races
+        race = RaceRepo().get_current_race()
+        if not race or race["status"] != "in_progress":
+            await query.edit_message_text("No race in progress")
+            return
+        finish_races([race["race_id"]])
+        await query.edit_message_text(f"🏁 {race['name']} marked finished, post-race generation scheduled")
+
+    elif action == "calendar_sync":
+        from f1bot.jobs.calendar_sync import calendar_sync_job, format_report
+        report = await calendar_sync_job()
+        await query.edit_message_text(f"🗓 Calendar synced: {format_report(report)}")
+
+    elif action == "bingo_verify":
+        await show_verifiable_cells(update)
+
+    elif action == "bingo_stats":
+        await send_bingo_report(query.message)
+
+    elif action == "verify":
+        # admin:verify:<cell_id> (the race is the current one; race ids can be too long for callback data)
+        from f1bot.storage.repositories import RaceRepo
+        from f1bot.bot.handlers.bingo import verify_bingo_cell
+        cell_id = ":".join(parts[2:])
+        race = RaceRepo().get_current_race()
+        if not race:
+            await query.edit_message_text("No current race")
+            return
+        verified, pushed = await verify_bingo_cell(race, cell_id, user_id)
+        await query.edit_message_text(
+            f"🌟 {cell_id} verified for {verified} players of {race['name']}, refreshing {pushed} cards"
+        )
+
+    elif action == "llmstats":
+        await query.edit_message_text(format_llm_usage())
+
+    elif action == "jobstats":
+        await query.edit_message_text(format_job_stats())
+
+
+async def show_verifiable_cells(update: Update) -> None:
+    """List the current race's bingo cells for verification (every language's pool)."""
+    from f1bot.storage.repositories import RaceRepo, BingoRepo
+    from f1bot.services.i18n import LANGUAGES
+    query = update.callback_query
+    race = RaceRepo().get_current_race()
+    if not race:
+        await query.edit_message_text("No current race")
+        return
+    
+    bingo_repo = BingoRepo()
+    # Hard events share ids across languages and are listed once; meme events are per language
+    cells: Dict[str, str] = {}
+    for lang in LANGUAGES:
+        for cell in bingo_repo.get_template(race["race_id"], lang) or []:
+            if cell["id"] not in cells:
+                label = cell["title"] if cell.get("type") == "hard" else f"[{lang}] {cell['title']}"
+                cells[cell["id"]] = label
+    if not cells:
+        await query.edit_message_text(f"No bingo card for {race['name']} yet")
+        return
+    
+    verified = bingo_repo.get_verified_cells(race["race_id"])
+    keyboard = [
+        [InlineKeyboardButton(
+            f"{'🌟' if cell_id in verified else '⬜'} {label}",
+            callback_data=f"admin:verify:{cell_id}"
+        )]
+        for cell_id, label in cells.items()
+    ]
+    await query.edit_message_text(
+        f"🌟 {race['name']}: which event happened?",
+        reply_markup=InlineKeyboardMarkup(keyboard),
+    )
+
+
+async def llmstats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /llmstats command."""
+    if not is_admin(update.effective_user.id):
+        await update.message.reply_text("У вас нет прав администратора.")
+        return
+
+    await update.message.reply_text(format_llm_usage())
+
+
+async def jobstats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /jobstats command."""
+    if not is_admin(update.effective_user.id):
+        await update.message.reply_text("У вас нет прав администратора.")
+        return
+
+    await update.message.reply_text(format_job_stats())
+
+
+async def bingostats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /bingostats command."""
+    if not is_admin(update.effective_user.id):
+        await update.message.reply_text("У вас нет прав администратора.")
+        return
+
+    await send_bingo_report(update.message)
+
+
+async def send_bingo_report(message) -> None:
+    """Reply with the current race's bingo analytics summary and a per-cell CSV for each language pool."""
+    from f1bot.storage.repositories import RaceRepo
+    from f1bot.jobs.runner import run_blocking
+    from f1bot.services.bingo_analytics import build_report, format_report, report_csv
+    from f1bot.services.i18n import LANGUAGES
+    race = RaceRepo().get_current_race()
+    if not race:
+        await message.reply_text("No current race")
+        return
+
+    reports = [await run_blocking("db", build_report, race, lang) for lang in LANGUAGES]
+    reports = [report for report in reports if report is not None]
+    if not reports:
+        await message.reply_text("No bingo card for the current race yet")
+        return
+
+    for report in reports:
+        await message.reply_text(format_report(report, race["name"]))
+        if report.players:
+            await message.reply_document(
+                document=report_csv(report),
+                filename=f"bingo_{race['race_id']}_{report.lang}.csv",
+            )
+
+
+def format_job_stats() -> str:
+    """Render job stage timings, news source health, message edit, response cache and flood control counters."""
+    from f1bot.jobs.runner import format_stats
+    from f1bot.services.news_sources import format_source_stats
+    from f1bot.services.response_cache import format_cache_stats
+    from f1bot.bot.edit_queue import format_edit_stats
+    from f1bot.bot.flood import format_flood_stats
+    return (
+        f"{format_stats()}\n\n{format_source_stats()}\n\n{format_edit_stats()}\n\n"
+        f"{format_cache_stats()}\n{format_flood_stats()}"
+    )
+
+
+def format_llm_usage() -> str:
+    """Render LLM usage summary per race and per day."""
+    from f1bot.services.llm_usage import recorder, estimate_cost
+
+    # Make sure the latest calls are visible before aggregating
+    recorder.flush()
+    repo = LlmCallRepo()
+
+    def render(rows: list) -> str:
+        if not rows:
+            return "  (no calls)\n"
+        lines = ""
+        for row in rows:
+            cost = estimate_cost(row["prompt_tokens"], row["completion_tokens"])
+            lines += (
+                f"  {row['bucket']}: {row['calls']} calls, {row['errors']} failed, "
+                f"{row['prompt_tokens']}+{row['completion_tokens']} tok, "
+                f"cache hits {row['cache_hits']}, "
+                f"avg {row['avg_latency_ms']} ms / max {row['max_latency_ms']} ms, "
+                f"~${cost:.4f}\n"
+            )
+        return lines
+
+    text_msg = "📊 LLM usage\n\nPer race:\n" + render(repo.summary_by_race())
+    text_msg += "\nPer day (UTC):\n" + render(repo.summary_by_day())
+    return text_msg
+
 
 async def show_pending_content(update: Update, context: ContextTypes.DEFAULT_TYPE, content_type: str) -> None:
     """Show pending content list."""
@@ -153,14 +342,9 @@ async def publish_content_to_users(race_id: str, content_type: str, lang: str) -
             text_msg = content["text"]
             
             # Add CTA button
-            if content_type == "pre_race":
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🎯 Открыть Bingo Cards" if lang == "ru" else "🎯 Open Bingo Cards", callback_data="menu:bingo")]
-                ])
-            elif content_type == "post_race":
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton("📋 Следующая гонка" if lang == "ru" else "📋 Next Race", callback_data="menu:pre_race")]
-                ])
+            from f1bot.bot.keyboards import keyboard as static_keyboard
+            if content_type in ("pre_race", "post_race"):
+                keyboard = static_keyboard(f"publish_{content_type}", lang)
             else:
                 keyboard = None
             
@@ -186,4 +370,7 @@ async def publish_content_to_users(race_id: str, content_type: str, lang: str) -
 def register_admin_handlers(application) -> None:
     """Register admin handlers."""
     application.add_handler(CommandHandler("admin", admin_command))
+    application.add_handler(CommandHandler("llmstats", llmstats_command))
+    application.add_handler(CommandHandler("jobstats", jobstats_command))
+    application.add_handler(CommandHandler("bingostats", bingostats_command))
     application.add_handler(CallbackQueryHandler(admin_callback, pattern="^admin:"))
@@ -1,16 +1,44 @@
 """Bingo cards handlers."""
 
 import json
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import ContextTypes, CallbackQueryHandler
+from telegram.ext import ContextTypes, CallbackQueryHandler, CommandHandler
 
+from f1bot.config import settings
 from f1bot.logging import get_logger
-from f1bot.storage.repositories import UserRepo, RaceRepo, BingoRepo
+from f1bot.storage.repositories import UserRepo, RaceRepo, BingoRepo, to_utc_str
 from f1bot.services.i18n import t
+from f1bot.domain.bingo import (
+    score_states, states_mask, completed_lines, is_full, card_cells, new_card_seed,
+)
+from f1bot.bot.edit_queue import edit_queue, tap_edits
+from f1bot.bot.keyboards import keyboard as static_keyboard
+from f1bot.jobs.runner import run_blocking
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _cell_button(cell_id: str, title: str, status: str) -> InlineKeyboardButton:
+    """Button for one cell in one status (buttons are immutable, so they are shared)."""
+    # Emoji based on status
+    if status == "checked":
+        emoji = "✅"
+    elif status == "verified":
+        emoji = "🌟"
+    else:
+        emoji = "⬜"
+    
+    # Truncate title if too long
+    if len(title) > 15:
+        title = title[:12] + "..."
+    
+    return InlineKeyboardButton(f"{emoji} {title}", callback_data=f"bingo:toggle:{cell_id}")
+
+
 def create_bingo_keyboard(cells: list, states: dict, lang: str) -> InlineKeyboardMarkup:
     """Create 4x4 bingo keyboard."""
     keyboard = []
@@ -20,32 +48,16 @@ def create_bingo_keyboard(cells: list, states: dict, lang: str) -> InlineKeyboar
             cell_idx = i + j
             if cell_idx < len(cells):
                 cell = cells[cell_idx]
-                cell_id = cell["id"]
-                status = states.get(cell_id, "")
-                
-                # Emoji based on status
-                if status == "checked":
-                    emoji = "✅"
-                elif status == "verified":
-                    emoji = "✅"
-                else:
-                    emoji = "⬜"
-                
-                # Truncate title if too long
-                title = cell["title"]
-                if len(title) > 15:
-                    title = title[:12] + "..."
-                
-                row.append(InlineKeyboardButton(
-                    f"{emoji} {title}",
-                    callback_data=f"bingo:toggle:{cell_id}"
-                ))
+                row.append(_cell_button(cell["id"], cell["title"], states.get(cell["id"], "")))
         keyboard.append(row)
     
-    # Add finish button
+    # Add finish and leaderboard buttons
     checked_count = sum(1 for s in states.values() if s in ["checked", "verified"])
-    finish_text = t("bingo.finish", lang).format(count=checked_count, total=16)
-    keyboard.append([InlineKeyboardButton(finish_text, callback_data="bingo:finish")])
+    finish_text = t("bingo.finish", lang, count=checked_count, total=16)
+    keyboard.append([
+        InlineKeyboardButton(finish_text, callback_data="bingo:finish"),
+        InlineKeyboardButton(t("bingo.leaderboard", lang), callback_data="bingo:leaderboard"),
+    ])
     
     return InlineKeyboardMarkup(keyboard)
 
@@ -57,9 +69,9 @@ async def show_bingo_card(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     user = user_repo.get(user_id)
     lang = user.get("lang", "ru") if user else "ru"
     
-    # Get next race
+    # Get current race (in progress, or next upcoming)
     race_repo = RaceRepo()
-    race = race_repo.get_next_race()
+    race = race_repo.get_current_race()
     
     if not race:
         text = t("bingo.no_race", lang)
@@ -72,84 +84,118 @@ async def show_bingo_card(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     race_id = race["race_id"]
     bingo_repo = BingoRepo()
     
-    # Get or create bingo template
-    cells = bingo_repo.get_template(race_id, lang)
-    if not cells:
+    # Get or create the race's event pool
+    pool = bingo_repo.get_template(race_id, lang)
+    if not pool:
         # Generate bingo cells
         from f1bot.services.bingo import generate_bingo_cells
-        cells = generate_bingo_cells(race, {}, lang)
-        bingo_repo.save_template(race_id, lang, cells)
+        pool = generate_bingo_cells(race, {}, lang)
+        bingo_repo.save_template(race_id, lang, pool)
     
-    # Get user state
-    states = bingo_repo.get_user_state(race_id, user_id) or {}
+    # Get user state; a first-time player gets a fresh card seed
+    card = bingo_repo.get_user_card(race_id, user_id)
+    states = card["states"] if card else {}
+    card_seed = card["card_seed"] if card else new_card_seed()
+    cells = card_cells(pool, card_seed)
     
     # Create keyboard
     keyboard = create_bingo_keyboard(cells, states, lang)
     
-    text = t("bingo.title", lang).format(race_name=race["name"])
+    text = t("bingo.title", lang, race_name=race["name"])
     
     if update.callback_query:
         await update.callback_query.edit_message_text(text, reply_markup=keyboard)
+        message = update.callback_query.message
     else:
-        await update.message.reply_text(text, reply_markup=keyboard)
+        message = await update.message.reply_text(text, reply_markup=keyboard)
+    
+    # Remember where and what the card shows, so verifications can refresh it
+    # and taps can skip edits that change nothing
+    if message:
+        tap_edits.remember(message.chat_id, message.message_id, text, keyboard)
+        bingo_repo.set_card_message(race_id, user_id, message.chat_id, message.message_id, card_seed)
 
 
 async def bingo_toggle_cell(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Toggle bingo cell state."""
+    """Toggle bingo cell state (the tap is already answered by bingo_callback).
+
+    One combined read, one write; the card edit goes through the per-message
+    debouncer, so rapid taps collapse into one edit and no-op edits are skipped.
+    """
     query = update.callback_query
-    await query.answer()
-    
     user_id = update.effective_user.id
     cell_id = query.data.split(":")[2]  # bingo:toggle:cell_id
     
-    user_repo = UserRepo()
-    user = user_repo.get(user_id)
-    lang = user.get("lang", "ru") if user else "ru"
-    
-    # Get next race
-    race_repo = RaceRepo()
-    race = race_repo.get_next_race()
-    
-    if not race:
-        return
-    
-    race_id = race["race_id"]
     bingo_repo = BingoRepo()
+    tap = bingo_repo.get_tap_context(user_id)
+    if not tap or not tap["pool"] or tap["closed"]:
+        return
     
-    # Get current state
-    states = bingo_repo.get_user_state(race_id, user_id) or {}
+    race = tap["race"]
+    lang = tap["lang"]
+    pool = tap["pool"]
+    card = tap["card"]
+    states = card["states"] if card else {}
+    card_seed = card["card_seed"] if card else new_card_seed()
+    cells = card_cells(pool, card_seed)
+    old_mask = states_mask(cells, states)
     
-    # Toggle cell
+    # Toggle cell (verified cells are locked; ticking an already verified event verifies it)
     current_status = states.get(cell_id, "")
-    if current_status in ["checked", "verified"]:
+    if current_status == "verified":
+        return
+    if current_status == "checked":
         states[cell_id] = ""
+    elif cell_id in tap["verified"]:
+        states[cell_id] = "verified"
     else:
         states[cell_id] = "checked"
     
-    # Save state
-    bingo_repo.upsert_user_state(race_id, user_id, states)
+    # Win detection against the precomputed line masks (no extra query)
+    new_mask = states_mask(cells, states)
+    lines = completed_lines(new_mask)
+    new_line = lines > completed_lines(old_mask)
+    new_full = is_full(new_mask) and not is_full(old_mask)
+    
+    # Record the tap (appended to the event log; a first tap also creates the snapshot)
+    message = query.message
+    bingo_repo.record_toggle(
+        race["race_id"], user_id, cell_id, states[cell_id],
+        score=score_states(states),
+        display_name=update.effective_user.first_name,
+        checked_mask=states_mask(pool, states),
+        has_line=lines > 0,
+        full_card=is_full(new_mask),
+        card_seed=None if card else card_seed,
+        chat_id=message.chat_id if message else None,
+        message_id=message.message_id if message else None,
+    )
     
-    # Get cells and update keyboard
-    cells = bingo_repo.get_template(race_id, lang)
-    if cells:
-        keyboard = create_bingo_keyboard(cells, states, lang)
-        text = t("bingo.title", lang).format(race_name=race["name"])
+    # Update keyboard
+    keyboard = create_bingo_keyboard(cells, states, lang)
+    text = t("bingo.title", lang, race_name=race["name"])
+    if message:
+        tap_edits.submit(context.bot, message.chat_id, message.message_id, text, keyboard)
+    else:
         await query.edit_message_text(text, reply_markup=keyboard)
+    
+    # Celebrate on the tap that completed a line / the card
+    if (new_full or new_line) and message:
+        await message.reply_text(t("bingo.full_card" if new_full else "bingo.line", lang, lines=lines))
 
 
 async def bingo_finish(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show bingo finish screen."""
     query = update.callback_query
-    await query.answer()
     
     user_id = update.effective_user.id
     user_repo = UserRepo()
     user = user_repo.get(user_id)
     lang = user.get("lang", "ru") if user else "ru"
     
-    # Get next race
+    # Get current race (in progress, or next upcoming)
     race_repo = RaceRepo()
-    race = race_repo.get_next_race()
+    race = race_repo.get_current_race()
     
     if not race:
         return
@@ -161,18 +207,93 @@ async def bingo_finish(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     states = bingo_repo.get_user_state(race_id, user_id) or {}
     checked_count = sum(1 for s in states.values() if s in ["checked", "verified"])
     
-    text = t("bingo.finish_result", lang).format(
+    text = t(
+        "bingo.finish_result", lang,
         checked=checked_count,
         total=16,
         race_name=race["name"]
     )
     
-    # Back button
-    keyboard = InlineKeyboardMarkup([
-        [InlineKeyboardButton(t("menu.back", lang), callback_data="menu:main")]
-    ])
+    # Leaderboard and back buttons
+    await query.edit_message_text(text, reply_markup=static_keyboard("bingo_finish", lang))
+
+
+def format_leaderboard(
+    race: dict, top: list, own: Optional[Dict[str, int]], lang: str, first_bingos: Optional[list] = None
+) -> str:
+    """Render the top players, the first to complete a line and the caller's own rank."""
+    lines = [t("bingo.leaderboard_title", lang, race_name=race["name"])]
+    if not top:
+        lines.append(t("bingo.leaderboard_empty", lang))
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    for position, row in enumerate(top, start=1):
+        name = row["display_name"] or f"{t('bingo.player', lang)} {str(row['telegram_id'])[-4:]}"
+        lines.append(f"{medals.get(position, f'{position}.')} {name} — {row['score']}")
+    if first_bingos:
+        lines.append(t("bingo.first_bingos", lang))
+        for row in first_bingos:
+            name = row["display_name"] or f"{t('bingo.player', lang)} {str(row['telegram_id'])[-4:]}"
+            lines.append(f"🎯 {name}{' 🏆' if row['full_card_at'] else ''}")
+    if own:
+        lines.append(t("bingo.leaderboard_you", lang, **own))
+    return "\n".join(lines)
+
+
+async def show_leaderboard(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the current race's top players plus the caller's rank."""
+    user_id = update.effective_user.id
+    user = UserRepo().get(user_id)
+    lang = user.get("lang", "ru") if user else "ru"
+    
+    race = RaceRepo().get_current_race()
+    if not race:
+        text, keyboard = t("bingo.no_race", lang), None
+    else:
+        bingo_repo = BingoRepo()
+        top = bingo_repo.get_leaderboard(race["race_id"], settings.bingo_leaderboard_size)
+        own = bingo_repo.get_rank(race["race_id"], user_id)
+        first_bingos = bingo_repo.get_first_bingos(race["race_id"])
+        text = format_leaderboard(race, top, own, lang, first_bingos)
+        keyboard = static_keyboard("leaderboard", lang)
+    
+    if update.callback_query:
+        await update.callback_query.edit_message_text(text, reply_markup=keyboard)
+    else:
+        await update.message.reply_text(text, reply_markup=keyboard)
+
+
+async def verify_bingo_cell(race: dict, cell_id: str, verified_by: int) -> Tuple[int, int]:
+    """Verify a cell for everyone who ticked it and push refreshed cards.
+
+    Returns (verified players, cards queued for refresh). Only players active
+    within bingo_push_active_minutes get their card message edited.
+    """
+    race_id = race["race_id"]
+    rows = await run_blocking("db", BingoRepo().verify_cell, race_id, cell_id, verified_by)
+    
+    cutoff = to_utc_str(datetime.now(timezone.utc) - timedelta(minutes=settings.bingo_push_active_minutes))
+    active = [row for row in rows if row["message_id"] and row["updated_at"] and str(row["updated_at"]) >= cutoff]
+    if not active:
+        return len(rows), 0
+    
+    langs = await run_blocking("db", UserRepo().get_langs, [row["telegram_id"] for row in active])
+    pools: Dict[str, Optional[list]] = {}
+    for row in active:
+        lang = langs.get(row["telegram_id"], "ru")
+        if lang not in pools:
+            pools[lang] = await run_blocking("db", BingoRepo().get_template, race_id, lang)
+        pool = pools[lang]
+        if not pool:
+            continue
+        edit_queue.submit(
+            row["chat_id"],
+            row["message_id"],
+            t("bingo.title", lang, race_name=race["name"]),
+            create_bingo_keyboard(card_cells(pool, row["card_seed"]), row["states"], lang),
+        )
     
-    await query.edit_message_text(text, reply_markup=keyboard)
+    logger.info(f"Verified {cell_id} for {len(rows)} players of {race_id}, refreshing {len(active)} cards")
+    return len(rows), len(active)
 
 
 async def bingo_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -186,6 +307,8 @@ async def bingo_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await bingo_toggle_cell(update, context)
     elif action == "finish":
         await bingo_finish(update, context)
+    elif action == "leaderboard":
+        await show_leaderboard(update, context)
     else:
         await show_bingo_card(update, context)
 
@@ -193,3 +316,4 @@ async def bingo_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 def register_bingo_handlers(application) -> None:
     """Register bingo handlers."""
     application.add_handler(CallbackQueryHandler(bingo_callback, pattern="^bingo:"))
+    application.add_handler(CommandHandler("leaderboard", show_leaderboard))
@@ -1,10 +1,11 @@
 """Start command handler."""
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update
 from telegram.ext import ContextTypes, CommandHandler
 
 from f1bot.logging import get_logger
 from f1bot.storage.repositories import UserRepo
+from f1bot.bot.keyboards import LANGUAGE_PICKER, LANGUAGE_PROMPT
 
 logger = get_logger(__name__)
 
@@ -24,16 +25,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await show_main_menu(update, context)
     else:
         # Show language selection
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("🇷🇺 Русский", callback_data="lang:ru"),
-                InlineKeyboardButton("🇬🇧 English", callback_data="lang:en"),
-            ]
-        ])
-        await update.message.reply_text(
-            "Выберите язык / Choose language:",
-            reply_markup=keyboard,
-        )
+        await update.message.reply_text(LANGUAGE_PROMPT, reply_markup=LANGUAGE_PICKER)
 
 
 def register_start_handler(application) -> None:
@@ -0,0 +1,50 @@
+"""Static keyboards, built once per language.
+
+Menus and content CTAs don't depend on the user beyond their language, so
+they are built at import for every language in the i18n catalog and shared
+(Telegram objects are immutable).
+"""
+
+from typing import Dict, List
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from f1bot.services.i18n import DEFAULT_LANG, LANGUAGES, t
+
+
+def _button(key: str, lang: str, callback_data: str) -> List[InlineKeyboardButton]:
+    return [InlineKeyboardButton(t(key, lang), callback_data=callback_data)]
+
+
+def _build(lang: str) -> Dict[str, InlineKeyboardMarkup]:
+    back = _button("menu.back", lang, "menu:main")
+    return {
+        "main_menu": InlineKeyboardMarkup([
+            _button("menu.pre_race", lang, "menu:pre_race"),
+            _button("menu.bingo", lang, "menu:bingo"),
+            _button("menu.post_race", lang, "menu:post_race"),
+            _button("menu.language", lang, "menu:language"),
+        ]),
+        "back": InlineKeyboardMarkup([back]),
+        # Published content as shown from the menu, and as sent to everyone
+        "pre_race": InlineKeyboardMarkup([_button("cta.open_bingo", lang, "menu:bingo"), back]),
+        "post_race": InlineKeyboardMarkup([_button("cta.next_race", lang, "menu:pre_race"), back]),
+        "publish_pre_race": InlineKeyboardMarkup([_button("cta.open_bingo", lang, "menu:bingo")]),
+        "publish_post_race": InlineKeyboardMarkup([_button("cta.next_race", lang, "menu:pre_race")]),
+        "bingo_finish": InlineKeyboardMarkup([_button("bingo.leaderboard", lang, "bingo:leaderboard"), back]),
+        "leaderboard": InlineKeyboardMarkup([_button("menu.bingo", lang, "bingo:show"), back]),
+    }
+
+
+KEYBOARDS: Dict[str, Dict[str, InlineKeyboardMarkup]] = {lang: _build(lang) for lang in LANGUAGES}
+
+# Shown before the user has a language: one button per catalog language
+LANGUAGE_PICKER = InlineKeyboardMarkup([
+    [InlineKeyboardButton(t("language.name", lang), callback_data=f"lang:{lang}") for lang in LANGUAGES]
+])
+LANGUAGE_PROMPT = " / ".join(t("language.choose", lang) for lang in LANGUAGES) + ":"
+
+
+def keyboard(name: str, lang: str) -> InlineKeyboardMarkup:
+    """Static keyboard by name in the user's language (default language if unknown)."""
+    return KEYBOARDS.get(lang, KEYBOARDS[DEFAULT_LANG])[name]
@@ -29,6 +29,23 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"
+    openai_base_url: str = ""  # e.g. a local OpenAI-compatible stub for testing
+
+    # LLM resilience
+    llm_attempt_timeout_seconds: float = 30.0
+    llm_deadline_seconds: float = 90.0
+    llm_max_attempts: int = 3
+    llm_hedge_after_seconds: float = 0.0  # 0 disables hedged requests
+    llm_breaker_failures: int = 5
+    llm_breaker_reset_seconds: float = 120.0
+
+    # LLM usage accounting (USD per 1M tokens, used for cost estimates only)
+    llm_prompt_cost_per_1m: float = 0.15
+    llm_completion_cost_per_1m: float = 0.60
+    llm_usage_flush_seconds: float = 5.0
+
+    # Prompt context (estimated tokens of news context per prompt)
+    llm_context_token_budget: int = 400
 
     # Environment
     env: str = "local"
@@ -43,6 +60,59 @@ class Settings(BaseSettings):
     # Language
     lang_default: str = "ru"
 
+    # Pre-race pipeline: generate well ahead, publish exactly N hours before start
+    pre_race_generate_ahead_hours: float = 24.0
+    pre_race_publish_before_hours: float = 2.0
+
+    # Race lifecycle: in_progress -> finished after race_duration_hours, recap after the news delay
+    race_duration_hours: float = 2.0
+    post_race_news_delay_minutes: int = 60
+    # Races finishing longer ago than this (e.g. backfilled by a calendar sync) get no recap
+    post_race_max_age_hours: float = 24.0
+
+    # Scheduler
+    scheduler_misfire_grace_seconds: int = 3600
+    schedule_refresh_hours: float = 6.0
+    calendar_sync_hours: float = 6.0
+
+    # Job execution (thread pool for blocking job stages, loop lag warning threshold)
+    job_pool_size: int = 8
+    loop_lag_warn_ms: float = 50.0
+
+    # HTTP cache for calendar/news sources (no request at all within the refresh interval)
+    http_cache_dir: str = "data/http_cache"
+    http_min_refresh_seconds: float = 300.0
+
+    # News aggregation (all sources fetched concurrently under one deadline)
+    news_deadline_seconds: float = 15.0
+    news_source_timeout_seconds: float = 10.0
+    news_max_sources: int = 5
+
+    # News ingestion (background job filling the news_items table)
+    news_ingest_minutes: float = 15.0
+    news_ingest_per_source: int = 50
+    news_ingest_batch_size: int = 200
+    news_retention_days: int = 30
+
+    # Bingo: bulk card refreshes go through a rate-limited edit queue, only to recently active players
+    edit_queue_rate_per_second: float = 25.0
+    bingo_push_active_minutes: int = 30
+    bingo_leaderboard_size: int = 10
+    # Card edits from taps: first edit at once, then at most one per message per window
+    bingo_edit_debounce_seconds: float = 1.0
+    # Bingo taps are appended to bingo_events and folded into per-user snapshots in the background
+    bingo_compact_seconds: float = 30.0
+    bingo_compact_batch_size: int = 5000
+
+    # Rendered pre-/post-race menu responses (invalidated on content changes)
+    response_cache_max_entries: int = 256
+    response_cache_race_ttl_seconds: float = 30.0
+
+    # Per-user flood control: token bucket of FLOOD_BURST updates refilled at FLOOD_RATE_PER_SECOND
+    flood_rate_per_second: float = 2.0
+    flood_burst: int = 8
+    flood_max_buckets: int = 10000
+
     # Optional
     news_sources: str = ""
     f1_calendar_source: str = ""
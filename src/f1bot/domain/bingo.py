@@ -0,0 +1,100 @@
+"""Bingo rules: scoring, personalised card layouts and win detection."""
+
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# Points per cell: an event confirmed by an admin is worth far more than a tick
+CHECKED_POINTS = 1
+VERIFIED_POINTS = 10
+
+# Card state as a 16-bit mask: bit i is set when the cell at position i (row-major) is marked
+GRID_SIZE = 4
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+FULL_MASK = (1 << CELL_COUNT) - 1
+MARKED = ("checked", "verified")
+
+
+def _line_masks() -> Tuple[int, ...]:
+    rows = [sum(1 << (r * GRID_SIZE + c) for c in range(GRID_SIZE)) for r in range(GRID_SIZE)]
+    cols = [sum(1 << (r * GRID_SIZE + c) for r in range(GRID_SIZE)) for c in range(GRID_SIZE)]
+    diagonals = [
+        sum(1 << (i * GRID_SIZE + i) for i in range(GRID_SIZE)),
+        sum(1 << (i * GRID_SIZE + GRID_SIZE - 1 - i) for i in range(GRID_SIZE)),
+    ]
+    return tuple(rows + cols + diagonals)
+
+
+# 4 rows, 4 columns, 2 diagonals
+LINE_MASKS = _line_masks()
+
+# Personalised cards: a per-user seed picks 16 cells of the race's event pool
+# in a shuffled order. Seed 0 is the unshuffled pool (cards created before
+# seeds existed); the seed space is small so the layout cache stays bounded.
+CARD_SEEDS = 4096
+
+
+def new_card_seed() -> int:
+    return random.randrange(1, CARD_SEEDS)
+
+
+@lru_cache(maxsize=CARD_SEEDS * 2)
+def card_layout(seed: int, pool_size: int) -> Tuple[int, ...]:
+    """Pool indices in card order for a seed (a partial Fisher-Yates shuffle).
+
+    Only Random.random() is used, whose sequence per seed is guaranteed stable
+    across Python versions, so a stored seed always yields the same card.
+    """
+    size = min(pool_size, CELL_COUNT)
+    order = list(range(pool_size))
+    if seed:
+        rng = random.Random(seed)
+        for i in range(size):
+            j = i + int(rng.random() * (pool_size - i))
+            order[i], order[j] = order[j], order[i]
+    return tuple(order[:size])
+
+
+def card_cells(pool: List[Dict], seed: int) -> List[Dict]:
+    """The user's card: cells of the event pool laid out by their seed."""
+    return [pool[i] for i in card_layout(seed, len(pool))]
+
+
+def score_states(states: Dict[str, str]) -> int:
+    """Score of a card from its cell states."""
+    score = 0
+    for status in states.values():
+        if status == "verified":
+            score += VERIFIED_POINTS
+        elif status == "checked":
+            score += CHECKED_POINTS
+    return score
+
+
+def states_mask(cells: List[Dict], states: Dict[str, str]) -> int:
+    """Pack marked cells into a bit mask by position in cells.
+
+    Over a card this is the 16-bit mask used for lines; over the event pool it
+    gives a layout-independent mask comparable across players.
+    """
+    mask = 0
+    for position, cell in enumerate(cells):
+        if states.get(cell["id"]) in MARKED:
+            mask |= 1 << position
+    return mask
+
+
+def completed_lines(mask: int) -> int:
+    """Number of complete rows, columns and diagonals."""
+    return sum(1 for line in LINE_MASKS if mask & line == line)
+
+
+def is_full(mask: int) -> bool:
+    return mask & FULL_MASK == FULL_MASK
+
+
+def fold_events(states: Dict[str, str], events: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Apply (cell_id, new status) events in order to a card state."""
+    for cell_id, status in events:
+        states[cell_id] = status
+    return states
@@ -58,3 +58,15 @@ class BingoUserState:
     states_json: Dict[str, str]  # cell_id -> status (empty, checked, verified)
     created_at: datetime
     updated_at: datetime
+    chat_id: Optional[int] = None  # last message showing the card
+    message_id: Optional[int] = None
+
+
+@dataclass
+class BingoVerifiedCell:
+    """Bingo cell an admin confirmed as having happened."""
+
+    race_id: str
+    cell_id: str
+    verified_by: Optional[int]
+    verified_at: datetime
@@ -0,0 +1,22 @@
+"""Bingo event compaction job."""
+
+from f1bot.logging import get_logger
+from f1bot.config import settings
+from f1bot.storage.repositories import BingoRepo
+from f1bot.jobs.runner import run_blocking
+
+logger = get_logger(__name__)
+
+
+async def bingo_compact_job() -> int:
+    """Fold pending bingo taps into the per-user snapshots; returns the number of events folded."""
+    bingo_repo = BingoRepo()
+    total = 0
+    while True:
+        folded = await run_blocking("db", bingo_repo.compact_events, settings.bingo_compact_batch_size)
+        total += folded
+        if folded < settings.bingo_compact_batch_size:
+            break
+    if total:
+        logger.info(f"Bingo compaction: {total} events folded")
+    return total
@@ -0,0 +1,44 @@
+"""Full-season calendar sync job."""
+
+from typing import Dict, List
+
+from f1bot.logging import get_logger
+from f1bot.config import settings
+from f1bot.storage.repositories import RaceRepo
+from f1bot.services.calendar import fetch_season
+from f1bot.services.race_timeline import race_timeline
+from f1bot.jobs.runner import run_blocking
+
+logger = get_logger(__name__)
+
+
+async def calendar_sync_job() -> Dict[str, List[str]]:
+    """Fetch the whole season, bulk-upsert it into races and re-plan jobs if anything changed."""
+    if not settings.f1_calendar_source:
+        logger.debug("No F1 calendar source configured")
+        return {"added": [], "changed": [], "removed": []}
+
+    races = await run_blocking("http", fetch_season)
+    if not races:
+        # An empty or failed fetch must not wipe the stored calendar
+        logger.warning("Calendar sync got no races, keeping stored calendar")
+        return {"added": [], "changed": [], "removed": []}
+
+    report = await run_blocking("db", RaceRepo().sync_season, races)
+    # Rebuild the in-memory timeline once per sync
+    await run_blocking("db", race_timeline.reload)
+
+    if any(report.values()):
+        from f1bot.jobs.scheduler import plan_race_jobs
+        await run_blocking("db", plan_race_jobs)
+    logger.info(f"Calendar sync: {len(races)} races, {format_report(report)}")
+    return report
+
+
+def format_report(report: Dict[str, List[str]]) -> str:
+    """One-line summary of a sync report."""
+    parts = []
+    for kind in ("added", "changed", "removed"):
+        if report.get(kind):
+            parts.append(f"{kind} {len(report[kind])} ({', '.join(report[kind][:5])}{'…' if len(report[kind]) > 5 else ''})")
+    return ", ".join(parts) if parts else "no changes"
@@ -0,0 +1,36 @@
+"""Incremental news ingestion job."""
+
+from datetime import datetime, timedelta, timezone
+
+from f1bot.logging import get_logger
+from f1bot.config import settings
+from f1bot.storage.repositories import NewsRepo
+from f1bot.services.news import fetch_from_sources, to_news_rows, warm_news_index
+from f1bot.services.news_index import news_index
+from f1bot.jobs.runner import run_blocking
+
+logger = get_logger(__name__)
+
+
+async def news_ingest_job() -> int:
+    """Fetch all sources, store only unseen items and index them; returns the number stored."""
+    if not settings.news_sources:
+        logger.debug("No news sources configured")
+        return 0
+
+    now = datetime.now(timezone.utc)
+    items = await fetch_from_sources(limit=settings.news_ingest_per_source)
+    rows = to_news_rows(items, fetched_at=now)
+
+    news_repo = NewsRepo()
+    await run_blocking("db", warm_news_index)
+    new_rows = await run_blocking("db", news_repo.insert_new, rows, settings.news_ingest_batch_size)
+    news_index.add(new_rows)
+
+    pruned = await run_blocking("db", news_repo.prune, now - timedelta(days=settings.news_retention_days))
+    # Pruned articles must stop ranking in prompt context too
+    unindexed = news_index.remove(pruned)
+    logger.info(
+        f"News ingest: {len(items)} fetched, {len(new_rows)} new, {len(pruned)} pruned ({unindexed} unindexed)"
+    )
+    return len(new_rows)
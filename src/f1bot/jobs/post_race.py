@@ -1,53 +1,66 @@
 """Post-race content generation job."""
 
-from datetime import datetime
-from zoneinfo import ZoneInfo
+import asyncio
+from typing import Optional
 
 from f1bot.logging import get_logger
 from f1bot.config import settings
 from f1bot.storage.repositories import RaceRepo, ContentRepo
-from f1bot.services.news import fetch_news
-from f1bot.services.llm import generate_post_race
+from f1bot.services.news import fetch_race_news
+from f1bot.services.llm import generate_post_race, LLMUnavailableError
 from f1bot.bot.app import create_application
+from f1bot.jobs.publish import LANGS
+from f1bot.jobs.runner import run_blocking
 
 logger = get_logger(__name__)
 
 
-async def post_race_job() -> None:
+async def post_race_job(race_id: Optional[str] = None) -> None:
     """Generate post-race content after race finish."""
     logger.info("Post-race job triggered")
     
-    # Get last finished race
+    # Scheduled runs name their race; otherwise take the last finished one
     race_repo = RaceRepo()
-    race = race_repo.get_last_race()
+    if race_id:
+        race = await run_blocking("db", race_repo.get_by_id, race_id)
+    else:
+        race = await run_blocking("db", race_repo.get_last_race)
     
     if not race:
         logger.info("No finished race found")
         return
     
+    if race["status"] != "finished":
+        logger.info(f"Race {race['race_id']} is not finished yet")
+        return
+    
     race_id = race["race_id"]
     
     # Check if content already exists
     content_repo = ContentRepo()
-    ru_content = content_repo.fetch_by_race_type_lang(race_id, "post_race", "ru")
-    en_content = content_repo.fetch_by_race_type_lang(race_id, "post_race", "en")
+    ru_content = await run_blocking("db", content_repo.fetch_by_race_type_lang, race_id, "post_race", "ru")
     
     if ru_content and ru_content["status"] != "draft":
         logger.info("Post-race content already generated")
         return
     
     # Fetch news
-    news = fetch_news(limit=10)
+    news = await run_blocking("db", fetch_race_news, race, limit=10)
     
-    # Generate content for both languages
-    for lang in ["ru", "en"]:
-        existing = content_repo.fetch_by_race_type_lang(race_id, "post_race", lang)
+    # Generate content for every language
+    for lang in LANGS:
+        existing = await run_blocking("db", content_repo.fetch_by_race_type_lang, race_id, "post_race", lang)
         if existing and existing["status"] != "draft":
             continue
         
-        text = generate_post_race(race, news, lang)
-        content_repo.save_draft(race_id, "post_race", lang, text)
-        content_repo.mark_pending(race_id, "post_race", lang)
+        try:
+            text = await run_blocking("llm", generate_post_race, race, news, lang)
+        except (LLMUnavailableError, asyncio.TimeoutError) as e:
+            # Don't store an error text as a draft; the next run will retry
+            logger.error(f"Skipping post-race content for {race_id} in {lang}: {e}")
+            continue
+        await run_blocking("db", content_repo.save_draft, race_id, "post_race", lang, text)
+        await run_blocking("db", content_repo.mark_pending, race_id, "post_race", lang)
         
         logger.info(f"Generated post-race content for {race_id} in {lang}")
     
@@ -61,7 +74,7 @@ async def notify_admins_post_race(race_id: str) -> None:
         application = create_application()
         content_repo = ContentRepo()
         
-        for lang in ["ru", "en"]:
+        for lang in LANGS:
             content = content_repo.fetch_by_race_type_lang(race_id, "post_race", lang)
             if not content or content["status"] != "pending_admin":
                 continue
@@ -1,98 +1,111 @@
 """Pre-race content generation job."""
 
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
 
 from f1bot.logging import get_logger
 from f1bot.config import settings
 from f1bot.storage.repositories import RaceRepo, ContentRepo
-from f1bot.services.calendar import get_next_race
-from f1bot.services.news import fetch_news
-from f1bot.services.llm import generate_pre_race
+from f1bot.services.news import fetch_race_news
+from f1bot.services.llm import generate_pre_race, LLMUnavailableError
 from f1bot.bot.app import create_application
+from f1bot.jobs.publish import (
+    race_start_time,
+    pre_race_publish_at,
+    schedule_publish,
+    is_publish_scheduled,
+    publish_job,
+    LANGS,
+)
+from f1bot.jobs.runner import run_blocking
 
 logger = get_logger(__name__)
 
 
-async def pre_race_job() -> None:
-    """Generate pre-race content 2 hours before race start."""
+async def pre_race_job(race_id: Optional[str] = None) -> None:
+    """Generate pre-race content ahead of time and schedule its exact-time publish."""
     logger.info("Pre-race job triggered")
     
-    # Get next race from database first
+    # Scheduled runs name their race; otherwise take the next one from the database
     race_repo = RaceRepo()
-    race = race_repo.get_next_race()
-    
-    # If not in database, try to fetch from calendar source
-    if not race:
-        logger.info("No race in database, trying to fetch from calendar source")
-        calendar_race = get_next_race()
-        if calendar_race:
-            # Save to database
-            race_repo.upsert(
-                race_id=calendar_race["race_id"],
-                name=calendar_race["name"],
-                start_time_utc=calendar_race["start_time_utc"],
-                status=calendar_race["status"],
-                meta_json=calendar_race.get("meta_json"),
-            )
-            race = calendar_race
-            logger.info(f"Fetched race from calendar: {race['name']}")
+    if race_id:
+        race = await run_blocking("db", race_repo.get_by_id, race_id)
+    else:
+        race = await run_blocking("db", race_repo.get_next_race)
     
     if not race:
         logger.info("No upcoming race found")
         return
     
     race_id = race["race_id"]
-    start_time = datetime.fromisoformat(race["start_time_utc"].replace("Z", "+00:00")) if isinstance(race["start_time_utc"], str) else race["start_time_utc"]
-    now = datetime.now(ZoneInfo(settings.timezone))
+    start_time = race_start_time(race)
+    publish_at = pre_race_publish_at(race)
+    now = datetime.now(timezone.utc)
     
-    # Check if it's 2 hours before race (with 10 minute window)
+    if now >= start_time:
+        logger.info(f"Race {race_id} already started, skipping pre-race generation")
+        return
+    
+    # Generate well ahead of the publish moment so that slow LLM calls and admin review fit in
     time_diff = (start_time - now).total_seconds() / 3600
-    if not (1.8 <= time_diff <= 2.2):
+    if time_diff > settings.pre_race_generate_ahead_hours:
         logger.info(f"Not yet time for pre-race generation. Time diff: {time_diff:.2f} hours")
         return
     
-    # Check if content already exists
     content_repo = ContentRepo()
-    ru_content = content_repo.fetch_by_race_type_lang(race_id, "pre_race", "ru")
-    en_content = content_repo.fetch_by_race_type_lang(race_id, "pre_race", "en")
+    news = None
+    generated = False
     
-    if ru_content and ru_content["status"] != "draft":
-        logger.info("Pre-race content already generated")
-        return
-    
-    # Fetch news
-    news = fetch_news(limit=10)
-    
-    # Generate content for both languages
-    for lang in ["ru", "en"]:
-        existing = content_repo.fetch_by_race_type_lang(race_id, "pre_race", lang)
+    for lang in LANGS:
+        existing = await run_blocking("db", content_repo.fetch_by_race_type_lang, race_id, "pre_race", lang)
         if existing and existing["status"] != "draft":
             continue
         
-        text = generate_pre_race(race, news, lang)
-        content_repo.save_draft(race_id, "pre_race", lang, text)
-        content_repo.mark_pending(race_id, "pre_race", lang)
+        if news is None:
+            # Fetch news once, only when something still needs generating
+            news = await run_blocking("db", fetch_race_news, race, limit=10)
+        try:
+            text = await run_blocking("llm", generate_pre_race, race, news, lang)
+        except (LLMUnavailableError, asyncio.TimeoutError) as e:
+            # Don't store an error text as a draft; the next run will retry
+            logger.error(f"Skipping pre-race content for {race_id} in {lang}: {e}")
+            continue
+        await run_blocking("db", content_repo.save_draft, race_id, "pre_race", lang, text)
+        await run_blocking("db", content_repo.mark_pending, race_id, "pre_race", lang)
+        generated = True
         
         logger.info(f"Generated pre-race content for {race_id} in {lang}")
     
-    # Notify admins
-    await notify_admins_pre_race(race_id)
+    if generated:
+        # Notify admins
+        await notify_admins_pre_race(race_id, publish_at)
+    
+    if now < publish_at:
+        # Exact-time publish; idempotent, also restores the schedule after a restart
+        if not await run_blocking("db", is_publish_scheduled, race_id, "pre_race"):
+            await run_blocking("db", schedule_publish, race_id, "pre_race", publish_at)
+    else:
+        # Publish moment already passed (missed trigger): send whatever is approved
+        await publish_job(race_id, "pre_race", remind=False)
 
 
-async def notify_admins_pre_race(race_id: str) -> None:
+async def notify_admins_pre_race(race_id: str, publish_at: datetime) -> None:
     """Notify admins about pending pre-race content."""
     try:
         application = create_application()
         content_repo = ContentRepo()
         
-        for lang in ["ru", "en"]:
+        for lang in LANGS:
             content = content_repo.fetch_by_race_type_lang(race_id, "pre_race", lang)
             if not content or content["status"] != "pending_admin":
                 continue
             
             from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-            text = f"📋 Pre-Race Content ({lang.upper()})\n\n{content['text']}"
+            text = (
+                f"📋 Pre-Race Content ({lang.upper()})\n"
+                f"🕑 Publishes at {publish_at:%Y-%m-%d %H:%M} UTC\n\n{content['text']}"
+            )
             keyboard = InlineKeyboardMarkup([
                 [
                     InlineKeyboardButton("✅ Approve", callback_data=f"admin:approve:pre_race:{race_id}:{lang}"),
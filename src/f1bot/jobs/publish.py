@@ -0,0 +1,136 @@
+"""Exact-time publishing of approved content."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any
+
+from apscheduler.triggers.date import DateTrigger
+
+from f1bot.logging import get_logger
+from f1bot.config import settings
+from f1bot.storage.repositories import RaceRepo, ContentRepo
+from f1bot.services.i18n import LANGUAGES
+from f1bot.jobs.runner import run_blocking
+
+logger = get_logger(__name__)
+
+# Content is generated and published for every language of the locale catalog
+LANGS = list(LANGUAGES)
+
+
+def race_start_time(race: Dict[str, Any]) -> datetime:
+    """Race start as an aware UTC datetime (DB rows store strings, naive means UTC)."""
+    start_time = race["start_time_utc"]
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time.astimezone(timezone.utc)
+
+
+def pre_race_publish_at(race: Dict[str, Any]) -> datetime:
+    """Moment the pre-race preview goes out (N hours before start)."""
+    return race_start_time(race) - timedelta(hours=settings.pre_race_publish_before_hours)
+
+
+def schedule_publish(race_id: str, content_type: str, run_at: datetime) -> None:
+    """Schedule publish_job to fire exactly at run_at (replaces an existing schedule)."""
+    from f1bot.jobs.scheduler import scheduler
+
+    scheduler.add_job(
+        publish_job,
+        DateTrigger(run_date=run_at),
+        args=[race_id, content_type],
+        id=publish_job_id(race_id, content_type),
+        replace_existing=True,
+        misfire_grace_time=int(settings.pre_race_publish_before_hours * 3600),
+    )
+    logger.info(f"Scheduled {content_type} publish for {race_id} at {run_at.isoformat()}")
+
+
+def publish_job_id(race_id: str, content_type: str) -> str:
+    """Scheduler job id for a content publish."""
+    return f"publish:{content_type}:{race_id}"
+
+
+def is_publish_scheduled(race_id: str, content_type: str) -> bool:
+    """Check if a publish job is already scheduled."""
+    from f1bot.jobs.scheduler import scheduler
+
+    return scheduler.get_job(publish_job_id(race_id, content_type)) is not None
+
+
+async def publish_job(race_id: str, content_type: str, remind: bool = True) -> None:
+    """Publish approved content at its scheduled time; remind admins about unapproved content."""
+    from f1bot.bot.handlers.admin import publish_content_to_users
+
+    logger.info(f"Publish job triggered for {content_type} {race_id}")
+    content_repo = ContentRepo()
+    overdue = []
+
+    for lang in LANGS:
+        content = await run_blocking("db", content_repo.fetch_by_race_type_lang, race_id, content_type, lang)
+        if not content:
+            continue
+        if content["status"] == "approved":
+            await run_blocking("db", content_repo.publish, race_id, content_type, lang)
+            await publish_content_to_users(race_id, content_type, lang)
+            logger.info(f"Published {content_type} for {race_id} in {lang} on schedule")
+        elif content["status"] in ("draft", "pending_admin"):
+            overdue.append(lang)
+
+    if overdue and remind:
+        await notify_admins_overdue(race_id, content_type, overdue)
+
+
+async def approve_scheduled_content(race_id: str, content_type: str, lang: str) -> str:
+    """Handle an approval for pre-race content.
+
+    Before the publish moment the content is only approved and the scheduled job
+    publishes it. If approval arrives late but before the race starts, it is
+    published immediately. Returns a status message for the admin.
+    """
+    from f1bot.bot.handlers.admin import publish_content_to_users
+
+    content_repo = ContentRepo()
+    race = RaceRepo().get_by_id(race_id)
+    now = datetime.now(timezone.utc)
+    content_repo.approve(race_id, content_type, lang)
+
+    if race is None:
+        content_repo.publish(race_id, content_type, lang)
+        await publish_content_to_users(race_id, content_type, lang)
+        return "✅ Content approved and published!"
+
+    publish_at = pre_race_publish_at(race)
+    if now < publish_at:
+        if not is_publish_scheduled(race_id, content_type):
+            schedule_publish(race_id, content_type, publish_at)
+        return f"✅ Approved, will be published at {publish_at:%Y-%m-%d %H:%M} UTC"
+
+    if now < race_start_time(race):
+        # Late approval: the scheduled moment has passed, publish right away
+        content_repo.publish(race_id, content_type, lang)
+        await publish_content_to_users(race_id, content_type, lang)
+        return "✅ Approved late, published immediately"
+
+    content_repo.publish(race_id, content_type, lang)
+    return "✅ Approved, but the race has already started: available in the menu, not broadcast"
+
+
+async def notify_admins_overdue(race_id: str, content_type: str, langs: list) -> None:
+    """Tell admins that the publish moment passed without approval."""
+    from f1bot.bot.app import create_application
+
+    try:
+        application = create_application()
+        text = (
+            f"⏰ {content_type} for {race_id} ({', '.join(l.upper() for l in langs)}) "
+            f"was not approved in time. Approving now will publish it immediately."
+        )
+        for admin_id in settings.admin_ids:
+            try:
+                await application.bot.send_message(chat_id=admin_id, text=text)
+            except Exception as e:
+                logger.error(f"Failed to notify admin {admin_id}: {e}")
+    except Exception as e:
+        logger.error(f"Error notifying admins: {e}")
@@ -0,0 +1,160 @@
+"""Job execution layer: runs blocking job stages off the event loop.
+
+Scheduled jobs are coroutines on the bot's event loop, but their stages
+(HTTP fetches, OpenAI calls, SQLAlchemy writes) are synchronous. Those
+stages go through ``run_blocking``, which executes them in a bounded thread
+pool with a per-job-type concurrency limit and timeout, and records how long
+each stage waited and ran.
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, TypeVar
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class JobLimit:
+    """Concurrency limit and timeout (seconds) for a job type."""
+
+    concurrency: int
+    timeout: float
+
+
+@dataclass
+class JobStats:
+    """Aggregated timings for a job type."""
+
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+JOB_LIMITS: Dict[str, JobLimit] = {
+    "db": JobLimit(concurrency=4, timeout=30.0),
+    "http": JobLimit(concurrency=4, timeout=60.0),
+    "llm": JobLimit(concurrency=2, timeout=settings.llm_deadline_seconds + 10.0),
+}
+DEFAULT_LIMIT = JobLimit(concurrency=2, timeout=60.0)
+
+_executor = ThreadPoolExecutor(max_workers=settings.job_pool_size, thread_name_prefix="job")
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+stats: Dict[str, JobStats] = {}
+loop_lag = {"last_ms": 0.0, "max_ms": 0.0}
+
+
+def _semaphore(job_type: str, limit: JobLimit) -> asyncio.Semaphore:
+    semaphore = _semaphores.get(job_type)
+    if semaphore is None:
+        semaphore = _semaphores[job_type] = asyncio.Semaphore(limit.concurrency)
+    return semaphore
+
+
+async def run_blocking(job_type: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable in the job pool under its job type's limits.
+
+    Raises asyncio.TimeoutError if the stage exceeds the job type's timeout
+    (the worker thread is left to finish on its own and keeps its slot until then).
+    """
+    limit = JOB_LIMITS.get(job_type, DEFAULT_LIMIT)
+    job_stats = stats.setdefault(job_type, JobStats())
+    enqueued_at = time.monotonic()
+    started_at = [enqueued_at]
+
+    def call() -> T:
+        started_at[0] = time.monotonic()
+        return fn(*args, **kwargs)
+
+    semaphore = _semaphore(job_type, limit)
+    await semaphore.acquire()
+    loop = asyncio.get_running_loop()
+    try:
+        worker = _executor.submit(call)
+    except BaseException:
+        semaphore.release()
+        raise
+    # The slot is held until the worker thread finishes, not until the caller
+    # stops waiting, so timed-out stages still count against the limit
+    worker.add_done_callback(lambda _: _release(loop, semaphore))
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(worker), timeout=limit.timeout)
+    except asyncio.TimeoutError:
+        job_stats.timeouts += 1
+        logger.error(f"Job stage {job_type}:{_name(fn)} timed out after {limit.timeout:.0f}s")
+        raise
+    except Exception:
+        job_stats.failures += 1
+        raise
+    finally:
+        finished_at = time.monotonic()
+        wait = started_at[0] - enqueued_at
+        duration = finished_at - started_at[0]
+        job_stats.runs += 1
+        job_stats.total_duration += duration
+        job_stats.max_duration = max(job_stats.max_duration, duration)
+        job_stats.total_wait += wait
+        job_stats.max_wait = max(job_stats.max_wait, wait)
+        logger.debug(f"Job stage {job_type}:{_name(fn)} waited {wait * 1000:.0f} ms, ran {duration * 1000:.0f} ms")
+
+
+def _release(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    """Give a job slot back from the worker thread (no-op once the loop is closed)."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        pass
+
+
+def _name(fn: Callable) -> str:
+    if isinstance(fn, functools.partial):
+        fn = fn.func
+    return getattr(fn, "__qualname__", repr(fn))
+
+
+async def monitor_loop_lag(interval: float = 0.5) -> None:
+    """Measure event loop lag forever; warns when a callback blocked the loop too long."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag_ms = max(0.0, (loop.time() - expected) * 1000)
+        loop_lag["last_ms"] = lag_ms
+        loop_lag["max_ms"] = max(loop_lag["max_ms"], lag_ms)
+        if lag_ms > settings.loop_lag_warn_ms:
+            logger.warning(f"Event loop lag {lag_ms:.0f} ms")
+
+
+def format_stats() -> str:
+    """Render job timings and loop lag for admins."""
+    lines = ["⚙️ Job stages\n"]
+    for job_type, s in sorted(stats.items()):
+        avg = s.total_duration / s.runs * 1000 if s.runs else 0.0
+        avg_wait = s.total_wait / s.runs * 1000 if s.runs else 0.0
+        lines.append(
+            f"{job_type}: {s.runs} runs, {s.failures} failed, {s.timeouts} timed out, "
+            f"avg {avg:.0f} ms / max {s.max_duration * 1000:.0f} ms, "
+            f"wait avg {avg_wait:.0f} ms / max {s.max_wait * 1000:.0f} ms"
+        )
+    if not stats:
+        lines.append("(no runs yet)")
+    lines.append(f"\nEvent loop lag: last {loop_lag['last_ms']:.1f} ms, max {loop_lag['max_ms']:.1f} ms")
+    return "\n".join(lines)
+
+
+def shutdown_runner() -> None:
+    """Stop accepting work and let running stages finish."""
+    _executor.shutdown(wait=False, cancel_futures=True)
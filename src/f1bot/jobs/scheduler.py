@@ -1,44 +1,230 @@
-"""Job scheduler."""
+"""Job scheduler.
 
+Jobs are derived from the races table: every race gets exact ``DateTrigger``
+jobs for its pre-race generation, pre-race publish, start and post-race
+moments. Jobs live in a database-backed job store, so timing state survives
+restarts, and are re-planned whenever the calendar changes.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from f1bot.config import settings
 from f1bot.logging import get_logger
+from f1bot.storage.db import engine
 
 logger = get_logger(__name__)
 
-scheduler = AsyncIOScheduler()
+scheduler = AsyncIOScheduler(
+    jobstores={"default": SQLAlchemyJobStore(engine=engine, tablename="apscheduler_jobs")},
+    job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": settings.scheduler_misfire_grace_seconds,
+    },
+    timezone=settings.timezone,
+)
+
+RACE_JOB_PREFIX = "race:"
+PLANNED_MOMENTS = ("pre_race_generate", "pre_race_publish", "start", "finish")
 
 
 def setup_scheduler() -> None:
     """Setup scheduler jobs (don't start yet)."""
-    from f1bot.jobs.pre_race import pre_race_job
-    from f1bot.jobs.post_race import post_race_job
-    
-    # Check for pre-race content every 10 minutes
+    # Full-season calendar sync (first run right after startup); re-plans race jobs on changes
+    scheduler.add_job(
+        "f1bot.jobs.calendar_sync:calendar_sync_job",
+        IntervalTrigger(hours=settings.calendar_sync_hours),
+        id="calendar_sync",
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
+    # Incremental news ingestion into news_items (first run right after startup)
     scheduler.add_job(
-        pre_race_job,
-        IntervalTrigger(minutes=10),
-        id="pre_race_check",
+        "f1bot.jobs.news_ingest:news_ingest_job",
+        IntervalTrigger(minutes=settings.news_ingest_minutes),
+        id="news_ingest",
         replace_existing=True,
+        next_run_time=datetime.now(timezone.utc),
     )
-    
-    # Check for post-race content every 30 minutes
+
+    # Fold appended bingo taps into per-user state snapshots
     scheduler.add_job(
-        post_race_job,
-        IntervalTrigger(minutes=30),
-        id="post_race_check",
+        "f1bot.jobs.bingo_compact:bingo_compact_job",
+        IntervalTrigger(seconds=settings.bingo_compact_seconds),
+        id="bingo_compact",
         replace_existing=True,
     )
-    
+
+    # Safety net: catch up on missed race transitions and re-plan race jobs
+    scheduler.add_job(
+        "f1bot.jobs.scheduler:refresh_race_schedule",
+        IntervalTrigger(hours=settings.schedule_refresh_hours),
+        id="refresh_race_schedule",
+        replace_existing=True,
+    )
+
     logger.info("Scheduler jobs configured")
 
 
+def race_moments(race: dict) -> dict:
+    """Scheduled moments of a race: job suffix -> (run_at, expires_at, func ref, args).
+
+    A moment that was missed (e.g. the bot was down) still runs as long as it
+    has not expired: generation is useful until the publish moment, publishing
+    until the start, and so on. Post-race generation is not planned here; it is
+    triggered by the race lifecycle when the race finishes.
+    """
+    from f1bot.jobs.publish import race_start_time, pre_race_publish_at
+
+    race_id = race["race_id"]
+    start_time = race_start_time(race)
+    publish_at = pre_race_publish_at(race)
+    finish_at = start_time + timedelta(hours=settings.race_duration_hours)
+    return {
+        "pre_race_generate": (
+            start_time - timedelta(hours=settings.pre_race_generate_ahead_hours),
+            publish_at,
+            "f1bot.jobs.pre_race:pre_race_job",
+            [race_id],
+        ),
+        "pre_race_publish": (
+            publish_at,
+            start_time,
+            "f1bot.jobs.publish:publish_job",
+            [race_id, "pre_race"],
+        ),
+        "start": (
+            start_time,
+            finish_at,
+            "f1bot.jobs.scheduler:race_lifecycle_job",
+            [],
+        ),
+        "finish": (
+            finish_at,
+            finish_at + timedelta(days=1),
+            "f1bot.jobs.scheduler:race_lifecycle_job",
+            [],
+        ),
+    }
+
+
+def race_job_id(race_id: str, moment: str) -> str:
+    """Scheduler job id for a race moment."""
+    if moment == "pre_race_publish":
+        # Shared with jobs.publish.schedule_publish so approvals don't double-schedule
+        from f1bot.jobs.publish import publish_job_id
+        return publish_job_id(race_id, "pre_race")
+    return f"{RACE_JOB_PREFIX}{race_id}:{moment}"
+
+
+def moment_pending(race: dict, moment: str) -> bool:
+    """Whether a race moment whose time has passed still has work left.
+
+    DateTrigger jobs leave the job store once they run, so a re-plan can't
+    tell a missed moment from an executed one by the job alone; the outcome
+    of the moment's work decides instead.
+    """
+    from f1bot.storage.repositories import ContentRepo
+    from f1bot.jobs.publish import LANGS
+
+    if moment == "start":
+        return race.get("status") == "upcoming"
+    if moment == "finish":
+        return race.get("status") in ("upcoming", "in_progress")
+
+    content_repo = ContentRepo()
+    statuses = [
+        (content or {}).get("status")
+        for content in (content_repo.fetch_by_race_type_lang(race["race_id"], "pre_race", lang) for lang in LANGS)
+    ]
+    if moment == "pre_race_generate":
+        return any(status in (None, "draft") for status in statuses)
+    # pre_race_publish: approved content still waiting to go out (not just overdue reminders)
+    return "approved" in statuses
+
+
+def plan_race_jobs() -> int:
+    """(Re)create DateTrigger jobs for all races that still have future moments.
+
+    A moment whose time has passed is only planned again while it still has
+    work left and its job is gone from the store (or is past the misfire
+    grace time, which the scheduler would drop), so executed moments don't
+    re-run on every re-plan and missed ones aren't lost. Jobs of races that disappeared from the
+    calendar are removed. Returns the number of jobs planned.
+    """
+    from f1bot.storage.repositories import RaceRepo
+    from f1bot.jobs.publish import publish_job_id
+
+    now = datetime.now(timezone.utc)
+    misfire_grace = timedelta(seconds=settings.scheduler_misfire_grace_seconds)
+    races = RaceRepo().get_races_since(now - timedelta(hours=settings.race_duration_hours, days=1))
+
+    planned_ids = set()
+    for race in races:
+        for moment, (run_at, expires_at, func, args) in race_moments(race).items():
+            if now >= expires_at:
+                continue
+            job_id = race_job_id(race["race_id"], moment)
+            if run_at <= now:
+                job = scheduler.get_job(job_id)
+                if job is not None and job.next_run_time and now - job.next_run_time <= misfire_grace:
+                    # Due and still within the misfire grace time: the scheduler will run it
+                    planned_ids.add(job_id)
+                    continue
+                # Past the grace time APScheduler would drop it as misfired: re-add for now if still needed
+                if not moment_pending(race, moment):
+                    continue
+            planned_ids.add(job_id)
+            scheduler.add_job(
+                func,
+                DateTrigger(run_date=max(run_at, now)),
+                args=args,
+                id=job_id,
+                replace_existing=True,
+            )
+
+    # Drop planned jobs of races that were removed or moved outside the planning window
+    for job in scheduler.get_jobs():
+        is_planned_job = (
+            job.id.startswith(RACE_JOB_PREFIX) and job.id.rsplit(":", 1)[-1] in PLANNED_MOMENTS
+        ) or job.id.startswith(publish_job_id("", "pre_race"))
+        if is_planned_job and job.id not in planned_ids:
+            scheduler.remove_job(job.id)
+            logger.info(f"Removed stale job {job.id}")
+
+    logger.info(f"Planned {len(planned_ids)} race jobs for {len(races)} races")
+    return len(planned_ids)
+
+
+async def refresh_race_schedule() -> None:
+    """Catch up on race transitions and re-plan race jobs."""
+    from f1bot.services.race_lifecycle import advance_statuses
+    from f1bot.jobs.runner import run_blocking
+
+    await run_blocking("db", advance_statuses)
+    await run_blocking("db", plan_race_jobs)
+
+
+async def race_lifecycle_job() -> None:
+    """Apply due race status transitions (scheduled at race start and finish moments)."""
+    from f1bot.services.race_lifecycle import advance_statuses
+    from f1bot.jobs.runner import run_blocking
+
+    await run_blocking("db", advance_statuses)
+
+
 async def start_scheduler() -> None:
     """Start scheduler (call this after event loop is running)."""
     if not scheduler.running:
         scheduler.start()
         logger.info("Scheduler started")
+        plan_race_jobs()
 
 
 def shutdown_scheduler() -> None:
@@ -6,6 +6,9 @@ from f1bot.bot.app import create_application
 from f1bot.logging import setup_logging, get_logger
 from f1bot.storage.db import init_db
 from f1bot.jobs.scheduler import setup_scheduler, start_scheduler, shutdown_scheduler
+from f1bot.services.llm_usage import recorder as usage_recorder
+from f1bot.jobs.runner import shutdown_runner
+from f1bot.services.http_cache import http_cache
 
 logger = get_logger(__name__)
 
@@ -32,6 +35,9 @@ def main() -> None:
         )
     finally:
         shutdown_scheduler()
+        usage_recorder.stop()
+        shutdown_runner()
+        http_cache.close()
 
 
 if __name__ == "__main__":
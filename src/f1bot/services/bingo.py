@@ -1,47 +1,54 @@
 """Bingo card generation service."""
 
 from typing import List, Dict
-from f1bot.services.llm import generate_bingo_meme_events
+from f1bot.domain.bingo import CELL_COUNT
+from f1bot.services.i18n import t
+from f1bot.services.llm import default_meme_events, generate_bingo_meme_events
+
+# Checkable events in every pool; titles are the bingo.event.<id> catalog keys
+HARD_EVENT_IDS = (
+    "safety_car",
+    "dnf",
+    "fastest_lap",
+    "pit_under_sc",
+    "team_radio_controversy",
+    "overtake",
+    "penalty",
+    "red_flag",
+    "pit_stop_mistake",
+    "crash",
+    "strategy_masterclass",
+    "last_lap_drama",
+)
 
 
 def generate_bingo_cells(race: Dict, context: Dict, lang: str) -> List[Dict]:
-    """Generate 16 bingo cells (10-12 hard + 4-6 meme)."""
-    # Hard checkable events (10-12) - multilingual
-    if lang == "ru":
-        hard_events = [
-            {"id": "safety_car", "title": "Safety Car", "type": "hard"},
-            {"id": "dnf", "title": "DNF", "type": "hard"},
-            {"id": "fastest_lap", "title": "Быстрейший круг", "type": "hard"},
-            {"id": "pit_under_sc", "title": "Пит-стоп под SC", "type": "hard"},
-            {"id": "team_radio_controversy", "title": "Скандал в радио", "type": "hard"},
-            {"id": "overtake", "title": "Зрелищный обгон", "type": "hard"},
-            {"id": "penalty", "title": "Штраф", "type": "hard"},
-            {"id": "red_flag", "title": "Красный флаг", "type": "hard"},
-            {"id": "pit_stop_mistake", "title": "Ошибка в пит-стопе", "type": "hard"},
-            {"id": "crash", "title": "Авария", "type": "hard"},
-            {"id": "strategy_masterclass", "title": "Мастер-класс стратегии", "type": "hard"},
-            {"id": "last_lap_drama", "title": "Драма на последнем круге", "type": "hard"},
-        ]
-    else:
-        hard_events = [
-            {"id": "safety_car", "title": "Safety Car", "type": "hard"},
-            {"id": "dnf", "title": "DNF", "type": "hard"},
-            {"id": "fastest_lap", "title": "Fastest Lap", "type": "hard"},
-            {"id": "pit_under_sc", "title": "Pit under SC", "type": "hard"},
-            {"id": "team_radio_controversy", "title": "Team Radio Controversy", "type": "hard"},
-            {"id": "overtake", "title": "Spectacular Overtake", "type": "hard"},
-            {"id": "penalty", "title": "Penalty", "type": "hard"},
-            {"id": "red_flag", "title": "Red Flag", "type": "hard"},
-            {"id": "pit_stop_mistake", "title": "Pit Stop Mistake", "type": "hard"},
-            {"id": "crash", "title": "Crash", "type": "hard"},
-            {"id": "strategy_masterclass", "title": "Strategy Masterclass", "type": "hard"},
-            {"id": "last_lap_drama", "title": "Last Lap Drama", "type": "hard"},
-        ]
+    """Generate the race's bingo event pool (12 hard + up to 6 meme).
+
+    Each player's card shows 16 cells of the pool, picked and shuffled by
+    their card seed (see domain.bingo.card_cells).
+    """
+    # Hard checkable events, titled from the locale catalog
+    hard_events = [
+        {"id": event_id, "title": t(f"bingo.event.{event_id}", lang), "type": "hard"}
+        for event_id in HARD_EVENT_IDS
+    ]
     
-    # Meme events (4-6) - generated by LLM
-    meme_events = generate_bingo_meme_events(race, context, lang)
+    # Meme events (4-6) - generated by LLM, separately per language: ids are
+    # prefixed with the language so verifying one never matches another pool's event
+    meme_events = generate_bingo_meme_events(race, context, lang)[:6]
     
-    # Combine: take 12 hard events and 4 meme events to get exactly 16
-    cells = hard_events[:12] + meme_events[:4]
+    # Pool: all hard events plus up to 6 meme events, topped up from the
+    # defaults to at least 16 cells (a smaller pool can't fill a card)
+    missing = CELL_COUNT - len(hard_events) - len(meme_events)
+    if missing > 0:
+        ids = {event["id"] for event in meme_events}
+        titles = {event["title"] for event in meme_events}
+        fallback = [
+            {**event, "id": event["id"] if event["id"] not in ids else f"default_{event['id']}"}
+            for event in default_meme_events(lang) if event["title"] not in titles
+        ]
+        meme_events += fallback[:missing]
     
-    return cells[:16]  # Ensure exactly 16
+    meme_events = [{**event, "id": f"{lang}_{event['id']}"} for event in meme_events]
+    return hard_events + meme_events
@@ -0,0 +1,172 @@
+"""Bingo analytics for admins.
+
+Every player's ticks for a race are loaded as one packed integer per player
+(bingo_scores.checked_mask, indexed by event pool position) and unpacked
+into a players x cells 0/1 matrix, so tick rates, the ticks-per-player
+distribution and cell correlations are a few NumPy reductions. Pools (and
+so mask positions) differ per language, so there is one report per language.
+"""
+
+import csv
+import io
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from f1bot.storage.repositories import BingoRepo
+
+# Correlated pairs listed in the summary (weaker pairs are noise)
+TOP_PAIRS = 5
+MIN_PAIR_CORRELATION = 0.1
+
+
+@dataclass
+class BingoReport:
+    """Aggregates for one race and language pool."""
+
+    race_id: str
+    lang: str
+    cells: List[Dict]
+    players: int
+    ticks: np.ndarray          # per cell
+    tick_rate: np.ndarray      # per cell, share of players
+    ticks_per_player: np.ndarray  # histogram, index = number of ticked cells
+    correlation: np.ndarray    # cell x cell Pearson r (0 where undefined)
+    verified: List[str]
+    lines: int                 # players with at least one line
+    minutes_to_line: Optional[float]  # median, from race start
+
+    def top_pairs(self, count: int = TOP_PAIRS) -> List[Tuple[int, int, float]]:
+        """Most positively correlated distinct cell pairs."""
+        upper = np.triu(self.correlation, k=1)
+        flat = np.argsort(upper, axis=None)[::-1][:count]
+        pairs = []
+        for index in flat:
+            i, j = np.unravel_index(index, upper.shape)
+            if upper[i, j] < MIN_PAIR_CORRELATION:
+                break
+            pairs.append((int(i), int(j), float(upper[i, j])))
+        return pairs
+
+
+def unpack_masks(masks: np.ndarray, width: int) -> np.ndarray:
+    """players x width matrix of 0/1 ticks from packed masks."""
+    shifts = np.arange(width, dtype=np.int64)
+    return ((masks[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+def _race_start(race: Dict) -> datetime:
+    start_time = race["start_time_utc"]
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time
+
+
+def build_report(race: Dict, lang: str) -> Optional[BingoReport]:
+    """Compute the report for a race's players of one language (None when that language has no pool)."""
+    bingo_repo = BingoRepo()
+    race_id = race["race_id"]
+    cells = bingo_repo.get_template(race_id, lang)
+    if not cells:
+        return None
+    rows = bingo_repo.get_checked_masks(race_id, lang)
+    width = len(cells)
+
+    masks = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    bits = unpack_masks(masks, width)
+    players = len(masks)
+
+    ticks = bits.sum(axis=0, dtype=np.int64)
+    tick_rate = ticks / players if players else np.zeros(width)
+    ticks_per_player = np.bincount(bits.sum(axis=1), minlength=width + 1)
+
+    # Pearson r via the covariance of the 0/1 columns; constant columns get 0
+    if players > 1:
+        centered = bits - tick_rate.astype(np.float32)
+        covariance = centered.T @ centered / players
+        std = np.sqrt(np.diag(covariance))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = np.nan_to_num(covariance / np.outer(std, std))
+    else:
+        correlation = np.zeros((width, width))
+
+    line_times = np.array([row[1] for row in rows if row[1] is not None], dtype=np.float64)
+    minutes_to_line = None
+    if len(line_times):
+        minutes_to_line = float(np.median(line_times - _race_start(race).timestamp()) / 60)
+
+    return BingoReport(
+        race_id=race_id,
+        lang=lang,
+        cells=cells,
+        players=players,
+        ticks=ticks,
+        tick_rate=tick_rate,
+        ticks_per_player=ticks_per_player,
+        correlation=correlation,
+        verified=sorted(bingo_repo.get_verified_cells(race_id)),
+        lines=len(line_times),
+        minutes_to_line=minutes_to_line,
+    )
+
+
+def format_report(report: BingoReport, race_name: str) -> str:
+    """Summary message for the admin chat."""
+    lines = [f"📈 Bingo analytics — {race_name} ({report.lang})", f"Players: {report.players}"]
+    if not report.players:
+        return "\n".join(lines)
+
+    per_player = report.ticks_per_player
+    mean = float(per_player @ np.arange(len(per_player))) / report.players
+    median = int(np.searchsorted(np.cumsum(per_player), report.players / 2))
+    lines.append(f"Ticks per player: mean {mean:.1f}, median {median}")
+    line_text = f"With a line: {report.lines} ({report.lines / report.players:.0%})"
+    if report.minutes_to_line is not None:
+        line_text += f", median {report.minutes_to_line:+.0f} min from start"
+    lines.append(line_text)
+
+    lines.append("\nMost ticked:")
+    order = np.argsort(report.tick_rate)[::-1]
+    for i in order[:5]:
+        star = " 🌟" if report.cells[i]["id"] in report.verified else ""
+        lines.append(f"  {report.cells[i]['title']}: {report.tick_rate[i]:.0%}{star}")
+    lines.append("Least ticked:")
+    for i in order[::-1][:3]:
+        lines.append(f"  {report.cells[i]['title']}: {report.tick_rate[i]:.0%}")
+
+    pairs = report.top_pairs()
+    if pairs:
+        lines.append("\nTicked together:")
+        for i, j, r in pairs:
+            lines.append(f"  {report.cells[i]['title']} + {report.cells[j]['title']}: r={r:.2f}")
+
+    distribution = ", ".join(f"{n}:{count}" for n, count in enumerate(per_player) if count)
+    lines.append(f"\nDistribution (ticks:players): {distribution}")
+    return "\n".join(lines)
+
+
+def report_csv(report: BingoReport) -> bytes:
+    """Per-cell CSV export: tick counts, rates and the most correlated cell."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["position", "cell_id", "title", "type", "verified", "ticks", "tick_rate", "most_correlated", "r"])
+    correlation = report.correlation.copy()
+    np.fill_diagonal(correlation, -np.inf)
+    for i, cell in enumerate(report.cells):
+        j = int(np.argmax(correlation[i])) if len(report.cells) > 1 else i
+        writer.writerow([
+            i,
+            cell["id"],
+            cell["title"],
+            cell.get("type", ""),
+            int(cell["id"] in report.verified),
+            int(report.ticks[i]),
+            f"{report.tick_rate[i]:.4f}",
+            report.cells[j]["id"] if j != i else "",
+            f"{report.correlation[i, j]:.4f}" if j != i else "",
+        ])
+    return output.getvalue().encode("utf-8")
@@ -1,70 +1,110 @@
 """F1 calendar service."""
 
+import io
+import itertools
 import json
-from datetime import datetime
-from typing import Optional, Dict, Any
-from zoneinfo import ZoneInfo
-import httpx
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from f1bot.config import settings
-from f1bot.domain.models import Race
 from f1bot.logging import get_logger
+from f1bot.services.http_cache import http_cache
+from f1bot.services.race_timeline import race_timeline
 
 logger = get_logger(__name__)
 
+# VEVENT properties the ICS parser keeps
+ICS_PROPERTIES = {"DTSTART", "SUMMARY", "LOCATION", "UID"}
+_ICS_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+
+
+def initial_status(start_time: datetime, now: Optional[datetime] = None) -> str:
+    """Status for a race first seen in a calendar: races that are already over are stored as finished.
+
+    Otherwise a first sync would walk every past race of the season through
+    the lifecycle (bingo closure, post-race generation) months late.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if start_time + timedelta(hours=settings.race_duration_hours) <= now:
+        return "finished"
+    return "upcoming"
+
 
 def get_next_race(now: Optional[datetime] = None, tz: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """Get the next upcoming race."""
+    """Get the next upcoming race (from the in-memory timeline)."""
     if now is None:
         now = datetime.now(ZoneInfo(tz or settings.timezone))
     
-    if not settings.f1_calendar_source:
-        logger.debug("No F1 calendar source configured")
-        return None
-    
     try:
-        races = _fetch_calendar()
-        if not races:
-            return None
-        
-        # Find next race
-        for race in races:
-            start_time = _parse_race_time(race)
-            if start_time and start_time > now:
-                return {
-                    "race_id": race.get("id", race.get("raceId", "")),
-                    "name": race.get("name", race.get("raceName", "")),
-                    "start_time_utc": start_time,
-                    "status": "upcoming",
-                    "meta_json": {
-                        "track": race.get("track", race.get("circuit", {}).get("name", "")),
-                        "location": race.get("location", race.get("circuit", {}).get("location", "")),
-                        "country": race.get("country", race.get("circuit", {}).get("country", "")),
-                    }
-                }
+        return race_timeline.get().next_race(now)
     except Exception as e:
-        logger.error(f"Error fetching calendar: {e}")
+        logger.error(f"Error looking up next race: {e}")
     
     return None
 
 
-def _fetch_calendar() -> list:
-    """Fetch calendar from configured source."""
+def fetch_season() -> List[Dict[str, Any]]:
+    """Fetch the whole calendar as normalised race dicts, ordered by start time."""
+    races = _fetch_calendar()
+    races.sort(key=lambda r: r["start_time_utc"])
+    return races
+
+
+def _derive_race_id(name: str, start_time: datetime) -> str:
+    """Stable ID for sources without one: date plus a slug of the name."""
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    return f"{start_time:%Y%m%d}-{slug}" if slug else f"{start_time:%Y%m%d%H%M}"
+
+
+def _normalize_race(race: dict) -> Optional[Dict[str, Any]]:
+    """Convert a raw JSON calendar entry into the races table shape."""
+    start_time = _parse_race_time(race)
+    if not start_time:
+        return None
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    
+    name = race.get("name", race.get("raceName", ""))
+    circuit = race.get("circuit", {}) if isinstance(race.get("circuit"), dict) else {}
+    race_id = str(race.get("id", race.get("raceId", "")) or "") or _derive_race_id(name, start_time)
+    
+    return {
+        "race_id": race_id,
+        "name": name,
+        "start_time_utc": start_time,
+        "status": initial_status(start_time),
+        "meta_json": {
+            "track": race.get("track", circuit.get("name", "")),
+            "location": race.get("location", circuit.get("location", "")),
+            "country": race.get("country", circuit.get("country", "")),
+        }
+    }
+
+
+def _fetch_calendar() -> List[Dict[str, Any]]:
+    """Fetch calendar from configured source as normalised race dicts."""
     if not settings.f1_calendar_source:
         return []
     
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(settings.f1_calendar_source)
-            response.raise_for_status()
-            
-            # Try JSON first
-            try:
-                data = response.json()
-                return _parse_json_calendar(data)
-            except (json.JSONDecodeError, ValueError):
-                # Try ICS format (basic parsing)
-                return _parse_ics_calendar(response.text)
+        response = http_cache.get(settings.f1_calendar_source)
+        
+        # Try JSON first
+        try:
+            data = response.json()
+        except (json.JSONDecodeError, ValueError):
+            # ICS format
+            return list(_iter_ics_races(io.StringIO(response.text)))
+        races = []
+        for raw in _parse_json_calendar(data):
+            race = _normalize_race(raw) if isinstance(raw, dict) else None
+            if race:
+                races.append(race)
+        return races
     except Exception as e:
         logger.error(f"Error fetching calendar from {settings.f1_calendar_source}: {e}")
         return []
@@ -90,36 +130,125 @@ def _parse_json_calendar(data: dict) -> list:
     return races
 
 
-def _parse_ics_calendar(ics_content: str) -> list:
-    """Basic ICS calendar parsing."""
-    races = []
+def _iter_ics_races(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Single-pass ICS parser yielding normalised race dicts.
+
+    Unfolds RFC 5545 continuation lines as it goes, resolves ``TZID``
+    parameters via ZoneInfo (``Z`` suffix means UTC, floating times are taken
+    as UTC) and uses the event's ``UID`` as the race id. Properties of nested
+    components (e.g. VALARM) are ignored.
+    """
+    event: Optional[Dict[str, Any]] = None
+    depth = 0
+    pending = ""
     
-    try:
-        import re
-        # Extract VEVENT blocks
-        events = re.findall(r'BEGIN:VEVENT(.*?)END:VEVENT', ics_content, re.DOTALL)
+    for raw_line in itertools.chain(lines, [""]):
+        raw_line = raw_line.rstrip("\r\n")
+        if raw_line[:1] in (" ", "\t"):
+            # Folded continuation of the previous line
+            pending += raw_line[1:]
+            continue
+        line, pending = pending, raw_line
+        if not line:
+            continue
         
-        for event in events:
-            race = {}
-            # Extract DTSTART
-            dtstart_match = re.search(r'DTSTART[^:]*:(.*)', event)
-            if dtstart_match:
-                race["start_time"] = dtstart_match.group(1).strip()
-            # Extract SUMMARY
-            summary_match = re.search(r'SUMMARY:(.*)', event)
-            if summary_match:
-                race["name"] = summary_match.group(1).strip()
-            # Extract LOCATION
-            location_match = re.search(r'LOCATION:(.*)', event)
-            if location_match:
-                race["location"] = location_match.group(1).strip()
-            
-            if race:
-                races.append(race)
-    except Exception as e:
-        logger.error(f"Error parsing ICS calendar: {e}")
+        name_params, value = _split_content_line(line)
+        name, *params = name_params.split(";")
+        name = name.upper()
+        
+        if name == "BEGIN":
+            if value.upper() == "VEVENT":
+                event, depth = {}, 0
+            elif event is not None:
+                depth += 1
+        elif name == "END":
+            if event is not None and value.upper() == "VEVENT":
+                race = _ics_event_to_race(event)
+                if race:
+                    yield race
+                event = None
+            elif event is not None:
+                depth -= 1
+        elif event is not None and depth == 0 and name in ICS_PROPERTIES:
+            event[name] = (value, params)
+
+
+def _split_content_line(line: str):
+    """Split "NAME;PARAMS:VALUE" on the first colon outside quoted parameter values."""
+    colon = line.find(":")
+    quote = line.find('"')
+    while quote != -1 and quote < colon:
+        closing = line.find('"', quote + 1)
+        if closing == -1:
+            break
+        colon = line.find(":", closing)
+        quote = line.find('"', closing + 1)
+    if colon == -1:
+        return line, ""
+    return line[:colon], line[colon + 1:]
+
+
+def _ics_event_to_race(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build a race dict from a VEVENT's collected properties."""
+    if "DTSTART" not in event:
+        return None
+    start_time = _parse_ics_datetime(*event["DTSTART"])
+    if not start_time:
+        return None
     
-    return races
+    name = _ics_text(event.get("SUMMARY", ("", []))[0])
+    location = _ics_text(event.get("LOCATION", ("", []))[0])
+    uid = event.get("UID", ("", []))[0].strip()
+    return {
+        "race_id": uid or _derive_race_id(name, start_time),
+        "name": name,
+        "start_time_utc": start_time,
+        "status": initial_status(start_time),
+        "meta_json": {
+            "track": "",
+            "location": location,
+            "country": location.rsplit(",", 1)[-1].strip() if "," in location else "",
+        }
+    }
+
+
+def _parse_ics_datetime(value: str, params: List[str]) -> Optional[datetime]:
+    """Parse a DTSTART value (DATE or DATE-TIME, UTC, TZID or floating) into aware UTC."""
+    value = value.strip()
+    options = dict(p.split("=", 1) for p in params if "=" in p)
+    try:
+        # Fixed-width basic format; slicing is much cheaper than strptime
+        date = (int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        if options.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+            return datetime(*date, tzinfo=timezone.utc)
+        if value[8:9] != "T" or len(value) not in (15, 16):
+            raise ValueError(value)
+        clock = (int(value[9:11]), int(value[11:13]), int(value[13:15]))
+        if value.endswith("Z"):
+            return datetime(*date, *clock, tzinfo=timezone.utc)
+        local = datetime(*date, *clock)
+    except ValueError:
+        logger.warning(f"Unparseable ICS DTSTART {value!r}")
+        return None
+    
+    tzid = options.get("TZID", "").strip('"')
+    tz = _ics_zone(tzid) if tzid else timezone.utc
+    return local.replace(tzinfo=tz).astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=64)
+def _ics_zone(tzid: str):
+    """Resolve a TZID to a zone (unknown ids fall back to UTC)."""
+    try:
+        return ZoneInfo(tzid)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown ICS TZID {tzid!r}, assuming UTC")
+        return timezone.utc
+
+
+def _ics_text(value: str) -> str:
+    """Unescape an ICS TEXT value."""
+    return _ICS_ESCAPE_RE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value).strip()
 
 
 def _parse_race_time(race: dict) -> Optional[datetime]:
@@ -152,14 +281,7 @@ def is_race_weekend(now: Optional[datetime] = None) -> bool:
         now = datetime.now(ZoneInfo(settings.timezone))
     
     try:
-        races = _fetch_calendar()
-        for race in races:
-            start_time = _parse_race_time(race)
-            if start_time:
-                # Check if within 3 days of race
-                days_diff = (start_time - now).days
-                if -1 <= days_diff <= 1:
-                    return True
+        return race_timeline.get().current_weekend(now) is not None
     except Exception as e:
         logger.error(f"Error checking race weekend: {e}")
     
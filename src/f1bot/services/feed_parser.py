@@ -0,0 +1,129 @@
+"""Streaming RSS/Atom parser.
+
+Feeds are parsed incrementally with ``XMLPullParser`` as byte chunks arrive,
+so the whole document never has to be in memory. Fields are collected per
+``<item>``/``<entry>`` element (a channel's own title or link can't be paired
+with an item), finished items are detached from the tree right away, and
+parsing stops as soon as ``limit`` items have been collected.
+"""
+
+import html
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional
+
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+ITEM_TAGS = {"item", "entry"}
+FEED_TAGS = {"channel", "feed"}
+SUMMARY_TAGS = ("description", "summary", "content", "encoded")
+DATE_TAGS = ("pubDate", "published", "updated", "date")
+MAX_SUMMARY_CHARS = 500
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _clean(value: Optional[str]) -> str:
+    """Strip markup and entities from a text node (summaries often carry HTML)."""
+    if not value:
+        return ""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", value))).strip()
+
+
+class FeedParser:
+    """Incremental RSS/Atom parser; feed it byte chunks until ``done``."""
+
+    def __init__(self, limit: int, default_source: str = "RSS Feed") -> None:
+        self.limit = limit
+        self.items: List[Dict[str, str]] = []
+        self.source = ""
+        self.default_source = default_source
+        self.done = False
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse a chunk; returns True once ``limit`` items are collected (or the feed is broken)."""
+        if self.done:
+            return True
+        try:
+            self._parser.feed(chunk)
+            self._drain()
+        except ET.ParseError as e:
+            # Keep what was parsed before the error
+            logger.warning(f"Feed parse error after {len(self.items)} items: {e}")
+            self.done = True
+        return self.done
+
+    def close(self) -> List[Dict[str, str]]:
+        """Finish parsing and return the collected items."""
+        if not self.done:
+            try:
+                self._parser.close()
+                self._drain()
+            except ET.ParseError as e:
+                logger.warning(f"Feed parse error after {len(self.items)} items: {e}")
+            self.done = True
+        return self.items
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            tag = _local(elem.tag)
+            if tag in ITEM_TAGS:
+                item = self._item(elem)
+                if item["title"]:
+                    self.items.append(item)
+                # Detach the finished item so memory stays bounded on large feeds
+                if self._stack:
+                    self._stack[-1].remove(elem)
+                if len(self.items) >= self.limit:
+                    self.done = True
+                    return
+            elif tag == "title" and not self.source and self._stack and _local(self._stack[-1].tag) in FEED_TAGS:
+                self.source = _clean(elem.text)
+
+    def _item(self, elem: ET.Element) -> Dict[str, str]:
+        fields: Dict[str, str] = {}
+        link = ""
+        for child in elem:
+            tag = _local(child.tag)
+            if tag == "link":
+                # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+                href = child.get("href")
+                if href is None:
+                    link = link or (child.text or "").strip()
+                elif child.get("rel", "alternate") == "alternate" or not link:
+                    link = href.strip()
+            elif tag not in fields:
+                fields[tag] = child.text or ""
+
+        summary = next((fields[t] for t in SUMMARY_TAGS if fields.get(t)), "")
+        return {
+            "title": _clean(fields.get("title")),
+            "summary": _clean(summary)[:MAX_SUMMARY_CHARS],
+            "source": self.source or self.default_source,
+            "published_at": next((fields[t].strip() for t in DATE_TAGS if fields.get(t)), ""),
+            "url": link or (fields.get("guid") or fields.get("id") or "").strip(),
+        }
+
+
+def parse_feed(chunks: Iterable[bytes], limit: int) -> List[Dict[str, str]]:
+    """Parse an RSS/Atom feed from an iterable of byte chunks, stopping after ``limit`` items."""
+    parser = FeedParser(limit)
+    for chunk in chunks:
+        if parser.feed(chunk):
+            break
+    return parser.close()
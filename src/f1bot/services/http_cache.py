@@ -0,0 +1,223 @@
+"""Shared HTTP fetch cache with conditional GET support.
+
+Bodies and validators (ETag / Last-Modified) are stored on disk. A cached
+response is reused without any request while it is fresh (``Cache-Control:
+max-age`` or the configured minimum refresh interval, whichever is longer);
+after that a conditional request is sent, so unchanged sources cost a 304.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_CHARSET_RE = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """Body of a (possibly cached) response."""
+
+    url: str
+    content: bytes
+    status_code: int  # 200 (fresh download) or 304 (revalidated)
+    from_cache: bool  # True if the body came from disk
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        match = _CHARSET_RE.search(self.headers.get("content-type", ""))
+        encoding = match.group(1) if match else "utf-8"
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def _cache_policy(headers: httpx.Headers) -> Dict[str, Any]:
+    """Extract storability and max-age from Cache-Control."""
+    cache_control = headers.get("cache-control", "").lower()
+    match = _MAX_AGE_RE.search(cache_control)
+    return {
+        "no_store": "no-store" in cache_control,
+        "no_cache": "no-cache" in cache_control,
+        "max_age": int(match.group(1)) if match else 0,
+    }
+
+
+class HttpCache:
+    """On-disk conditional GET cache shared by the calendar and news services."""
+
+    def __init__(self, cache_dir: str, min_refresh_seconds: float, timeout: float = 10.0) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.min_refresh_seconds = min_refresh_seconds
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled client, created on first use."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout, follow_redirects=True)
+        return self._client
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+
+    def load_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored validators and timestamps for url, if a body is cached."""
+        body_path, meta_path = self._paths(url)
+        if not (body_path.exists() and meta_path.exists()):
+            return None
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, meta: Dict[str, Any], min_refresh: Optional[float] = None) -> bool:
+        """True if the cached body may be used without any request."""
+        if meta.get("no_cache"):
+            return False
+        min_refresh = self.min_refresh_seconds if min_refresh is None else min_refresh
+        ttl = max(min_refresh, meta.get("max_age", 0))
+        return time.time() < meta.get("fetched_at", 0) + ttl
+
+    def conditional_headers(self, meta: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Validators to send with a revalidation request."""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def read_body(self, url: str) -> bytes:
+        body_path, _ = self._paths(url)
+        return body_path.read_bytes()
+
+    def body_path(self, url: str) -> Path:
+        body_path, _ = self._paths(url)
+        return body_path
+
+    def store(self, url: str, response: httpx.Response, content: Optional[bytes] = None) -> None:
+        """Persist a 200 response body and its validators (unless no-store)."""
+        if _cache_policy(response.headers)["no_store"]:
+            return
+        body_path, _ = self._paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(body_path, response.content if content is None else content)
+        self._write_meta(url, response)
+
+    def temp_body_path(self, url: str) -> Path:
+        """Scratch file for streaming a body to disk; pass it to ``commit_body``."""
+        body_path, _ = self._paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return body_path.with_suffix(f".body.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    def commit_body(self, url: str, response: httpx.Response, tmp_path: Path) -> None:
+        """Move a fully streamed body into the cache together with its validators."""
+        if _cache_policy(response.headers)["no_store"]:
+            tmp_path.unlink(missing_ok=True)
+            return
+        os.replace(tmp_path, self.body_path(url))
+        self._write_meta(url, response)
+
+    def _write_meta(self, url: str, response: httpx.Response) -> None:
+        _, meta_path = self._paths(url)
+        policy = _cache_policy(response.headers)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_type": response.headers.get("content-type", ""),
+            "fetched_at": time.time(),
+            "max_age": policy["max_age"],
+            "no_cache": policy["no_cache"],
+        }
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    def touch(self, url: str, meta: Dict[str, Any], response: httpx.Response) -> None:
+        """Refresh timestamps (and max-age) after a 304."""
+        _, meta_path = self._paths(url)
+        policy = _cache_policy(response.headers)
+        meta.update(fetched_at=time.time(), max_age=policy["max_age"], no_cache=policy["no_cache"])
+        if response.headers.get("etag"):
+            meta["etag"] = response.headers["etag"]
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _cached(self, url: str, meta: Dict[str, Any], status_code: int) -> CachedResponse:
+        return CachedResponse(
+            url=url,
+            content=self.read_body(url),
+            status_code=status_code,
+            from_cache=True,
+            headers={"content-type": meta.get("content_type", "")},
+        )
+
+    def get(self, url: str, min_refresh: Optional[float] = None) -> CachedResponse:
+        """Fetch url through the cache.
+
+        Fresh entries are served from disk without a request; stale ones are
+        revalidated. If the request fails and a cached body exists, the stale
+        body is returned instead of raising.
+        """
+        meta = self.load_meta(url)
+        if meta and self.is_fresh(meta, min_refresh):
+            return self._cached(url, meta, 200)
+
+        try:
+            response = self.client.get(url, headers=self.conditional_headers(meta))
+            if response.status_code == 304 and meta:
+                self.touch(url, meta, response)
+                return self._cached(url, meta, 304)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if meta:
+                logger.warning(f"Fetching {url} failed ({e}), using stale cached copy")
+                return self._cached(url, meta, 200)
+            raise
+
+        self.store(url, response)
+        return CachedResponse(
+            url=url,
+            content=response.content,
+            status_code=response.status_code,
+            from_cache=False,
+            headers={"content-type": response.headers.get("content-type", "")},
+        )
+
+    def close(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+# Global cache instance
+http_cache = HttpCache(settings.http_cache_dir, settings.http_min_refresh_seconds)
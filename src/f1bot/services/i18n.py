@@ -1,50 +1,78 @@
-"""Internationalization service."""
-
-from typing import Dict
-
-# Translation keys
-TRANSLATIONS: Dict[str, Dict[str, str]] = {
-    "ru": {
-        "menu.welcome": "🏎️ Добро пожаловать в F1 Bot!\n\nВыберите действие:",
-        "menu.pre_race": "📋 F1 in 60 Seconds",
-        "menu.bingo": "🎯 Bingo Cards",
-        "menu.post_race": "🏁 Race Result in 60 Seconds",
-        "menu.language": "🌐 Язык",
-        "menu.pre_race_coming_soon": "Скоро здесь будет превью гонки!",
-        "menu.bingo_coming_soon": "Скоро здесь будут Bingo Cards!",
-        "menu.post_race_coming_soon": "Скоро здесь будут итоги гонки!",
-        "menu.back": "🔙 Назад",
-        "bingo.title": "🎯 Bingo Cards\n\nГонка: {race_name}\n\nОтмечайте события во время гонки:",
-        "bingo.finish": "✅ Завершить ({count}/{total})",
-        "bingo.finish_result": "🎉 Bingo завершён!\n\nЗакрашено: {checked} из {total} клеток\nГонка: {race_name}",
-        "bingo.no_race": "❌ Нет предстоящих гонок",
-    },
-    "en": {
-        "menu.welcome": "🏎️ Welcome to F1 Bot!\n\nChoose an action:",
-        "menu.pre_race": "📋 F1 in 60 Seconds",
-        "menu.bingo": "🎯 Bingo Cards",
-        "menu.post_race": "🏁 Race Result in 60 Seconds",
-        "menu.language": "🌐 Language",
-        "menu.pre_race_coming_soon": "Pre-race preview coming soon!",
-        "menu.bingo_coming_soon": "Bingo Cards coming soon!",
-        "menu.post_race_coming_soon": "Race results coming soon!",
-        "menu.back": "🔙 Back",
-        "bingo.title": "🎯 Bingo Cards\n\nRace: {race_name}\n\nMark events during the race:",
-        "bingo.finish": "✅ Finish ({count}/{total})",
-        "bingo.finish_result": "🎉 Bingo completed!\n\nMarked: {checked} out of {total} cells\nRace: {race_name}",
-        "bingo.no_race": "❌ No upcoming races",
-    },
-}
-
-
-def t(key: str, lang: str = "ru", **kwargs) -> str:
-    """Translate a key to the specified language."""
-    translations = TRANSLATIONS.get(lang, TRANSLATIONS["ru"])
-    text = translations.get(key, key)
-    
-    # Simple placeholder replacement
-    if kwargs:
-        for k, v in kwargs.items():
-            text = text.replace(f"{{{k}}}", str(v))
-    
-    return text
+"""Internationalization service.
+
+Translations live in ``f1bot/locales/<lang>.json`` and are compiled once at
+import into per-language tables of parsed templates. Keys missing from a
+language fall back to the default language at compile time, so a lookup is
+one dict access and adding a language costs nothing per request.
+"""
+
+import json
+import string
+from importlib import resources
+from typing import Dict, Tuple
+
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LANG = "ru"
+
+
+class Template:
+    """A translated string with its placeholders parsed up front."""
+
+    __slots__ = ("text", "fields")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.fields: Tuple[str, ...] = tuple(
+            field for _, field, _, _ in string.Formatter().parse(text) if field
+        )
+
+    def render(self, kwargs: Dict[str, object]) -> str:
+        if not self.fields or not kwargs:
+            return self.text
+        return self.text.format_map(kwargs)
+
+
+def _load_catalog() -> Dict[str, Dict[str, str]]:
+    """Read every locales/*.json file shipped with the package."""
+    catalog = {}
+    for entry in resources.files("f1bot").joinpath("locales").iterdir():
+        if entry.name.endswith(".json"):
+            catalog[entry.name[:-len(".json")]] = json.loads(entry.read_text(encoding="utf-8"))
+    return catalog
+
+
+def _compile(catalog: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, Template]]:
+    """Parse all strings; fill each language's gaps from the default language."""
+    default = {key: Template(text) for key, text in catalog[DEFAULT_LANG].items()}
+    compiled = {DEFAULT_LANG: default}
+    for lang, strings in catalog.items():
+        if lang == DEFAULT_LANG:
+            continue
+        table = dict(default)
+        for key, text in strings.items():
+            template = Template(text)
+            if key in default and set(template.fields) != set(default[key].fields):
+                logger.warning(f"i18n: {lang}:{key} placeholders {template.fields} differ from {DEFAULT_LANG}")
+            table[key] = template
+        missing = default.keys() - strings.keys()
+        if missing:
+            logger.warning(f"i18n: {lang} falls back to {DEFAULT_LANG} for {sorted(missing)}")
+        compiled[lang] = table
+    return compiled
+
+
+TEMPLATES = _compile(_load_catalog())
+
+# Languages in picker order: the default first, then the rest alphabetically
+LANGUAGES: Tuple[str, ...] = (DEFAULT_LANG,) + tuple(sorted(lang for lang in TEMPLATES if lang != DEFAULT_LANG))
+
+
+def t(key: str, lang: str = DEFAULT_LANG, **kwargs) -> str:
+    """Translate a key to the specified language, filling its placeholders from kwargs."""
+    template = TEMPLATES.get(lang, TEMPLATES[DEFAULT_LANG]).get(key)
+    if template is None:
+        return key
+    return template.render(kwargs)
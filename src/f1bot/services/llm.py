@@ -1,24 +1,143 @@
 """LLM service for content generation."""
 
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional
+import openai
 from openai import OpenAI
 
 from f1bot.config import settings
 from f1bot.logging import get_logger
+from f1bot.services.llm_usage import recorder as usage_recorder
+from f1bot.services.prompt_context import build_context, news_snippets
+from f1bot.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    call_resilient,
+)
 
 logger = get_logger(__name__)
 
-client = OpenAI(api_key=settings.openai_api_key)
+# Retries are handled by call_resilient, so the SDK's own retry loop is disabled
+client = OpenAI(
+    api_key=settings.openai_api_key,
+    base_url=settings.openai_base_url or None,
+    timeout=settings.llm_attempt_timeout_seconds,
+    max_retries=0,
+)
+
+breaker = CircuitBreaker(
+    failure_threshold=settings.llm_breaker_failures,
+    reset_timeout=settings.llm_breaker_reset_seconds,
+)
+
+# Transient provider failures worth retrying (and counting against the breaker)
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    TimeoutError,
+)
+
+SYSTEM_PROMPT = "You are a Gen Z F1 content creator. Be concise, engaging, and authentic."
+
+
+class LLMUnavailableError(Exception):
+    """Raised when no completion could be produced (provider down, deadline, empty answer)."""
+
+
+def _complete(
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    *,
+    content_type: str,
+    race_id: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> str:
+    """Run a chat completion through the resilience layer and return the stripped text.
+
+    Every call is recorded (tokens, latency, outcome) in the llm_calls table.
+    """
+    usage: Dict[str, int] = {"attempts": 0}
+
+    def attempt(timeout: float) -> str:
+        usage["attempts"] += 1
+        response = client.with_options(timeout=timeout).chat.completions.create(
+            model=settings.openai_model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        if response.usage:
+            usage["prompt_tokens"] = response.usage.prompt_tokens or 0
+            usage["completion_tokens"] = response.usage.completion_tokens or 0
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            usage["cached_tokens"] = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+        content = response.choices[0].message.content
+        if not content or not content.strip():
+            raise LLMUnavailableError("Empty completion")
+        return content.strip()
+
+    started = time.monotonic()
+    outcome = "error"
+    try:
+        result = call_resilient(
+            attempt,
+            deadline=settings.llm_deadline_seconds,
+            attempt_timeout=settings.llm_attempt_timeout_seconds,
+            max_attempts=settings.llm_max_attempts,
+            retry_on=RETRYABLE_ERRORS,
+            breaker=breaker,
+            hedge_after=settings.llm_hedge_after_seconds or None,
+        )
+        outcome = "ok"
+        return result
+    except LLMUnavailableError:
+        outcome = "empty"
+        raise
+    except CircuitOpenError as e:
+        outcome = "circuit_open"
+        raise LLMUnavailableError(f"{type(e).__name__}: {e}") from e
+    except (DeadlineExceededError, openai.APITimeoutError, TimeoutError) as e:
+        outcome = "timeout"
+        raise LLMUnavailableError(f"{type(e).__name__}: {e}") from e
+    except openai.OpenAIError as e:
+        raise LLMUnavailableError(f"{type(e).__name__}: {e}") from e
+    finally:
+        usage_recorder.record(
+            content_type=content_type,
+            race_id=race_id,
+            lang=lang,
+            model=settings.openai_model,
+            latency_ms=int((time.monotonic() - started) * 1000),
+            outcome=outcome,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached_tokens=usage.get("cached_tokens", 0),
+            attempts=usage["attempts"],
+        )
+
+
+def localize_prompt(prompt: str, lang: str) -> str:
+    """Catalog languages without a prompt of their own get the English one plus an output-language line."""
+    if lang in ("ru", "en"):
+        return prompt
+    return f"Write all output text in the language with ISO 639-1 code '{lang}'.\n\n{prompt}"
 
 
 def generate_pre_race(race: Dict, news_context: List[Dict], lang: str) -> str:
-    """Generate pre-race content (5-7 bullets)."""
+    """Generate pre-race content (5-7 bullets).
+
+    Raises LLMUnavailableError if the provider could not produce a completion.
+    """
     logger.info(f"Generating pre-race content for {race.get('name')} in {lang}")
     
     race_name = race.get("name", "Unknown Race")
     track = race.get("meta_json", {}).get("track", "Unknown Track") if isinstance(race.get("meta_json"), dict) else "Unknown Track"
     
-    news_summary = "\n".join([f"- {n.get('title', '')}" for n in news_context[:5]])
+    news_summary = build_context(news_snippets(news_context, race), settings.llm_context_token_budget)
     
     if lang == "ru":
         prompt = f"""Создай краткое превью гонки F1 для Gen Z аудитории. Будь нативным, используй эмодзи, но не переборщи.
@@ -55,28 +174,28 @@ Requirements:
 
 Response (text only, no additional explanations):"""
     
-    try:
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {"role": "system", "content": "You are a Gen Z F1 content creator. Be concise, engaging, and authentic."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        logger.error(f"Error generating pre-race content: {e}")
-        return "Ошибка генерации контента" if lang == "ru" else "Content generation error"
+    return _complete(
+        [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": localize_prompt(prompt, lang)}
+        ],
+        temperature=0.7,
+        max_tokens=500,
+        content_type="pre_race",
+        race_id=race.get("race_id"),
+        lang=lang,
+    )
 
 
 def generate_post_race(race: Dict, news_context: List[Dict], lang: str) -> str:
-    """Generate post-race content (5-7 bullets)."""
+    """Generate post-race content (5-7 bullets).
+
+    Raises LLMUnavailableError if the provider could not produce a completion.
+    """
     logger.info(f"Generating post-race content for {race.get('name')} in {lang}")
     
     race_name = race.get("name", "Unknown Race")
-    news_summary = "\n".join([f"- {n.get('title', '')}" for n in news_context[:5]])
+    news_summary = build_context(news_snippets(news_context, race), settings.llm_context_token_budget)
     
     if lang == "ru":
         prompt = f"""Создай краткий итог гонки F1 для Gen Z аудитории. Будь нативным, используй эмодзи.
@@ -111,20 +230,39 @@ Requirements:
 
 Response (text only, no additional explanations):"""
     
-    try:
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
-                {"role": "system", "content": "You are a Gen Z F1 content creator. Be concise, engaging, and authentic."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        logger.error(f"Error generating post-race content: {e}")
-        return "Ошибка генерации контента" if lang == "ru" else "Content generation error"
+    return _complete(
+        [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": localize_prompt(prompt, lang)}
+        ],
+        temperature=0.7,
+        max_tokens=500,
+        content_type="post_race",
+        race_id=race.get("race_id"),
+        lang=lang,
+    )
+
+
+# Used when generation fails, and to top up a short pool
+DEFAULT_MEME_EVENTS = {
+    "ru": [
+        {"id": "meme_1", "title": "Пилот обвиняет команду", "type": "meme"},
+        {"id": "meme_2", "title": "Комментатор говорит 'Here we go'", "type": "meme"},
+        {"id": "meme_3", "title": "Пилот делает жест", "type": "meme"},
+        {"id": "meme_4", "title": "Мемный момент в радио", "type": "meme"},
+    ],
+    "en": [
+        {"id": "meme_1", "title": "Driver blames team", "type": "meme"},
+        {"id": "meme_2", "title": "Commentator says 'Here we go'", "type": "meme"},
+        {"id": "meme_3", "title": "Driver makes gesture", "type": "meme"},
+        {"id": "meme_4", "title": "Meme moment on radio", "type": "meme"},
+    ],
+}
+
+
+def default_meme_events(lang: str) -> List[Dict[str, str]]:
+    """Fallback meme events for a language (English for languages without their own)."""
+    return [dict(event) for event in DEFAULT_MEME_EVENTS.get(lang, DEFAULT_MEME_EVENTS["en"])]
 
 
 def generate_bingo_meme_events(race: Dict, context: Dict, lang: str) -> List[Dict]:
@@ -169,17 +307,18 @@ Examples of good events:
 Response (JSON array only, no additional text):"""
     
     try:
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            messages=[
+        import json
+        content = _complete(
+            [
                 {"role": "system", "content": "You are a Gen Z F1 content creator. Return only valid JSON."},
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": localize_prompt(prompt, lang)}
             ],
             temperature=0.8,
             max_tokens=300,
+            content_type="bingo_memes",
+            race_id=race.get("race_id"),
+            lang=lang,
         )
-        import json
-        content = response.choices[0].message.content.strip()
         # Try to extract JSON from response
         if content.startswith("```"):
             content = content.split("```")[1]
@@ -190,17 +329,4 @@ Response (JSON array only, no additional text):"""
     except Exception as e:
         logger.error(f"Error generating bingo meme events: {e}")
         # Return default meme events
-        if lang == "ru":
-            return [
-                {"id": "meme_1", "title": "Пилот обвиняет команду", "type": "meme"},
-                {"id": "meme_2", "title": "Комментатор говорит 'Here we go'", "type": "meme"},
-                {"id": "meme_3", "title": "Пилот делает жест", "type": "meme"},
-                {"id": "meme_4", "title": "Мемный момент в радио", "type": "meme"},
-            ]
-        else:
-            return [
-                {"id": "meme_1", "title": "Driver blames team", "type": "meme"},
-                {"id": "meme_2", "title": "Commentator says 'Here we go'", "type": "meme"},
-                {"id": "meme_3", "title": "Driver makes gesture", "type": "meme"},
-                {"id": "meme_4", "title": "Meme moment on radio", "type": "meme"},
-            ]
+        return default_meme_events(lang)
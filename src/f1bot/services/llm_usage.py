@@ -0,0 +1,126 @@
+"""LLM usage and latency accounting.
+
+Completions are recorded into an in-memory queue and written to the
+``llm_calls`` table in batches by a background thread, so the generation
+path never waits on the database.
+"""
+
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+from f1bot.storage.repositories import LlmCallRepo
+
+logger = get_logger(__name__)
+
+
+class UsageRecorder:
+    """Buffers LLM call records and flushes them to the database in batches."""
+
+    def __init__(self, batch_size: int = 50, flush_interval: float = 5.0, max_queue: int = 10000) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        *,
+        content_type: str,
+        model: str,
+        latency_ms: int,
+        outcome: str,
+        race_id: Optional[str] = None,
+        lang: Optional[str] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached_tokens: int = 0,
+        attempts: int = 1,
+    ) -> None:
+        """Queue one completion record (never blocks, drops on overflow)."""
+        row = {
+            "race_id": race_id,
+            "content_type": content_type,
+            "lang": lang,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_hit": 1 if cached_tokens > 0 else 0,
+            "latency_ms": latency_ms,
+            "attempts": attempts,
+            "outcome": outcome,
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("LLM usage queue is full, dropping record")
+            return
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="llm-usage", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+
+    def _drain(self, block: bool) -> List[Dict[str, Any]]:
+        """Collect up to batch_size rows, waiting at most flush_interval for the first one."""
+        batch: List[Dict[str, Any]] = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            LlmCallRepo().insert_many(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} LLM usage records: {e}")
+
+    def flush(self) -> None:
+        """Write everything queued so far (synchronously)."""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def stop(self) -> None:
+        """Stop the background writer and flush remaining records."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 1)
+            self._thread = None
+        self.flush()
+
+
+def estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate USD cost from token counts using configured prices."""
+    return (
+        prompt_tokens * settings.llm_prompt_cost_per_1m
+        + completion_tokens * settings.llm_completion_cost_per_1m
+    ) / 1_000_000
+
+
+# Global recorder instance
+recorder = UsageRecorder(flush_interval=settings.llm_usage_flush_seconds)
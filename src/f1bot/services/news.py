@@ -1,60 +1,254 @@
 """F1 news service."""
 
+import asyncio
+import hashlib
+import itertools
 import json
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import httpx
 
 from f1bot.config import settings
 from f1bot.logging import get_logger
+from f1bot.services.feed_parser import FeedParser, parse_feed
+from f1bot.services.http_cache import http_cache
+from f1bot.services.news_index import news_index
+from f1bot.services.news_sources import select_sources, stats_for
+from f1bot.storage.repositories import NewsRepo, to_utc_str
 
 logger = get_logger(__name__)
 
+# Query parameters that don't identify an article
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "cmpid", "ito"}
+
+_client: Optional[httpx.AsyncClient] = None
+_CHUNK_SIZE = 64 * 1024
+
+
+def fetch_sources() -> List[str]:
+    """Configured news sources, healthiest first, capped at news_max_sources (plus one probe of the rest)."""
+    sources = [s.strip() for s in settings.news_sources.split(",") if s.strip()]
+    return select_sources(sources, settings.news_max_sources)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Pooled async client shared by all news fetches."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.news_source_timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the pooled client (on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def fetch_news(limit: int = 10) -> List[Dict[str, str]]:
-    """Fetch F1 news from sources."""
+    """Most recent ingested news (filled by the news_ingest job)."""
+    return NewsRepo().get_recent(limit)
+
+
+def fetch_race_news(race: Dict, limit: int = 10) -> List[Dict[str, str]]:
+    """Return the ingested items most relevant to the race.
+
+    Falls back to the most recent items when nothing in the index matches.
+    """
+    warm_news_index()
+    relevant = news_index.search_for_race(race, k=limit)
+    if relevant:
+        return relevant
+    return fetch_news(limit)
+
+
+def warm_news_index() -> None:
+    """Fill the in-memory index from the table after a restart (oldest first)."""
+    if not len(news_index):
+        news_index.add(reversed(NewsRepo().get_recent(news_index.max_docs)))
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a news URL for deduplication."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES) and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme, host, path, urlencode(query), ""))
+
+
+def url_hash(item: Dict[str, str]) -> str:
+    """Dedupe key of a news item: hash of its normalised URL (or title if it has none)."""
+    url = item.get("url") or ""
+    key = normalize_url(url) if url else "title:" + " ".join((item.get("title") or "").lower().split())
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def normalize_published(value: str, default: datetime) -> str:
+    """Parse ISO 8601 / RFC 822 dates into sortable naive-UTC strings."""
+    parsed = None
+    if value:
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(value.strip())
+            except (TypeError, ValueError, IndexError):
+                parsed = None
+    return to_utc_str(parsed or default)
+
+
+def to_news_rows(items: List[Dict[str, str]], fetched_at: datetime) -> List[Dict[str, str]]:
+    """Normalise parsed items into news_items rows, dropping ones without a title."""
+    rows = []
+    for item in items:
+        title = (item.get("title") or "").strip()
+        if not title:
+            continue
+        rows.append({
+            "url_hash": url_hash(item),
+            "url": (item.get("url") or "").strip(),
+            "title": title,
+            "summary": (item.get("summary") or "").strip(),
+            "source": item.get("source") or "",
+            "published_at": normalize_published(item.get("published_at") or "", fetched_at),
+        })
+    return rows
+
+
+async def fetch_from_sources(limit: int = 10) -> List[Dict[str, str]]:
+    """Fetch F1 news from all sources concurrently under one overall deadline.
+
+    Sources that miss the deadline are cancelled; items from the ones that
+    answered in time are still returned.
+    """
     if not settings.news_sources:
         logger.debug("No news sources configured")
         return []
     
-    sources = [s.strip() for s in settings.news_sources.split(",") if s.strip()]
+    sources = fetch_sources()
     if not sources:
         return []
     
-    all_news = []
+    tasks = {asyncio.ensure_future(_fetch_from_source(url, limit)): url for url in sources}
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.news_deadline_seconds
+    pending = set(tasks)
+    # Wait until every healthy source has answered or the deadline passes
+    while pending and any(not stats_for(tasks[t]).degraded for t in pending):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        _, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+    done = set(tasks) - pending
     
-    for source_url in sources[:5]:  # Limit to 5 sources
-        try:
-            news_items = _fetch_from_source(source_url, limit)
-            all_news.extend(news_items)
-        except Exception as e:
-            logger.error(f"Error fetching news from {source_url}: {e}")
-            continue
+    for task in pending:
+        task.cancel()
+        url = tasks[task]
+        stats_for(url).record(False, settings.news_deadline_seconds, timed_out=True, error="deadline exceeded")
+        logger.warning(f"News source {url} did not answer in time, skipped")
+    
+    all_news = []
+    # Healthier sources first, so ties in published_at favour them
+    for task in sorted(done, key=lambda t: sources.index(tasks[t])):
+        all_news.extend(task.result())
     
     # Sort by published_at if available, limit results
     all_news.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-    return all_news[:limit]
+    return all_news
 
 
-def _fetch_from_source(url: str, limit: int) -> List[Dict[str, str]]:
-    """Fetch news from a single source."""
+async def _fetch_from_source(url: str, limit: int) -> List[Dict[str, str]]:
+    """Fetch news from a single source, recording its latency and outcome.
+
+    Bodies are streamed: XML feeds are parsed chunk by chunk while the body is
+    written to the HTTP cache file, and cached bodies are parsed from disk.
+    """
+    stats = stats_for(url)
+    started_at = time.monotonic()
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            
-            # Try to parse as JSON first
-            try:
-                data = response.json()
-                return _parse_json_news(data, limit)
-            except (json.JSONDecodeError, ValueError):
-                # Try to parse as RSS/XML (basic parsing)
-                return _parse_rss_news(response.text, limit)
+        meta = http_cache.load_meta(url)
+        if meta and http_cache.is_fresh(meta):
+            return _parse_cached(url, limit)
+        
+        async with _get_client().stream("GET", url, headers=http_cache.conditional_headers(meta)) as response:
+            if response.status_code == 304 and meta:
+                http_cache.touch(url, meta, response)
+                items = _parse_cached(url, limit)
+            else:
+                response.raise_for_status()
+                items = await _parse_stream(url, response, limit)
+        stats.record(True, time.monotonic() - started_at)
+        return items
+    except httpx.TimeoutException as e:
+        stats.record(False, time.monotonic() - started_at, timed_out=True, error=f"timeout: {e}")
+        logger.error(f"Timeout fetching from {url}")
+        return []
     except Exception as e:
+        stats.record(False, time.monotonic() - started_at, error=str(e))
         logger.error(f"Error fetching from {url}: {e}")
         return []
 
 
+async def _parse_stream(url: str, response: httpx.Response, limit: int) -> List[Dict[str, str]]:
+    """Parse a streamed body while writing it to the cache.
+
+    JSON needs the whole document; XML feeds stop parsing once ``limit`` items
+    are collected, but the rest is still written so the cached copy stays valid
+    for conditional requests.
+    """
+    tmp_path = http_cache.temp_body_path(url)
+    parser: Optional[FeedParser] = None
+    json_chunks: Optional[List[bytes]] = None
+    try:
+        with open(tmp_path, "wb") as body_file:
+            async for chunk in response.aiter_bytes():
+                body_file.write(chunk)
+                if parser is None and json_chunks is None:
+                    head = chunk.lstrip()
+                    if not head:
+                        continue
+                    if head[:1] in (b"{", b"["):
+                        json_chunks = []
+                    else:
+                        parser = FeedParser(limit)
+                if json_chunks is not None:
+                    json_chunks.append(chunk)
+                elif not parser.done:
+                    parser.feed(chunk)
+        http_cache.commit_body(url, response, tmp_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    
+    if json_chunks is not None:
+        return _parse_json_news(json.loads(b"".join(json_chunks)), limit)
+    return parser.close() if parser else []
+
+
+def _parse_cached(url: str, limit: int) -> List[Dict[str, str]]:
+    """Parse a cached body from disk (XML feeds are read in chunks)."""
+    with open(http_cache.body_path(url), "rb") as body_file:
+        head = body_file.read(_CHUNK_SIZE)
+        if head.lstrip()[:1] in (b"{", b"["):
+            return _parse_json_news(json.loads(head + body_file.read()), limit)
+        return parse_feed(itertools.chain([head], iter(lambda: body_file.read(_CHUNK_SIZE), b"")), limit)
+
+
 def _parse_json_news(data: dict, limit: int) -> List[Dict[str, str]]:
     """Parse JSON news format."""
     news_items = []
@@ -74,6 +268,7 @@ def _parse_json_news(data: dict, limit: int) -> List[Dict[str, str]]:
         if isinstance(item, dict):
             news_items.append({
                 "title": item.get("title", item.get("headline", "")),
+                "summary": item.get("summary", item.get("description", item.get("excerpt", ""))),
                 "source": item.get("source", item.get("site", "")),
                 "published_at": item.get("published_at", item.get("date", item.get("time", ""))),
                 "url": item.get("url", item.get("link", "")),
@@ -81,28 +276,3 @@ def _parse_json_news(data: dict, limit: int) -> List[Dict[str, str]]:
     
     return news_items
 
-
-def _parse_rss_news(xml_content: str, limit: int) -> List[Dict[str, str]]:
-    """Basic RSS/XML parsing."""
-    news_items = []
-    
-    # Very basic RSS parsing (for MVP)
-    # In production, use feedparser library
-    try:
-        import re
-        # Extract title tags
-        titles = re.findall(r'<title>(.*?)</title>', xml_content, re.DOTALL)
-        links = re.findall(r'<link>(.*?)</link>', xml_content, re.DOTALL)
-        
-        for i, title in enumerate(titles[:limit]):
-            if i < len(links):
-                news_items.append({
-                    "title": re.sub(r'<[^>]+>', '', title).strip(),
-                    "source": "RSS Feed",
-                    "published_at": "",
-                    "url": links[i].strip(),
-                })
-    except Exception as e:
-        logger.error(f"Error parsing RSS: {e}")
-    
-    return news_items
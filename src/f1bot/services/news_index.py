@@ -0,0 +1,186 @@
+"""In-memory TF-IDF retrieval index over news titles and summaries."""
+
+import math
+import re
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+STOPWORDS = {
+    # en
+    "the", "and", "for", "with", "from", "that", "this", "are", "was", "will", "has", "have",
+    "his", "her", "its", "after", "over", "into", "about", "grand", "prix", "race", "formula",
+    # ru
+    "и", "в", "на", "с", "по", "за", "из", "не", "что", "как", "это", "для", "от", "до", "гран", "при",
+}
+
+TITLE_WEIGHT = 2.0
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords and one-letter noise."""
+    return [w for w in _WORD_RE.findall(text.lower()) if len(w) > 1 and w not in STOPWORDS]
+
+
+def race_query(race: Dict) -> str:
+    """Query text for a race: name, track, location, country and drivers if known."""
+    meta = race.get("meta_json") if isinstance(race.get("meta_json"), dict) else {}
+    parts = [race.get("name", "")]
+    for key in ("track", "location", "country"):
+        if meta.get(key):
+            parts.append(str(meta[key]))
+    drivers = meta.get("drivers") or []
+    if isinstance(drivers, list):
+        parts.extend(str(d) for d in drivers)
+    return " ".join(parts)
+
+
+class NewsIndex:
+    """Incremental TF-IDF index.
+
+    Postings are kept in flat NumPy arrays (doc, term, weight) that only grow
+    on ``add`` (``remove`` and eviction rebuild from the kept documents);
+    document frequencies are updated in place and IDF is computed
+    at query time, so adding items never rebuilds the index. Scores are
+    accumulated with ``np.bincount`` and the top-k picked with ``argpartition``.
+    """
+
+    def __init__(self, max_docs: int = 5000) -> None:
+        self.max_docs = max_docs
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.vocab: Dict[str, int] = {}
+        self.docs: List[Dict] = []
+        self._keys: set = set()
+        self._df = np.zeros(1024, dtype=np.int32)
+        self._post_doc = np.zeros(4096, dtype=np.int32)
+        self._post_term = np.zeros(4096, dtype=np.int32)
+        self._post_weight = np.zeros(4096, dtype=np.float32)
+        self._doc_len = np.zeros(256, dtype=np.float32)
+        self._n_post = 0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @staticmethod
+    def _key(item: Dict) -> str:
+        return (item.get("url") or item.get("title") or "").strip().lower()
+
+    @staticmethod
+    def _grow(array: np.ndarray, needed: int) -> np.ndarray:
+        if needed <= len(array):
+            return array
+        size = len(array)
+        while size < needed:
+            size *= 2
+        grown = np.zeros(size, dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def add(self, items: Iterable[Dict]) -> int:
+        """Index items not seen before; returns the number of new documents."""
+        with self._lock:
+            added = 0
+            for item in items:
+                key = self._key(item)
+                if not key or key in self._keys:
+                    continue
+                if len(self.docs) >= self.max_docs:
+                    self._evict_oldest()
+                self._add_one(item, key)
+                added += 1
+            return added
+
+    def _add_one(self, item: Dict, key: str) -> None:
+        weights: Dict[int, float] = {}
+        for field, field_weight in (("title", TITLE_WEIGHT), ("summary", 1.0)):
+            for token in tokenize(item.get(field) or ""):
+                term_id = self.vocab.setdefault(token, len(self.vocab))
+                weights[term_id] = weights.get(term_id, 0.0) + field_weight
+
+        doc_id = len(self.docs)
+        self.docs.append(item)
+        self._keys.add(key)
+        self._doc_len = self._grow(self._doc_len, doc_id + 1)
+        self._doc_len[doc_id] = math.sqrt(max(1.0, sum(weights.values())))
+        if not weights:
+            return
+
+        term_ids = np.fromiter(weights.keys(), dtype=np.int32, count=len(weights))
+        tf = np.fromiter(weights.values(), dtype=np.float32, count=len(weights))
+        start, end = self._n_post, self._n_post + len(term_ids)
+        self._post_doc = self._grow(self._post_doc, end)
+        self._post_term = self._grow(self._post_term, end)
+        self._post_weight = self._grow(self._post_weight, end)
+        self._post_doc[start:end] = doc_id
+        self._post_term[start:end] = term_ids
+        self._post_weight[start:end] = 1.0 + np.log(tf)
+        self._n_post = end
+
+        self._df = self._grow(self._df, len(self.vocab))
+        self._df[term_ids] += 1
+
+    def remove(self, url_hashes: Iterable[str]) -> int:
+        """Drop documents by url_hash (e.g. pruned from news_items); returns the number removed."""
+        url_hashes = set(url_hashes)
+        if not url_hashes:
+            return 0
+        with self._lock:
+            keep = [item for item in self.docs if item.get("url_hash") not in url_hashes]
+            removed = len(self.docs) - len(keep)
+            if removed:
+                self._reset()
+                for item in keep:
+                    self._add_one(item, self._key(item))
+            return removed
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest half of the documents (amortised, happens rarely)."""
+        keep = self.docs[len(self.docs) // 2:]
+        logger.info(f"News index full, evicting {len(self.docs) - len(keep)} oldest items")
+        self._reset()
+        for item in keep:
+            self._add_one(item, self._key(item))
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[Dict, float]]:
+        """Return up to k (item, score) pairs ranked by TF-IDF relevance to query."""
+        with self._lock:
+            n_docs = len(self.docs)
+            term_ids = sorted({self.vocab[t] for t in tokenize(query) if t in self.vocab})
+            if not n_docs or not term_ids:
+                return []
+
+            query_terms = np.asarray(term_ids, dtype=np.int32)
+            idf = np.log((n_docs + 1) / (self._df[query_terms] + 1)).astype(np.float32) + 1.0
+            idf_lookup = np.zeros(len(self.vocab), dtype=np.float32)
+            idf_lookup[query_terms] = idf
+
+            post_term = self._post_term[: self._n_post]
+            hit = idf_lookup[post_term] > 0
+            scores = np.bincount(
+                self._post_doc[: self._n_post][hit],
+                weights=self._post_weight[: self._n_post][hit] * idf_lookup[post_term[hit]],
+                minlength=n_docs,
+            ) / self._doc_len[:n_docs]
+
+            k = min(k, n_docs)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(self.docs[i], float(scores[i])) for i in top if scores[i] > 0]
+
+    def search_for_race(self, race: Dict, k: int = 10) -> List[Dict]:
+        """Top-k news items relevant to a race."""
+        return [item for item, _ in self.search(race_query(race), k)]
+
+
+# Global index instance (fed by services.news)
+news_index = NewsIndex()
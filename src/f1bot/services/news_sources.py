@@ -0,0 +1,112 @@
+"""Per-source health tracking for news feeds.
+
+Every fetch records its outcome and latency. Sources are ranked by expected
+cost (smoothed latency divided by the success rate over roughly the last
+SUCCESS_WINDOW fetches), so chronically slow or
+failing feeds drop to the end of the list and fall outside the per-run
+source limit, while new or healthy feeds are always tried first. Each run
+also probes one of the excluded sources (round-robin), so a feed that
+recovers from an outage gets fresh samples and can rank back in. Degraded
+feeds that are still fetched only contribute if they answer before the
+healthy ones have finished.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+# Weight of the newest latency sample in the moving average
+LATENCY_ALPHA = 0.3
+# Attempts needed before a source's success rate is trusted
+MIN_ATTEMPTS = 3
+# Outcomes the success rate reflects: older ones fade out, so an old outage is forgotten
+SUCCESS_WINDOW = 20
+# Sources below this success rate are not waited for once healthy ones are done
+DEGRADED_SUCCESS_RATE = 0.5
+
+
+@dataclass
+class SourceStats:
+    """Fetch outcomes and smoothed latency (seconds) of one source."""
+
+    attempts: int = 0
+    successes: float = 0.0
+    timeouts: int = 0
+    latency: float = 0.0
+    last_error: str = ""
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 1.0
+
+    @property
+    def degraded(self) -> bool:
+        return self.attempts >= MIN_ATTEMPTS and self.success_rate < DEGRADED_SUCCESS_RATE
+
+    @property
+    def score(self) -> float:
+        """Expected cost of fetching this source; lower is better."""
+        if self.attempts < MIN_ATTEMPTS:
+            return 0.0
+        return self.latency / max(self.success_rate, 0.05)
+
+    def record(self, ok: bool, latency: float, timed_out: bool = False, error: str = "") -> None:
+        if self.attempts >= SUCCESS_WINDOW:
+            # Keep the rate, shrink the history to make room for the new outcome
+            self.successes *= (SUCCESS_WINDOW - 1) / self.attempts
+            self.attempts = SUCCESS_WINDOW - 1
+        self.attempts += 1
+        if ok:
+            self.successes += 1
+        if timed_out:
+            self.timeouts += 1
+        if error:
+            self.last_error = error
+        if self.attempts == 1:
+            self.latency = latency
+        else:
+            self.latency = LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * self.latency
+
+
+source_stats: Dict[str, SourceStats] = {}
+# Round-robin position among the sources left out of a run
+_probe_turn = 0
+
+
+def stats_for(url: str) -> SourceStats:
+    stats = source_stats.get(url)
+    if stats is None:
+        stats = source_stats[url] = SourceStats()
+    return stats
+
+
+def rank_sources(urls: List[str]) -> List[str]:
+    """Order sources from cheapest to most expensive (stable for ties)."""
+    return sorted(urls, key=lambda url: stats_for(url).score)
+
+
+def select_sources(urls: List[str], limit: int) -> List[str]:
+    """The ``limit`` cheapest sources plus one probe of the excluded ones, rotating per call."""
+    global _probe_turn
+    ranked = rank_sources(urls)
+    selected, excluded = ranked[:limit], ranked[limit:]
+    if excluded:
+        selected.append(excluded[_probe_turn % len(excluded)])
+        _probe_turn += 1
+    return selected
+
+
+def format_source_stats() -> str:
+    """Render per-source health for admins."""
+    if not source_stats:
+        return "📰 News sources\n\n(no fetches yet)"
+    lines = ["📰 News sources\n"]
+    for url in rank_sources(list(source_stats)):
+        s = source_stats[url]
+        line = (
+            f"{url}: {s.successes:.0f}/{s.attempts} ok ({s.success_rate:.0%}), "
+            f"{s.timeouts} timed out, latency ~{s.latency * 1000:.0f} ms"
+        )
+        if s.last_error:
+            line += f", last error: {s.last_error[:80]}"
+        lines.append(line)
+    return "\n".join(lines)
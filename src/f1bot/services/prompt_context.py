@@ -0,0 +1,123 @@
+"""Token-budgeted prompt context builder."""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+# Rough BPE-like segmentation: words, numbers and single punctuation/emoji symbols
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d+|[^\w\s]", re.UNICODE)
+_CYRILLIC_RE = re.compile(r"[Ѐ-ӿ]")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Base weights per snippet kind (higher = more valuable per token)
+KIND_WEIGHTS: Dict[str, float] = {
+    "standings": 3.0,
+    "title": 2.0,
+    "summary": 1.0,
+}
+
+
+def count_tokens(text: str) -> int:
+    """Estimate the number of model tokens in text without a tokenizer.
+
+    Latin words average ~4 characters per token, Cyrillic ~2.5, numbers ~3,
+    and each punctuation mark or emoji counts as one token. Estimates err on
+    the high side so that budgets are not exceeded.
+    """
+    tokens = 0
+    for piece in _TOKEN_RE.findall(text):
+        if piece.isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        elif piece.isalpha():
+            chars_per_token = 2.5 if _CYRILLIC_RE.search(piece) else 4.0
+            tokens += math.ceil(len(piece) / chars_per_token)
+        else:
+            tokens += 1
+    return tokens
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text on a word boundary so that it fits into max_tokens."""
+    if count_tokens(text) <= max_tokens:
+        return text
+    words = text.split()
+    lo, hi = 0, len(words)
+    # Binary search for the longest prefix that fits (leaving room for the ellipsis)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(" ".join(words[:mid])) <= max_tokens - 1:
+            lo = mid
+        else:
+            hi = mid - 1
+    return " ".join(words[:lo]) + "…" if lo else ""
+
+
+@dataclass
+class ContextSnippet:
+    """A candidate piece of prompt context."""
+
+    text: str
+    kind: str  # title, summary, standings
+    score: float = 0.0
+
+
+def _terms(text: str) -> set:
+    return {w.lower() for w in _WORD_RE.findall(text) if len(w) > 2}
+
+
+def race_terms(race: Dict) -> set:
+    """Terms describing a race (name, track, location), used for relevance scoring."""
+    meta = race.get("meta_json") if isinstance(race.get("meta_json"), dict) else {}
+    parts = [race.get("name", "")] + [str(meta.get(k, "")) for k in ("track", "location", "country")]
+    return _terms(" ".join(parts))
+
+
+def news_snippets(news_items: List[Dict], race: Optional[Dict] = None) -> List[ContextSnippet]:
+    """Turn news items (newest first) into scored title and summary snippets."""
+    wanted = race_terms(race) if race else set()
+    snippets = []
+    for rank, item in enumerate(news_items):
+        # Newer items first: 1.0, 0.83, 0.71, ...
+        recency = 1.0 / (1.0 + 0.2 * rank)
+        title = (item.get("title") or "").strip()
+        summary = (item.get("summary") or "").strip()
+        relevance = 1.0
+        if wanted:
+            relevance += len(wanted & _terms(f"{title} {summary}")) / len(wanted)
+        if title:
+            snippets.append(ContextSnippet(title, "title", KIND_WEIGHTS["title"] * recency * relevance))
+        if summary and summary != title:
+            snippets.append(ContextSnippet(summary, "summary", KIND_WEIGHTS["summary"] * recency * relevance))
+    return snippets
+
+
+def build_context(
+    snippets: Iterable[ContextSnippet],
+    budget: int,
+    max_snippet_tokens: int = 80,
+) -> str:
+    """Fill a bullet list with the best-ranked snippets until the token budget is used.
+
+    Snippets are taken in score order; long ones are truncated to max_snippet_tokens,
+    duplicates are skipped, and snippets that no longer fit are passed over in favour
+    of shorter lower-ranked ones.
+    """
+    lines: List[str] = []
+    seen = set()
+    used = 0
+    for snippet in sorted(snippets, key=lambda s: s.score, reverse=True):
+        key = " ".join(snippet.text.lower().split())
+        if not key or key in seen:
+            continue
+        body = truncate_to_tokens(snippet.text, max_snippet_tokens)
+        if not body:
+            continue
+        line = "- " + body
+        cost = count_tokens(line) + 1  # + newline
+        if used + cost > budget:
+            continue
+        seen.add(key)
+        lines.append(line)
+        used += cost
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+"""Race lifecycle: upcoming -> in_progress -> finished.
+
+Transitions are applied with set-based updates over the races table (every
+race whose moment has passed moves in one statement), either at scheduled
+times or when a results source reports a race as finished. Each transition
+triggers its downstream work: bingo closure and post-race generation.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from apscheduler.triggers.date import DateTrigger
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+from f1bot.storage.repositories import RaceRepo, BingoRepo
+
+logger = get_logger(__name__)
+
+
+def advance_statuses(now: Optional[datetime] = None) -> Dict[str, List[str]]:
+    """Move every race whose start/finish moment has passed; returns transitioned race ids."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    race_repo = RaceRepo()
+    started = race_repo.transition_status("upcoming", "in_progress", started_before=now)
+    finished = race_repo.transition_status(
+        "in_progress", "finished",
+        started_before=now - timedelta(hours=settings.race_duration_hours),
+    )
+
+    for race_id in started:
+        on_race_started(race_id)
+    for race_id in finished:
+        on_race_finished(race_id)
+
+    if started or finished:
+        logger.info(f"Race lifecycle: started={started} finished={finished}")
+    return {"in_progress": started, "finished": finished}
+
+
+def finish_races(race_ids: Iterable[str]) -> List[str]:
+    """Mark races finished from a results source (or an admin); returns the ones that changed."""
+    finished = RaceRepo().finish(list(race_ids))
+    for race_id in finished:
+        on_race_finished(race_id)
+    return finished
+
+
+def on_race_started(race_id: str) -> None:
+    """Downstream work when a race goes live."""
+    logger.info(f"Race {race_id} is in progress")
+
+
+def on_race_finished(race_id: str) -> None:
+    """Downstream work when a race is over: close bingo, schedule post-race generation."""
+    from f1bot.jobs.scheduler import scheduler
+
+    from f1bot.jobs.publish import race_start_time
+
+    closed = BingoRepo().close_race(race_id)
+    logger.info(f"Race {race_id} finished, closed {closed} bingo cards")
+
+    # A recap is only worth generating right after the race, not for a backfilled old one
+    now = datetime.now(timezone.utc)
+    race = RaceRepo().get_by_id(race_id)
+    finished_at = race_start_time(race) + timedelta(hours=settings.race_duration_hours) if race else None
+    if finished_at is None or now - finished_at > timedelta(hours=settings.post_race_max_age_hours):
+        logger.info(f"Race {race_id} finished too long ago, no post-race recap")
+        return
+
+    # Give news sources some time to publish results before generating the recap
+    run_at = now + timedelta(minutes=settings.post_race_news_delay_minutes)
+    scheduler.add_job(
+        "f1bot.jobs.post_race:post_race_job",
+        DateTrigger(run_date=run_at),
+        args=[race_id],
+        id=f"race:{race_id}:post_race",
+        replace_existing=True,
+    )
+
@@ -0,0 +1,93 @@
+"""In-memory race timeline.
+
+A sorted snapshot of the season, rebuilt from the races table after every
+calendar sync. "Next race", "last race" and "current weekend" lookups are
+bisections over the start times, with no network or database access.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+# A race weekend spans from two days before the start to one day after it
+WEEKEND_BEFORE = timedelta(days=2)
+WEEKEND_AFTER = timedelta(days=1)
+
+
+def _start_of(race: Dict[str, Any]) -> datetime:
+    """Race start as an aware UTC datetime (DB rows store naive-UTC strings)."""
+    start_time = race["start_time_utc"]
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time.astimezone(timezone.utc)
+
+
+class RaceTimeline:
+    """Immutable sorted view of races with O(log n) time lookups."""
+
+    def __init__(self, races: List[Dict[str, Any]]) -> None:
+        races = [dict(race, start_time_utc=_start_of(race)) for race in races]
+        races.sort(key=lambda race: race["start_time_utc"])
+        self.races = races
+        self._starts = [race["start_time_utc"] for race in races]
+
+    def __len__(self) -> int:
+        return len(self.races)
+
+    def next_race(self, now: datetime) -> Optional[Dict[str, Any]]:
+        """First race starting after now."""
+        index = bisect_right(self._starts, now)
+        return self.races[index] if index < len(self.races) else None
+
+    def last_race(self, now: datetime) -> Optional[Dict[str, Any]]:
+        """Most recent race that started at or before now."""
+        index = bisect_right(self._starts, now)
+        return self.races[index - 1] if index else None
+
+    def current_weekend(self, now: datetime) -> Optional[Dict[str, Any]]:
+        """Race whose weekend window contains now (the one just started wins over the next)."""
+        last = self.last_race(now)
+        if last and now - last["start_time_utc"] <= WEEKEND_AFTER:
+            return last
+        upcoming = self.next_race(now)
+        if upcoming and upcoming["start_time_utc"] - now < WEEKEND_BEFORE:
+            return upcoming
+        return None
+
+
+class TimelineHolder:
+    """Holds the current timeline; rebuilt wholesale and swapped atomically."""
+
+    def __init__(self) -> None:
+        self._timeline: Optional[RaceTimeline] = None
+        self._lock = threading.Lock()
+
+    def rebuild(self, races: List[Dict[str, Any]]) -> RaceTimeline:
+        timeline = RaceTimeline(races)
+        self._timeline = timeline
+        logger.debug(f"Race timeline rebuilt with {len(timeline)} races")
+        return timeline
+
+    def reload(self) -> RaceTimeline:
+        """Rebuild from the races table (after a calendar sync)."""
+        from f1bot.storage.repositories import RaceRepo
+        return self.rebuild(RaceRepo().get_all())
+
+    def get(self) -> RaceTimeline:
+        """Current timeline, loaded from the database on first use."""
+        timeline = self._timeline
+        if timeline is None:
+            with self._lock:
+                timeline = self._timeline or self.reload()
+        return timeline
+
+
+# Global timeline instance
+race_timeline = TimelineHolder()
@@ -0,0 +1,175 @@
+"""Resilience primitives for calls to unreliable upstream providers."""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+from f1bot.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Shared pool for hedged attempts (a hedge needs a second thread while the first one blocks)
+_hedge_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hedge")
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker rejects a call without trying it."""
+
+
+class DeadlineExceededError(Exception):
+    """Raised when the overall deadline runs out before a call succeeds."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current breaker state: closed, open or half_open."""
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may go through now."""
+        with self._lock:
+            state = self._state_locked()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probe_in_flight:
+                # Let exactly one probe through; others keep failing fast
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit breaker closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let another probe through after one ended without a verdict (non-retryable error)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the breaker past the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"Circuit breaker opened after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter for the given attempt (0-based)."""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_resilient(
+    fn: Callable[[float], T],
+    *,
+    deadline: float,
+    attempt_timeout: float,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    breaker: Optional[CircuitBreaker] = None,
+    hedge_after: Optional[float] = None,
+) -> T:
+    """Call ``fn(timeout)`` with a deadline, bounded jittered retries, a breaker and optional hedging.
+
+    ``fn`` receives the time budget (seconds) for a single attempt and must honour it.
+    Exceptions not listed in ``retry_on`` propagate immediately and do not trip the breaker.
+    """
+    expires_at = time.monotonic() + deadline
+    last_error: Optional[BaseException] = None
+
+    for attempt in range(max_attempts):
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            break
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError("Upstream circuit is open, failing fast")
+
+        timeout = min(attempt_timeout, remaining)
+        try:
+            if hedge_after and hedge_after < timeout:
+                result = _call_hedged(fn, timeout, hedge_after)
+            else:
+                result = fn(timeout)
+        except retry_on as e:
+            last_error = e
+            if breaker is not None:
+                breaker.record_failure()
+            logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed: {type(e).__name__}: {e}")
+            if attempt + 1 < max_attempts:
+                delay = backoff_delay(attempt, base_delay, max_delay)
+                time.sleep(max(0.0, min(delay, expires_at - time.monotonic())))
+            continue
+        except BaseException:
+            # Not a provider failure, but a half-open probe must not stay in flight forever
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    if last_error is None:
+        raise DeadlineExceededError(f"Deadline of {deadline:.1f}s exceeded")
+    raise last_error
+
+
+def _call_hedged(fn: Callable[[float], T], timeout: float, hedge_after: float) -> T:
+    """Start ``fn``, and start a second copy if the first is still running after ``hedge_after``."""
+    started = time.monotonic()
+    primary = _hedge_pool.submit(fn, timeout)
+    done, _ = wait([primary], timeout=hedge_after)
+    if done:
+        return primary.result()
+
+    logger.info(f"Primary attempt slower than {hedge_after:.1f}s, sending hedged request")
+    hedge = _hedge_pool.submit(fn, max(0.0, timeout - hedge_after))
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    while pending:
+        left = timeout - (time.monotonic() - started)
+        done, pending = wait(pending, timeout=max(0.0, left), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            error = future.exception()
+            if error is None:
+                return future.result()
+    if error is not None:
+        raise error
+    # Both copies ignored their timeout; the losers keep running in the pool until they give up
+    raise TimeoutError(f"Hedged call did not finish within {timeout:.1f}s")
+
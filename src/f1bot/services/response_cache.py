@@ -0,0 +1,109 @@
+"""Read-through cache of rendered menu responses.
+
+Right after a broadcast most users open the same pre-/post-race screen.
+Rendered responses (text plus keyboard) are cached per (race_id,
+content_type, lang) and dropped whenever that content changes: every
+ContentRepo write (through CONTENT_CHANGE_HOOKS) and the admin cancel path
+invalidate their key. A render that races with an invalidation is returned
+but not stored, so a stale screen can't outlive the write. Which race
+a menu points at (next upcoming / last finished) is cached for a short TTL,
+since race status changes come from several places (sync, lifecycle, admin).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from f1bot.config import settings
+from f1bot.logging import get_logger
+from f1bot.storage.repositories import CONTENT_CHANGE_HOOKS
+
+logger = get_logger(__name__)
+
+ResponseKey = Tuple[Optional[str], str, str]  # (race_id, content_type, lang)
+
+
+class ResponseCache:
+    """Bounded LRU of rendered responses plus TTL'd race pointers per content type."""
+
+    def __init__(self, max_entries: int, race_ttl: float) -> None:
+        self.max_entries = max_entries
+        self.race_ttl = race_ttl
+        self._responses: "OrderedDict[ResponseKey, Any]" = OrderedDict()
+        self._races: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+        # Renders in progress; invalidate() drops matching tokens so their results aren't stored
+        self._inflight: Dict[ResponseKey, object] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def race(self, content_type: str, loader: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """The race a content menu shows, loaded at most once per TTL."""
+        now = time.monotonic()
+        cached = self._races.get(content_type)
+        if cached and cached[1] > now:
+            return cached[0]
+        race = loader()
+        self._races[content_type] = (race, now + self.race_ttl)
+        return race
+
+    def get(self, key: ResponseKey, render: Callable[[], Any]) -> Any:
+        """Cached response for the key, rendered on a miss."""
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+                self.stats["hits"] += 1
+                return response
+            self.stats["misses"] += 1
+            token = self._inflight[key] = object()
+
+        try:
+            response = render()
+        except BaseException:
+            with self._lock:
+                if self._inflight.get(key) is token:
+                    del self._inflight[key]
+            raise
+        with self._lock:
+            if self._inflight.get(key) is token:
+                del self._inflight[key]
+                self._responses[key] = response
+                if len(self._responses) > self.max_entries:
+                    self._responses.popitem(last=False)
+        return response
+
+    def invalidate(self, race_id: str, content_type: str, lang: Optional[str] = None) -> None:
+        """Drop a race's rendered content (all languages if lang is None) and re-resolve the menu's race."""
+        with self._lock:
+            def matches(key: ResponseKey) -> bool:
+                return key[1] == content_type and key[0] in (race_id, None) and (lang is None or key[2] == lang)
+
+            stale = [key for key in self._responses if matches(key)]
+            for key in stale:
+                del self._responses[key]
+            for key in [key for key in self._inflight if matches(key)]:
+                del self._inflight[key]
+            self._races.pop(content_type, None)
+            self.stats["invalidations"] += 1
+        logger.debug(f"Response cache: dropped {len(stale)} entries for {race_id}/{content_type}/{lang or '*'}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._races.clear()
+            self._inflight.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+# Global cache instance
+response_cache = ResponseCache(settings.response_cache_max_entries, settings.response_cache_race_ttl_seconds)
+CONTENT_CHANGE_HOOKS.append(response_cache.invalidate)
+
+
+def format_cache_stats() -> str:
+    """Render response cache counters for admins."""
+    stats = ", ".join(f"{k} {v}" for k, v in response_cache.stats.items())
+    return f"🗂 Menu response cache ({len(response_cache)}/{response_cache.max_entries}): {stats}"
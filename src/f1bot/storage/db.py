@@ -6,6 +6,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 
 from f1bot.config import settings
+from f1bot.domain.bingo import CHECKED_POINTS, VERIFIED_POINTS
 from f1bot.logging import get_logger
 
 logger = get_logger(__name__)
@@ -89,11 +90,136 @@ def init_db() -> None:
             )
         """))
         
+        # Append-only bingo taps (new status of one cell); folded into bingo_user_state
+        # snapshots by the compactor, which records the last folded id per user
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS bingo_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                race_id TEXT NOT NULL,
+                telegram_id INTEGER NOT NULL,
+                cell_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_bingo_events_user ON bingo_events (race_id, telegram_id, id)"
+        ))
+        
+        # Bingo cells confirmed by an admin (verified for everyone who ticked them)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS bingo_verified_cells (
+                race_id TEXT NOT NULL,
+                cell_id TEXT NOT NULL,
+                verified_by INTEGER,
+                verified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (race_id, cell_id)
+            )
+        """))
+        
+        # Per-race bingo scores, maintained incrementally on toggles and verifications
+        scores_exist = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bingo_scores'")
+        ).fetchone()
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS bingo_scores (
+                race_id TEXT NOT NULL,
+                telegram_id INTEGER NOT NULL,
+                display_name TEXT NOT NULL DEFAULT '',
+                score INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (race_id, telegram_id)
+            )
+        """))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_bingo_scores_rank ON bingo_scores (race_id, score DESC, updated_at)"
+        ))
+        # Win detection state (checked_mask is indexed by event pool position; lines are
+        # detected on the toggle path from the card layout)
+        _add_column_if_missing(conn, "bingo_scores", "checked_mask", "INTEGER NOT NULL DEFAULT 0")
+        _add_column_if_missing(conn, "bingo_scores", "first_line_at", "TIMESTAMP")
+        _add_column_if_missing(conn, "bingo_scores", "full_card_at", "TIMESTAMP")
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_bingo_scores_first_line ON bingo_scores (race_id, first_line_at)"
+        ))
+        if not scores_exist:
+            # One-off backfill from existing card states
+            conn.execute(
+                text("""
+                    INSERT OR IGNORE INTO bingo_scores (race_id, telegram_id, score)
+                    SELECT race_id, telegram_id, (
+                        SELECT COALESCE(SUM(CASE value WHEN 'verified' THEN :verified WHEN 'checked' THEN :checked ELSE 0 END), 0)
+                        FROM json_each(states_json)
+                    )
+                    FROM bingo_user_state
+                """),
+                {"verified": VERIFIED_POINTS, "checked": CHECKED_POINTS}
+            )
+        
+        # LLM call accounting (written in batches by services.llm_usage)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                race_id TEXT,
+                content_type TEXT NOT NULL,
+                lang TEXT,
+                model TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                cached_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_hit INTEGER NOT NULL DEFAULT 0,
+                latency_ms INTEGER NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 1,
+                outcome TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_llm_calls_race ON llm_calls (race_id)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_llm_calls_created ON llm_calls (created_at)"))
+        
+        # Ingested news, deduplicated by normalised URL hash (written by jobs.news_ingest)
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS news_items (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                summary TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL DEFAULT '',
+                published_at TIMESTAMP NOT NULL,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_news_items_published ON news_items (published_at)"))
+        
+        # Bingo closure (set when the race finishes)
+        _add_column_if_missing(conn, "bingo_cards", "closed_at", "TIMESTAMP")
+        
+        # Last card message per user, for pushing refreshed cards
+        _add_column_if_missing(conn, "bingo_user_state", "chat_id", "INTEGER")
+        _add_column_if_missing(conn, "bingo_user_state", "message_id", "INTEGER")
+        # Seed of the user's card layout (0 = unshuffled pool)
+        _add_column_if_missing(conn, "bingo_user_state", "card_seed", "INTEGER NOT NULL DEFAULT 0")
+        # Last bingo_events id folded into the snapshot (the max is the compactor's watermark)
+        _add_column_if_missing(conn, "bingo_user_state", "last_event_id", "INTEGER NOT NULL DEFAULT 0")
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_bingo_user_state_last_event ON bingo_user_state (last_event_id)"
+        ))
+        
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_races_status_start ON races (status, start_time_utc)"))
+        
         conn.commit()
     
     logger.info("Database initialized successfully")
 
 
+def _add_column_if_missing(conn, table: str, column: str, ddl: str) -> None:
+    """Add a column to an existing table (CREATE TABLE IF NOT EXISTS won't)."""
+    columns = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})")).fetchall()}
+    if column not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+        logger.info(f"Added column {table}.{column}")
+
+
 def get_db() -> Session:
     """Get database session."""
     return SessionLocal()
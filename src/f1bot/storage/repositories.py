@@ -1,15 +1,46 @@
 """Data repositories."""
 
 import json
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from sqlalchemy import text
+import threading
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Any, List, Tuple
+from sqlalchemy import text, bindparam
 
+from f1bot.domain.bingo import CHECKED_POINTS, VERIFIED_POINTS, fold_events
 from f1bot.storage.db import get_db
 from f1bot.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Events folded per compaction step
+BINGO_FOLD_BATCH = 5000
+
+# Folding reads snapshots before writing them, and pysqlite only begins the
+# transaction at the first write, so every fold (and anything that must not
+# interleave with one, like verify_cell) runs under this lock until commit
+_fold_lock = threading.Lock()
+
+
+def to_utc_str(value: Any) -> Any:
+    """Normalise a datetime to a sortable naive-UTC string (naive input is assumed UTC)."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+@lru_cache(maxsize=64)
+def _parse_cells(cells_json: str) -> Tuple[Dict[str, Any], ...]:
+    """Parsed bingo pool, memoised by its JSON (templates are read on every tap but rarely change)."""
+    return tuple(json.loads(cells_json))
+
+
+def _json_key_path(key: str) -> str:
+    """SQLite JSON path for a top-level object key (quoted, so ids with dots work)."""
+    return f'$."{key}"'
+
 
 class UserRepo:
     """User repository."""
@@ -34,6 +65,22 @@ class UserRepo:
         finally:
             db.close()
 
+    def get_langs(self, telegram_ids: List[int]) -> Dict[int, str]:
+        """Languages of many users in one query."""
+        if not telegram_ids:
+            return {}
+        db = get_db()
+        try:
+            results = db.execute(
+                text("SELECT telegram_id, lang FROM users WHERE telegram_id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": telegram_ids}
+            ).fetchall()
+            return {row[0]: row[1] for row in results}
+        finally:
+            db.close()
+
     def create_or_update(self, telegram_id: int, lang: Optional[str] = None) -> None:
         """Create or update user."""
         db = get_db()
@@ -63,6 +110,7 @@ class RaceRepo:
         db = get_db()
         try:
             meta_str = json.dumps(meta_json) if meta_json else None
+            start_time_utc = to_utc_str(start_time_utc)
             db.execute(
                 text("""
                     INSERT OR REPLACE INTO races (race_id, name, start_time_utc, status, meta_json)
@@ -80,6 +128,95 @@ class RaceRepo:
         finally:
             db.close()
 
+    def get_by_id(self, race_id: str) -> Optional[Dict[str, Any]]:
+        """Get race by ID."""
+        db = get_db()
+        try:
+            result = db.execute(
+                text("SELECT * FROM races WHERE race_id = :id"),
+                {"id": race_id}
+            ).fetchone()
+            
+            if result:
+                return {
+                    "race_id": result[0],
+                    "name": result[1],
+                    "start_time_utc": result[2],
+                    "status": result[3],
+                    "meta_json": json.loads(result[4]) if result[4] else None,
+                }
+            return None
+        finally:
+            db.close()
+
+    def sync_season(self, races: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Bulk-upsert a full calendar in one transaction and report what changed.
+
+        New races are inserted with the status the calendar gives them (races
+        already over come in as finished); existing statuses are kept. Upcoming
+        races that are no longer in the calendar are deleted (cancelled).
+        Returns race IDs per change kind.
+        """
+        db = get_db()
+        try:
+            existing = {
+                row[0]: (row[1], str(row[2]), row[3], row[4])
+                for row in db.execute(
+                    text("SELECT race_id, name, start_time_utc, status, meta_json FROM races")
+                ).fetchall()
+            }
+            
+            rows = []
+            report: Dict[str, List[str]] = {"added": [], "changed": [], "removed": []}
+            for race in races:
+                row = {
+                    "id": race["race_id"],
+                    "name": race["name"],
+                    "start_time": to_utc_str(race["start_time_utc"]),
+                    "status": race.get("status", "upcoming"),
+                    "meta": json.dumps(race["meta_json"]) if race.get("meta_json") else None,
+                }
+                current = existing.get(row["id"])
+                if current is None:
+                    report["added"].append(row["id"])
+                elif (current[0], current[1], current[3]) != (row["name"], row["start_time"], row["meta"]):
+                    report["changed"].append(row["id"])
+                else:
+                    continue
+                rows.append(row)
+            
+            if rows:
+                db.execute(
+                    text("""
+                        INSERT INTO races (race_id, name, start_time_utc, status, meta_json)
+                        VALUES (:id, :name, :start_time, :status, :meta)
+                        ON CONFLICT(race_id) DO UPDATE SET
+                            name = excluded.name,
+                            start_time_utc = excluded.start_time_utc,
+                            meta_json = excluded.meta_json
+                    """),
+                    rows
+                )
+            
+            seen = {race["race_id"] for race in races}
+            removed = [
+                race_id for race_id, current in existing.items()
+                if race_id not in seen and current[2] == "upcoming"
+            ]
+            if races and removed:
+                db.execute(
+                    text("DELETE FROM races WHERE race_id IN :ids AND status = 'upcoming'").bindparams(
+                        bindparam("ids", expanding=True)
+                    ),
+                    {"ids": removed}
+                )
+                report["removed"] = removed
+            
+            db.commit()
+            return report
+        finally:
+            db.close()
+
     def get_next_race(self) -> Optional[Dict[str, Any]]:
         """Get next upcoming race."""
         db = get_db()
@@ -100,6 +237,119 @@ class RaceRepo:
         finally:
             db.close()
 
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Get every race, ordered by start time."""
+        db = get_db()
+        try:
+            results = db.execute(text("SELECT * FROM races ORDER BY start_time_utc")).fetchall()
+            return [
+                {
+                    "race_id": result[0],
+                    "name": result[1],
+                    "start_time_utc": result[2],
+                    "status": result[3],
+                    "meta_json": json.loads(result[4]) if result[4] else None,
+                }
+                for result in results
+            ]
+        finally:
+            db.close()
+
+    def get_races_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """Get races starting at or after the given moment, ordered by start time."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("SELECT * FROM races WHERE start_time_utc >= :since ORDER BY start_time_utc"),
+                {"since": to_utc_str(since)}
+            ).fetchall()
+            
+            return [
+                {
+                    "race_id": result[0],
+                    "name": result[1],
+                    "start_time_utc": result[2],
+                    "status": result[3],
+                    "meta_json": json.loads(result[4]) if result[4] else None,
+                }
+                for result in results
+            ]
+        finally:
+            db.close()
+
+    def get_current_race(self) -> Optional[Dict[str, Any]]:
+        """Get the race in progress, or the next upcoming one."""
+        db = get_db()
+        try:
+            result = db.execute(
+                text("""
+                    SELECT * FROM races
+                    WHERE status IN ('in_progress', 'upcoming')
+                    ORDER BY CASE status WHEN 'in_progress' THEN 0 ELSE 1 END, start_time_utc
+                    LIMIT 1
+                """)
+            ).fetchone()
+            
+            if result:
+                return {
+                    "race_id": result[0],
+                    "name": result[1],
+                    "start_time_utc": result[2],
+                    "status": result[3],
+                    "meta_json": json.loads(result[4]) if result[4] else None,
+                }
+            return None
+        finally:
+            db.close()
+
+    def transition_status(self, from_status: str, to_status: str, started_before: datetime) -> List[str]:
+        """Move all races in from_status that started before the moment; returns their IDs."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    UPDATE races SET status = :to_status
+                    WHERE status = :from_status AND start_time_utc <= :before
+                    RETURNING race_id
+                """),
+                {"from_status": from_status, "to_status": to_status, "before": to_utc_str(started_before)}
+            ).fetchall()
+            db.commit()
+            return [row[0] for row in results]
+        finally:
+            db.close()
+
+    def finish(self, race_ids: List[str]) -> List[str]:
+        """Mark started races finished (from a results source); returns IDs that actually changed."""
+        if not race_ids:
+            return []
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    UPDATE races SET status = 'finished'
+                    WHERE race_id IN :ids AND status != 'finished' AND start_time_utc <= :now
+                    RETURNING race_id
+                """).bindparams(bindparam("ids", expanding=True)),
+                {"ids": race_ids, "now": to_utc_str(datetime.now(timezone.utc))}
+            ).fetchall()
+            db.commit()
+            return [row[0] for row in results]
+        finally:
+            db.close()
+
+    def set_status(self, race_id: str, status: str) -> None:
+        """Set race status."""
+        db = get_db()
+        try:
+            db.execute(
+                text("UPDATE races SET status = :status WHERE race_id = :id"),
+                {"id": race_id, "status": status}
+            )
+            db.commit()
+        finally:
+            db.close()
+
     def get_last_race(self) -> Optional[Dict[str, Any]]:
         """Get last finished race."""
         db = get_db()
@@ -121,12 +371,22 @@ class RaceRepo:
             db.close()
 
 
+# Called as hook(race_id, content_type, lang) after every committed content write;
+# caches of rendered content register here (storage doesn't depend on them)
+CONTENT_CHANGE_HOOKS: List[Callable[[str, str, str], None]] = []
+
+
+def _content_changed(race_id: str, content_type: str, lang: str) -> None:
+    for hook in CONTENT_CHANGE_HOOKS:
+        hook(race_id, content_type, lang)
+
+
 class ContentRepo:
-    """Content repository."""
+    """Content repository (writes notify CONTENT_CHANGE_HOOKS)."""
 
-    def save_draft(self, race_id: str, content_type: str, lang: str, text: str) -> None:
+    def save_draft(self, race_id: str, content_type: str, lang: str, body: str) -> None:
         """Save draft content."""
-        self._upsert(race_id, content_type, lang, "draft", text)
+        self._upsert(race_id, content_type, lang, "draft", body)
 
     def mark_pending(self, race_id: str, content_type: str, lang: str) -> None:
         """Mark content as pending admin approval."""
@@ -137,6 +397,7 @@ class ContentRepo:
                 {"race_id": race_id, "type": content_type, "lang": lang}
             )
             db.commit()
+            _content_changed(race_id, content_type, lang)
         finally:
             db.close()
 
@@ -149,6 +410,7 @@ class ContentRepo:
                 {"race_id": race_id, "type": content_type, "lang": lang}
             )
             db.commit()
+            _content_changed(race_id, content_type, lang)
         finally:
             db.close()
 
@@ -161,6 +423,7 @@ class ContentRepo:
                 {"race_id": race_id, "type": content_type, "lang": lang}
             )
             db.commit()
+            _content_changed(race_id, content_type, lang)
         finally:
             db.close()
 
@@ -188,7 +451,7 @@ class ContentRepo:
         finally:
             db.close()
 
-    def _upsert(self, race_id: str, content_type: str, lang: str, status: str, text: str) -> None:
+    def _upsert(self, race_id: str, content_type: str, lang: str, status: str, body: str) -> None:
         """Internal upsert method."""
         db = get_db()
         try:
@@ -202,10 +465,11 @@ class ContentRepo:
                     "type": content_type,
                     "lang": lang,
                     "status": status,
-                    "text": text,
+                    "text": body,
                 }
             )
             db.commit()
+            _content_changed(race_id, content_type, lang)
         finally:
             db.close()
 
@@ -244,33 +508,611 @@ class BingoRepo:
         finally:
             db.close()
 
-    def upsert_user_state(self, race_id: str, telegram_id: int, states: Dict[str, str]) -> None:
-        """Upsert user's bingo state."""
+    def close_race(self, race_id: str) -> int:
+        """Close bingo for a race; later state writes for it are ignored."""
+        db = get_db()
+        try:
+            result = db.execute(
+                text("UPDATE bingo_cards SET closed_at = CURRENT_TIMESTAMP WHERE race_id = :race_id AND closed_at IS NULL"),
+                {"race_id": race_id}
+            )
+            db.commit()
+            return result.rowcount
+        finally:
+            db.close()
+
+    def record_toggle(
+        self,
+        race_id: str,
+        telegram_id: int,
+        cell_id: str,
+        status: str,
+        score: int,
+        display_name: Optional[str] = None,
+        checked_mask: int = 0,
+        has_line: bool = False,
+        full_card: bool = False,
+        card_seed: Optional[int] = None,
+        chat_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+    ) -> None:
+        """Append a tap to bingo_events and update the score (no-op once the race's bingo is closed).
+
+        The state snapshot is not rewritten here; the compactor folds events
+        into it. card_seed is given for a player without a snapshot yet, whose
+        (empty) snapshot is created with it and the card message. first_line_at/full_card_at are set
+        on the first write that reports a line/full card and kept afterwards,
+        for first-to-bingo rankings.
+        """
         db = get_db()
         try:
-            states_str = json.dumps(states)
+            params = {
+                "race_id": race_id,
+                "user_id": telegram_id,
+                "cell_id": cell_id,
+                "status": status,
+                "score": score,
+                "name": display_name,
+                "mask": checked_mask,
+                "has_line": has_line,
+                "full_card": full_card,
+                "seed": card_seed,
+                "chat_id": chat_id,
+                "message_id": message_id,
+            }
+            if card_seed is not None:
+                db.execute(
+                    text("""
+                        INSERT OR IGNORE INTO bingo_user_state (race_id, telegram_id, states_json, card_seed, chat_id, message_id)
+                        VALUES (:race_id, :user_id, '{}', :seed, :chat_id, :message_id)
+                    """),
+                    params
+                )
             db.execute(
                 text("""
-                    INSERT OR REPLACE INTO bingo_user_state (race_id, telegram_id, states_json, updated_at)
-                    VALUES (:race_id, :user_id, :states, CURRENT_TIMESTAMP)
+                    INSERT INTO bingo_events (race_id, telegram_id, cell_id, status)
+                    SELECT :race_id, :user_id, :cell_id, :status
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM bingo_cards WHERE race_id = :race_id AND closed_at IS NOT NULL
+                    )
                 """),
-                {"race_id": race_id, "user_id": telegram_id, "states": states_str}
+                params
+            )
+            db.execute(
+                text("""
+                    INSERT INTO bingo_scores (
+                        race_id, telegram_id, display_name, score, checked_mask,
+                        first_line_at, full_card_at, updated_at
+                    )
+                    SELECT :race_id, :user_id, COALESCE(:name, ''), :score, :mask,
+                           CASE WHEN :has_line THEN CURRENT_TIMESTAMP END,
+                           CASE WHEN :full_card THEN CURRENT_TIMESTAMP END,
+                           CURRENT_TIMESTAMP
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM bingo_cards WHERE race_id = :race_id AND closed_at IS NOT NULL
+                    )
+                    ON CONFLICT (race_id, telegram_id) DO UPDATE SET
+                        score = excluded.score,
+                        display_name = COALESCE(:name, display_name),
+                        checked_mask = excluded.checked_mask,
+                        first_line_at = COALESCE(bingo_scores.first_line_at, excluded.first_line_at),
+                        full_card_at = COALESCE(bingo_scores.full_card_at, excluded.full_card_at),
+                        updated_at = excluded.updated_at
+                """),
+                params
             )
             db.commit()
         finally:
             db.close()
 
-    def get_user_state(self, race_id: str, telegram_id: int) -> Optional[Dict[str, str]]:
-        """Get user's bingo state."""
+    def compact_events(self, batch_size: int = BINGO_FOLD_BATCH) -> int:
+        """Fold pending bingo_events into the state snapshots; returns the number of events folded."""
+        db = get_db()
+        try:
+            with _fold_lock:
+                folded = self._fold_pending(db, batch_size)
+                db.commit()
+            return folded
+        finally:
+            db.close()
+
+    def _fold_pending(self, db, batch_size: int) -> int:
+        """Fold the next batch of events after the watermark (the highest folded id) in id order.
+
+        Callers hold _fold_lock until they commit.
+        """
+        watermark = db.execute(text("SELECT COALESCE(MAX(last_event_id), 0) FROM bingo_user_state")).scalar()
+        events = db.execute(
+            text("""
+                SELECT id, race_id, telegram_id, cell_id, status, created_at
+                FROM bingo_events
+                WHERE id > :watermark
+                ORDER BY id
+                LIMIT :limit
+            """),
+            {"watermark": watermark, "limit": batch_size}
+        ).fetchall()
+        if not events:
+            return 0
+        
+        by_user: Dict[Tuple[str, int], List[Any]] = {}
+        for event in events:
+            by_user.setdefault((event[1], event[2]), []).append(event)
+        
+        states: Dict[Tuple[str, int], Dict[str, str]] = {}
+        for race_id in {key[0] for key in by_user}:
+            rows = db.execute(
+                text("""
+                    SELECT telegram_id, states_json FROM bingo_user_state
+                    WHERE race_id = :race_id AND telegram_id IN :ids
+                """).bindparams(bindparam("ids", expanding=True)),
+                {"race_id": race_id, "ids": [user_id for key_race, user_id in by_user if key_race == race_id]}
+            ).fetchall()
+            for row in rows:
+                states[(race_id, row[0])] = json.loads(row[1])
+        
+        snapshots = []
+        for (race_id, user_id), user_events in by_user.items():
+            folded = fold_events(states.get((race_id, user_id), {}), ((e[3], e[4]) for e in user_events))
+            snapshots.append({
+                "race_id": race_id,
+                "user_id": user_id,
+                "states": json.dumps(folded),
+                "last_event_id": user_events[-1][0],
+                "updated_at": user_events[-1][5],
+            })
+        db.execute(
+            text("""
+                INSERT INTO bingo_user_state (race_id, telegram_id, states_json, last_event_id, updated_at)
+                VALUES (:race_id, :user_id, :states, :last_event_id, :updated_at)
+                ON CONFLICT (race_id, telegram_id) DO UPDATE SET
+                    states_json = excluded.states_json,
+                    last_event_id = excluded.last_event_id,
+                    updated_at = excluded.updated_at
+                WHERE COALESCE(bingo_user_state.last_event_id, 0) < excluded.last_event_id
+            """),
+            snapshots
+        )
+        return len(events)
+
+    def replay_user_state(self, race_id: str, telegram_id: int, at: datetime) -> Dict[str, str]:
+        """A player's card state as of a moment, rebuilt from the event log.
+
+        Cells verified by then show as verified. Ticks made before the event
+        log existed are only in the snapshot and are not replayed.
+        """
+        db = get_db()
+        try:
+            params = {"race_id": race_id, "user_id": telegram_id, "at": to_utc_str(at)}
+            events = db.execute(
+                text("""
+                    SELECT cell_id, status FROM bingo_events
+                    WHERE race_id = :race_id AND telegram_id = :user_id AND created_at <= :at
+                    ORDER BY id
+                """),
+                params
+            ).fetchall()
+            verified = db.execute(
+                text("SELECT cell_id FROM bingo_verified_cells WHERE race_id = :race_id AND verified_at <= :at"),
+                params
+            ).fetchall()
+        finally:
+            db.close()
+        
+        states = fold_events({}, ((row[0], row[1]) for row in events))
+        for (cell_id,) in verified:
+            if states.get(cell_id) == "checked":
+                states[cell_id] = "verified"
+        return states
+
+    def set_card_message(
+        self, race_id: str, telegram_id: int, chat_id: int, message_id: int, card_seed: int = 0
+    ) -> None:
+        """Remember the message showing the user's card (creates an empty state with the seed if needed)."""
+        db = get_db()
+        try:
+            db.execute(
+                text("""
+                    INSERT INTO bingo_user_state (race_id, telegram_id, states_json, chat_id, message_id, card_seed)
+                    VALUES (:race_id, :user_id, '{}', :chat_id, :message_id, :seed)
+                    ON CONFLICT (race_id, telegram_id) DO UPDATE SET
+                        chat_id = excluded.chat_id,
+                        message_id = excluded.message_id,
+                        updated_at = CURRENT_TIMESTAMP
+                """),
+                {"race_id": race_id, "user_id": telegram_id, "chat_id": chat_id, "message_id": message_id, "seed": card_seed}
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def verify_cell(self, race_id: str, cell_id: str, verified_by: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Verify a cell for every user who ticked it with set-based statements.
+
+        Returns the affected users' new states and card messages. updated_at
+        is left alone, so it still reflects the user's own last activity.
+        Pending events are folded first, so the snapshots include every tick.
+        """
+        db = get_db()
+        try:
+            # Held through commit: a concurrent compaction must not write back pre-verify states
+            with _fold_lock:
+                while self._fold_pending(db, BINGO_FOLD_BATCH):
+                    pass
+                db.execute(
+                    text("""
+                        INSERT OR IGNORE INTO bingo_verified_cells (race_id, cell_id, verified_by)
+                        VALUES (:race_id, :cell_id, :verified_by)
+                    """),
+                    {"race_id": race_id, "cell_id": cell_id, "verified_by": verified_by}
+                )
+                # Scores first: the same set of players, before their states change
+                db.execute(
+                    text("""
+                        UPDATE bingo_scores
+                        SET score = score + :delta, updated_at = CURRENT_TIMESTAMP
+                        WHERE race_id = :race_id AND telegram_id IN (
+                            SELECT telegram_id FROM bingo_user_state
+                            WHERE race_id = :race_id AND json_extract(states_json, :path) = 'checked'
+                        )
+                    """),
+                    {"race_id": race_id, "path": _json_key_path(cell_id), "delta": VERIFIED_POINTS - CHECKED_POINTS}
+                )
+                results = db.execute(
+                    text("""
+                        UPDATE bingo_user_state
+                        SET states_json = json_set(states_json, :path, 'verified')
+                        WHERE race_id = :race_id AND json_extract(states_json, :path) = 'checked'
+                        RETURNING telegram_id, states_json, chat_id, message_id, updated_at, card_seed
+                    """),
+                    {"race_id": race_id, "path": _json_key_path(cell_id)}
+                ).fetchall()
+                db.commit()
+            return [
+                {
+                    "telegram_id": row[0],
+                    "states": json.loads(row[1]),
+                    "chat_id": row[2],
+                    "message_id": row[3],
+                    "updated_at": row[4],
+                    "card_seed": row[5],
+                }
+                for row in results
+            ]
+        finally:
+            db.close()
+
+    def get_leaderboard(self, race_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top scores for a race (served by idx_bingo_scores_rank)."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    SELECT telegram_id, display_name, score
+                    FROM bingo_scores
+                    WHERE race_id = :race_id
+                    ORDER BY score DESC, updated_at
+                    LIMIT :limit
+                """),
+                {"race_id": race_id, "limit": limit}
+            ).fetchall()
+            return [{"telegram_id": row[0], "display_name": row[1], "score": row[2]} for row in results]
+        finally:
+            db.close()
+
+    def get_first_bingos(self, race_id: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """Players who completed a line first (served by idx_bingo_scores_first_line)."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    SELECT telegram_id, display_name, first_line_at, full_card_at
+                    FROM bingo_scores
+                    WHERE race_id = :race_id AND first_line_at IS NOT NULL
+                    ORDER BY first_line_at
+                    LIMIT :limit
+                """),
+                {"race_id": race_id, "limit": limit}
+            ).fetchall()
+            return [
+                {"telegram_id": row[0], "display_name": row[1], "first_line_at": row[2], "full_card_at": row[3]}
+                for row in results
+            ]
+        finally:
+            db.close()
+
+    def get_checked_masks(self, race_id: str, lang: str) -> List[Tuple[int, Optional[int]]]:
+        """(checked_mask, first_line_at as unix seconds) for a race's players of one language pool, for analytics.
+
+        Masks are indexed by position in the player's language pool, so players
+        are grouped by language the same way their cards are (missing users count as 'ru').
+        """
+        db = get_db()
+        try:
+            return db.execute(
+                text("""
+                    SELECT s.checked_mask, CAST(strftime('%s', s.first_line_at) AS INTEGER)
+                    FROM bingo_scores s
+                    LEFT JOIN users u ON u.telegram_id = s.telegram_id
+                    WHERE s.race_id = :race_id AND COALESCE(u.lang, 'ru') = :lang
+                """),
+                {"race_id": race_id, "lang": lang}
+            ).fetchall()
+        finally:
+            db.close()
+
+    def get_rank(self, race_id: str, telegram_id: int) -> Optional[Dict[str, int]]:
+        """A player's score, rank (1 + players with a higher score) and the number of players."""
         db = get_db()
         try:
             result = db.execute(
-                text("SELECT states_json FROM bingo_user_state WHERE race_id = :race_id AND telegram_id = :user_id"),
+                text("""
+                    SELECT s.score,
+                           (SELECT COUNT(*) FROM bingo_scores WHERE race_id = :race_id AND score > s.score) + 1,
+                           (SELECT COUNT(*) FROM bingo_scores WHERE race_id = :race_id)
+                    FROM bingo_scores s
+                    WHERE s.race_id = :race_id AND s.telegram_id = :user_id
+                """),
                 {"race_id": race_id, "user_id": telegram_id}
             ).fetchone()
-            
             if result:
-                return json.loads(result[0])
+                return {"score": result[0], "rank": result[1], "total": result[2]}
+            return None
+        finally:
+            db.close()
+
+    def get_verified_cells(self, race_id: str) -> set:
+        """Cell IDs an admin has verified for the race."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("SELECT cell_id FROM bingo_verified_cells WHERE race_id = :race_id"),
+                {"race_id": race_id}
+            ).fetchall()
+            return {row[0] for row in results}
+        finally:
+            db.close()
+
+    def get_tap_context(self, telegram_id: int) -> Optional[Dict[str, Any]]:
+        """Everything a bingo tap needs, in one statement.
+
+        The current race (in progress, or next upcoming), the player's
+        language, that language's event pool, whether the card is closed, the
+        verified cells and the player's state (snapshot plus unfolded events)
+        and card seed. None when there is no current race.
+        """
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    WITH race AS (
+                        SELECT race_id, name FROM races
+                        WHERE status IN ('in_progress', 'upcoming')
+                        ORDER BY CASE status WHEN 'in_progress' THEN 0 ELSE 1 END, start_time_utc
+                        LIMIT 1
+                    ), player AS (
+                        SELECT race_id, name,
+                               COALESCE((SELECT lang FROM users WHERE telegram_id = :user_id), 'ru') AS lang
+                        FROM race
+                    )
+                    SELECT p.race_id, p.name, p.lang, c.cells_json, c.closed_at,
+                           (SELECT json_group_array(cell_id) FROM bingo_verified_cells v WHERE v.race_id = p.race_id),
+                           s.states_json, s.card_seed, e.cell_id, e.status
+                    FROM player p
+                    LEFT JOIN bingo_cards c ON c.race_id = p.race_id AND c.lang = p.lang
+                    LEFT JOIN bingo_user_state s ON s.race_id = p.race_id AND s.telegram_id = :user_id
+                    LEFT JOIN bingo_events e
+                        ON e.race_id = p.race_id AND e.telegram_id = :user_id AND e.id > s.last_event_id
+                    ORDER BY e.id
+                """),
+                {"user_id": telegram_id}
+            ).fetchall()
+        finally:
+            db.close()
+        
+        if not results:
+            return None
+        first = results[0]
+        card = None
+        if first[6] is not None:
+            states = fold_events(json.loads(first[6]), ((row[8], row[9]) for row in results if row[8] is not None))
+            card = {"states": states, "card_seed": first[7]}
+        return {
+            "race": {"race_id": first[0], "name": first[1]},
+            "lang": first[2],
+            "pool": _parse_cells(first[3]) if first[3] else None,
+            "closed": first[4] is not None,
+            "verified": set(json.loads(first[5])),
+            "card": card,
+        }
+
+    def get_user_card(self, race_id: str, telegram_id: int) -> Optional[Dict[str, Any]]:
+        """Get user's bingo state (snapshot plus not yet folded events) and card seed."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    SELECT s.states_json, s.card_seed, e.cell_id, e.status
+                    FROM bingo_user_state s
+                    LEFT JOIN bingo_events e
+                        ON e.race_id = s.race_id AND e.telegram_id = s.telegram_id AND e.id > s.last_event_id
+                    WHERE s.race_id = :race_id AND s.telegram_id = :user_id
+                    ORDER BY e.id
+                """),
+                {"race_id": race_id, "user_id": telegram_id}
+            ).fetchall()
+            
+            if results:
+                states = fold_events(json.loads(results[0][0]), ((row[2], row[3]) for row in results if row[2] is not None))
+                return {"states": states, "card_seed": results[0][1]}
             return None
         finally:
             db.close()
+
+    def get_user_state(self, race_id: str, telegram_id: int) -> Optional[Dict[str, str]]:
+        """Get user's bingo state."""
+        card = self.get_user_card(race_id, telegram_id)
+        return card["states"] if card else None
+
+
+class LlmCallRepo:
+    """LLM call accounting repository."""
+
+    def insert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert a batch of LLM call records in one transaction."""
+        if not rows:
+            return
+        db = get_db()
+        try:
+            db.execute(
+                text("""
+                    INSERT INTO llm_calls (
+                        race_id, content_type, lang, model, prompt_tokens, completion_tokens,
+                        cached_tokens, cache_hit, latency_ms, attempts, outcome, created_at
+                    )
+                    VALUES (
+                        :race_id, :content_type, :lang, :model, :prompt_tokens, :completion_tokens,
+                        :cached_tokens, :cache_hit, :latency_ms, :attempts, :outcome, :created_at
+                    )
+                """),
+                rows
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def summary_by_race(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Aggregate usage per race, most recent races first."""
+        return self._summary("COALESCE(race_id, '-')", "MAX(created_at) DESC", limit)
+
+    def summary_by_day(self, limit: int = 7) -> List[Dict[str, Any]]:
+        """Aggregate usage per calendar day (UTC), most recent first."""
+        return self._summary("DATE(created_at)", "bucket DESC", limit)
+
+    def _summary(self, bucket_expr: str, order_by: str, limit: int) -> List[Dict[str, Any]]:
+        """Internal aggregate query grouped by bucket_expr."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text(f"""
+                    SELECT {bucket_expr} AS bucket,
+                           COUNT(*),
+                           SUM(CASE WHEN outcome = 'ok' THEN 0 ELSE 1 END),
+                           SUM(prompt_tokens),
+                           SUM(completion_tokens),
+                           SUM(cache_hit),
+                           AVG(latency_ms),
+                           MAX(latency_ms)
+                    FROM llm_calls
+                    GROUP BY bucket
+                    ORDER BY {order_by}
+                    LIMIT :limit
+                """),
+                {"limit": limit}
+            ).fetchall()
+            return [
+                {
+                    "bucket": row[0],
+                    "calls": row[1],
+                    "errors": row[2],
+                    "prompt_tokens": row[3] or 0,
+                    "completion_tokens": row[4] or 0,
+                    "cache_hits": row[5] or 0,
+                    "avg_latency_ms": int(row[6] or 0),
+                    "max_latency_ms": row[7] or 0,
+                }
+                for row in results
+            ]
+        finally:
+            db.close()
+
+
+class NewsRepo:
+    """Ingested news repository."""
+
+    def existing_hashes(self, url_hashes: List[str]) -> set:
+        """Return the subset of url_hashes already stored."""
+        if not url_hashes:
+            return set()
+        db = get_db()
+        try:
+            results = db.execute(
+                text("SELECT url_hash FROM news_items WHERE url_hash IN :hashes").bindparams(
+                    bindparam("hashes", expanding=True)
+                ),
+                {"hashes": url_hashes}
+            ).fetchall()
+            return {row[0] for row in results}
+        finally:
+            db.close()
+
+    def insert_new(self, items: List[Dict[str, Any]], batch_size: int = 200) -> List[Dict[str, Any]]:
+        """Insert items whose url_hash is not stored yet, in batches; returns the inserted items."""
+        existing = self.existing_hashes([item["url_hash"] for item in items])
+        new_items = []
+        seen = set(existing)
+        for item in items:
+            if item["url_hash"] not in seen:
+                seen.add(item["url_hash"])
+                new_items.append(item)
+        if not new_items:
+            return []
+
+        db = get_db()
+        try:
+            for start in range(0, len(new_items), batch_size):
+                db.execute(
+                    text("""
+                        INSERT OR IGNORE INTO news_items (url_hash, url, title, summary, source, published_at)
+                        VALUES (:url_hash, :url, :title, :summary, :source, :published_at)
+                    """),
+                    new_items[start:start + batch_size]
+                )
+            db.commit()
+            return new_items
+        finally:
+            db.close()
+
+    def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recently published items."""
+        db = get_db()
+        try:
+            results = db.execute(
+                text("""
+                    SELECT url_hash, url, title, summary, source, published_at
+                    FROM news_items
+                    ORDER BY published_at DESC
+                    LIMIT :limit
+                """),
+                {"limit": limit}
+            ).fetchall()
+            return [
+                {
+                    "url_hash": row[0],
+                    "url": row[1],
+                    "title": row[2],
+                    "summary": row[3],
+                    "source": row[4],
+                    "published_at": row[5],
+                }
+                for row in results
+            ]
+        finally:
+            db.close()
+
+    def prune(self, older_than: datetime) -> List[str]:
+        """Delete items ingested before older_than; returns the deleted url hashes.
+
+        Goes by fetched_at, not published_at, so old articles still listed in a
+        feed aren't deleted and re-inserted on every run.
+        """
+        db = get_db()
+        try:
+            results = db.execute(
+                text("DELETE FROM news_items WHERE fetched_at < :cutoff RETURNING url_hash"),
+                {"cutoff": to_utc_str(older_than)}
+            ).fetchall()
+            db.commit()
+            return [row[0] for row in results]
+        finally:
+            db.close()